@@ -0,0 +1,561 @@
+#!/usr/bin/env python3
+"""
+워커 이벤트 로그 병합 + ERR_NETWORK_CHANGED 상관분석 (오프라인)
+
+입력:
+    /tmp/vpn_events_wgNNN.log      워커별 JSON 이벤트 (common/unified_event_logger.py)
+    /tmp/chrome_network_errors.log CDP 네트워크 에러 텍스트 로그 (common/network_error_monitor.py)
+
+동작:
+- 파일마다 한 줄씩 읽는 스트림을 만들고 heapq로 k-way 병합 (전체 로그를 메모리에 올리지 않음)
+- 한 파일 안에서 약간 뒤섞인 줄은 작은 재정렬 버퍼(REORDER_WINDOW줄)로 정렬
+- 상관분석은 최근 window초의 인터페이스/라우팅/VPN 이벤트와 판정 대기 중인 에러만 유지
+  → 메모리는 로그 크기가 아니라 window 안의 이벤트 수에 비례 (GB 단위 로그도 처리)
+- 회전된 로그(*.gz)도 그대로 읽음
+
+사용법:
+    python3 analyze_vpn_logs.py                                # 전체 로그 병합 (시간순)
+    python3 analyze_vpn_logs.py --correlate                    # ERR_NETWORK_CHANGED 전후 ±5초 상관분석
+    python3 analyze_vpn_logs.py --correlate --window 2 --summary-only
+    python3 analyze_vpn_logs.py --start 22:03:30 --end 22:03:40
+
+결과는 워커 시작 간격(stagger)과 터널 교체 주기 조정에 사용:
+    ERR 직전 다른 워커 이벤트까지의 지연 분포(p50/p95)가 시작 간격의 하한
+"""
+
+import os
+import re
+import sys
+import glob
+import gzip
+import json
+import heapq
+import argparse
+import itertools
+from collections import deque
+from datetime import datetime, date, time as dt_time
+from operator import itemgetter
+from typing import Iterator, Optional, Tuple, List, Dict, Any
+
+
+DEFAULT_EVENT_PATTERN = "/tmp/vpn_events_*.log*"
+DEFAULT_CHROME_LOG = "/tmp/chrome_network_errors.log"
+DEFAULT_WINDOW = 5.0          # 초 (ERR 전후)
+REORDER_WINDOW = 512          # 파일 내부 재정렬 버퍼 (줄)
+MAX_MATCHES_PER_ERROR = 50    # ERR 1건당 보관할 주변 이벤트 수 상한
+DEDUP_SECONDS = 0.05          # 같은 워커의 JSON/텍스트 로그 중복 ERR 판정 간격
+
+ERR_EVENT = "ERR_NETWORK_CHANGED"
+
+# 다른 워커의 Chrome에 네트워크 변경으로 보일 수 있는 이벤트 (netlink 변경 유발)
+TRIGGER_EVENTS = frozenset({
+    "VPN_CONNECTING", "VPN_CONNECTED", "VPN_DISCONNECTING", "VPN_DISCONNECTED",
+    "INTERFACE_ADDED", "INTERFACE_REMOVED",
+    "ROUTING_RULE_ADDED", "ROUTING_RULE_REMOVED",
+    "ROUTE_ADDED", "ROUTE_REMOVED",
+})
+
+# 지연 분포 버킷 (초) - 메모리 고정
+LAG_BUCKETS = (0.05, 0.1, 0.2, 0.3, 0.5, 0.75, 1.0, 1.5, 2.0, 3.0, 5.0, 10.0, 30.0, 60.0)
+
+# [22:03:34.574] [Worker-4] [CRITICAL] 🚨 ERR_NETWORK_CHANGED 감지! (발생 횟수: 1)
+CHROME_LOG_RE = re.compile(r"^\[(\d{2}:\d{2}:\d{2}\.\d{3})\] \[([^\]]+)\] \[(\w+)\] (.*)$")
+
+# 이벤트 튜플: (epoch, 워커, wg 사용자, 이벤트 타입, 인터페이스, 상세, 출처)
+Event = Tuple[float, str, str, str, str, Dict[str, Any], str]
+
+
+def _open_text(path: str):
+    """텍스트 로그 열기 (.gz 자동 처리)"""
+    if path.endswith(".gz"):
+        return gzip.open(path, "rt", encoding="utf-8", errors="replace")
+    return open(path, "r", encoding="utf-8", errors="replace")
+
+
+def _worker_to_wg_user(worker_id: str) -> str:
+    """Worker-N → wg(100+N) (unified_event_logger와 동일 규칙)"""
+    if worker_id.startswith("Worker-"):
+        try:
+            return f"wg{100 + int(worker_id.split('-')[1])}"
+        except (IndexError, ValueError):
+            pass
+    return worker_id
+
+
+def _reorder(events: Iterator[Event], size: int = REORDER_WINDOW) -> Iterator[Event]:
+    """
+    작은 힙으로 약간 뒤섞인 스트림을 시간순으로 정렬
+
+    여러 프로세스가 같은 파일에 O_APPEND로 쓰면 순서가 조금 어긋날 수 있음
+    (size줄 이상 떨어진 역전은 그대로 출력되지만 상관분석 결과에는 영향이 작음)
+    """
+    heap: List[Tuple[float, int, Event]] = []
+    for seq, event in enumerate(events):
+        heapq.heappush(heap, (event[0], seq, event))
+        if len(heap) > size:
+            yield heapq.heappop(heap)[2]
+    while heap:
+        yield heapq.heappop(heap)[2]
+
+
+def read_event_log(path: str) -> Iterator[Event]:
+    """
+    워커 JSON 이벤트 로그 스트림
+
+    Args:
+        path: /tmp/vpn_events_wgNNN.log (또는 .gz)
+
+    Yields:
+        Event 튜플 (파싱 실패 줄은 건너뜀)
+    """
+    try:
+        f = _open_text(path)
+    except OSError as e:
+        print(f"⚠️  {path} 열기 실패: {e}", file=sys.stderr)
+        return
+    with f:
+        for line in f:
+            try:
+                record = json.loads(line)
+                ts = datetime.fromisoformat(record["timestamp"]).timestamp()
+            except (ValueError, KeyError, TypeError):
+                continue
+            yield (
+                ts,
+                str(record.get("worker_id", "?")),
+                str(record.get("wg_user", "?")),
+                str(record.get("event_type", "?")),
+                str(record.get("interface") or "N/A"),
+                record.get("details") or {},
+                os.path.basename(path),
+            )
+
+
+def read_chrome_log(path: str, first_day: Optional[date] = None) -> Iterator[Event]:
+    """
+    CDP 네트워크 에러 텍스트 로그에서 ERR_NETWORK_CHANGED 줄만 추출
+
+    텍스트 로그에는 날짜가 없으므로 첫 줄 날짜(first_day, 없으면 파일 수정 날짜)를 기준으로 하고,
+    시각이 크게 거꾸로 가면(12시간 이상) 다음 날로 넘어간 것으로 간주합니다.
+
+    Args:
+        path: /tmp/chrome_network_errors.log
+        first_day: 첫 줄의 날짜 (merged_events는 가장 이른 JSON 이벤트 날짜를 넘김)
+
+    Yields:
+        Event 튜플
+    """
+    try:
+        mtime = os.path.getmtime(path)
+        f = _open_text(path)
+    except OSError as e:
+        print(f"⚠️  {path} 열기 실패: {e}", file=sys.stderr)
+        return
+
+    day_offset = 0
+    last_seconds = None
+    base = datetime.combine(first_day or date.fromtimestamp(mtime), dt_time()).timestamp()
+
+    with f:
+        for line in f:
+            if ERR_EVENT not in line:
+                continue
+            match = CHROME_LOG_RE.match(line.rstrip("\n"))
+            if not match:
+                continue
+            clock, worker_id, level, message = match.groups()
+            # 세부 줄("   요청 ID: ...")은 제외하고 감지 줄만 사용
+            if "감지" not in message and "콘솔" not in message:
+                continue
+            h, m, s = clock.split(":")
+            seconds = int(h) * 3600 + int(m) * 60 + float(s)
+            if last_seconds is not None and seconds < last_seconds - 43200:
+                day_offset += 86400
+            last_seconds = seconds
+            yield (
+                base + day_offset + seconds,
+                worker_id,
+                _worker_to_wg_user(worker_id),
+                ERR_EVENT,
+                "N/A",
+                {"source": "chrome_log", "message": message.strip()[:200]},
+                os.path.basename(path),
+            )
+
+
+def _peek_first_day(streams: List[Iterator[Event]]) -> Tuple[List[Iterator[Event]], Optional[date]]:
+    """
+    각 스트림의 첫 이벤트로 가장 이른 날짜 확인 (읽은 이벤트는 스트림 앞에 되돌림)
+
+    Returns:
+        (되돌린 스트림 목록, 가장 이른 이벤트 날짜 또는 None)
+    """
+    restored = []
+    earliest = None
+    for stream in streams:
+        first = next(stream, None)
+        if first is None:
+            continue
+        if earliest is None or first[0] < earliest:
+            earliest = first[0]
+        restored.append(itertools.chain((first,), stream))
+    return restored, (date.fromtimestamp(earliest) if earliest is not None else None)
+
+
+def _dedupe_errors(events: Iterator[Event]) -> Iterator[Event]:
+    """
+    JSON 로그와 텍스트 로그에 중복 기록된 같은 ERR 제거 (어느 쪽이 먼저 와도 JSON 이벤트를 남김)
+
+    텍스트 로그는 log_event보다 먼저 기록되고 밀리초로 잘리므로 보통 텍스트 쪽이 먼저 정렬됩니다.
+    ERR는 DEDUP_SECONDS 동안 보류하면서 같은 wg 사용자의 반대쪽 출처 ERR가 오면 한 건만 남기고,
+    보류 중인 이벤트 뒤의 이벤트도 함께 보류해 출력 순서는 유지합니다.
+    """
+    held: deque = deque()  # [event, 삭제 여부]
+    for event in events:
+        while held and event[0] - held[0][0][0] > DEDUP_SECONDS:
+            entry = held.popleft()
+            if not entry[1]:
+                yield entry[0]
+
+        if event[3] == ERR_EVENT:
+            from_text = event[5].get("source") == "chrome_log"
+            duplicate = False
+            for entry in held:
+                other = entry[0]
+                if entry[1] or other[3] != ERR_EVENT or other[2] != event[2]:
+                    continue
+                if (other[5].get("source") == "chrome_log") == from_text:
+                    continue
+                if from_text:
+                    duplicate = True  # JSON 이벤트가 이미 있음 → 텍스트 쪽 버림
+                else:
+                    entry[1] = True   # 먼저 온 텍스트 쪽을 버리고 JSON 이벤트 유지
+                break
+            if duplicate:
+                continue
+
+        if held or event[3] == ERR_EVENT:
+            held.append([event, False])
+        else:
+            yield event
+
+    for entry in held:
+        if not entry[1]:
+            yield entry[0]
+
+
+def merged_events(event_paths: List[str], chrome_log: Optional[str] = None,
+                  chrome_day: Optional[date] = None) -> Iterator[Event]:
+    """
+    모든 로그를 시간순으로 병합 (heapq k-way merge, 파일당 재정렬 버퍼만 메모리에 유지)
+
+    Args:
+        event_paths: 워커 JSON 이벤트 로그 경로
+        chrome_log: CDP 텍스트 로그 경로 (None이면 제외)
+        chrome_day: CDP 텍스트 로그 첫 줄의 날짜 (None이면 가장 이른 JSON 이벤트 날짜)
+
+    Yields:
+        Event 튜플 (시간순)
+    """
+    streams = [_reorder(read_event_log(path)) for path in event_paths]
+    if chrome_log and os.path.exists(chrome_log):
+        streams, first_day = _peek_first_day(streams)
+        streams.append(_reorder(read_chrome_log(chrome_log, chrome_day or first_day)))
+
+    yield from _dedupe_errors(heapq.merge(*streams, key=itemgetter(0)))
+
+
+def _parse_bound(text: Optional[str]):
+    """
+    --start/--end 값 파싱
+
+    Returns:
+        ("abs", epoch) / ("tod", 자정 기준 초) / None
+    """
+    if not text:
+        return None
+    try:
+        return ("abs", datetime.fromisoformat(text).timestamp())
+    except ValueError:
+        pass
+    try:
+        parts = text.split(":")
+        seconds = int(parts[0]) * 3600 + int(parts[1]) * 60 + (float(parts[2]) if len(parts) > 2 else 0)
+        return ("tod", seconds)
+    except (ValueError, IndexError):
+        raise argparse.ArgumentTypeError(f"시각 형식 오류: {text} (HH:MM[:SS] 또는 YYYY-MM-DD HH:MM:SS)")
+
+
+def _in_range(ts: float, start, end) -> bool:
+    """시간 범위 필터"""
+    tod = None
+    for bound, is_start in ((start, True), (end, False)):
+        if bound is None:
+            continue
+        kind, value = bound
+        if kind == "abs":
+            current = ts
+        else:
+            if tod is None:
+                moment = datetime.fromtimestamp(ts)
+                tod = moment.hour * 3600 + moment.minute * 60 + moment.second + moment.microsecond / 1e6
+            current = tod
+        if (is_start and current < value) or (not is_start and current > value):
+            return False
+    return True
+
+
+def _format_ts(ts: float) -> str:
+    """HH:MM:SS.mmm"""
+    return datetime.fromtimestamp(ts).strftime("%H:%M:%S.%f")[:-3]
+
+
+class LagHistogram:
+    """고정 버킷 지연 분포 (이벤트 수와 무관하게 메모리 고정)"""
+
+    def __init__(self, buckets=LAG_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.total = 0
+        self.maximum = 0.0
+
+    def add(self, value: float):
+        for index, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[index] += 1
+                break
+        else:
+            self.counts[-1] += 1
+        self.total += 1
+        self.maximum = max(self.maximum, value)
+
+    def percentile(self, q: float) -> float:
+        """버킷 상한 기준 근사 백분위수"""
+        if not self.total:
+            return 0.0
+        target = q * self.total
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= target:
+                return min(self.buckets[index], self.maximum) if index < len(self.buckets) else self.maximum
+        return self.maximum
+
+
+class CorrelationAnalyzer:
+    """
+    스트리밍 상관분석기
+
+    각 ERR_NETWORK_CHANGED에 대해 [ERR - window, ERR + window] 안의 다른 워커 트리거 이벤트를 수집합니다.
+    - 과거 트리거: window초 이내만 deque로 유지
+    - 이후 트리거: ERR를 pending에 두고 스트림 시각이 ERR + window를 지나면 확정
+    """
+
+    def __init__(self, window: float = DEFAULT_WINDOW, include_self: bool = False):
+        """
+        Args:
+            window: 전후 탐색 범위(초)
+            include_self: ERR가 발생한 워커 자신의 이벤트도 포함할지 여부
+        """
+        self.window = window
+        self.include_self = include_self
+        self._triggers: deque = deque()
+        self._pending: deque = deque()
+
+        # 요약 통계 (고정 크기 또는 워커/타입 조합 수에 비례)
+        self.errors = 0
+        self.errors_with_prior = 0
+        self.errors_with_any = 0
+        self.lag = LagHistogram()
+        self.cause_counts: Dict[Tuple[str, str], int] = {}     # (트리거 wg, 트리거 타입) → 건수
+        self.victim_counts: Dict[str, int] = {}                 # ERR 발생 wg → 건수
+        self.pair_counts: Dict[Tuple[str, str], int] = {}      # (트리거 wg, ERR wg) → 건수
+
+    def _related(self, trigger: Event, error: Event) -> bool:
+        return self.include_self or trigger[2] != error[2]
+
+    def feed(self, event: Event) -> List[Dict[str, Any]]:
+        """
+        이벤트 1건 처리
+
+        Returns:
+            이번 이벤트로 확정된 ERR 결과 목록
+        """
+        now = event[0]
+        finished = self._expire(now)
+
+        while self._triggers and self._triggers[0][0] < now - self.window:
+            self._triggers.popleft()
+
+        event_type = event[3]
+        if event_type in TRIGGER_EVENTS:
+            self._triggers.append(event)
+            for entry in self._pending:
+                if self._related(event, entry["error"]) and len(entry["after"]) < MAX_MATCHES_PER_ERROR:
+                    entry["after"].append(event)
+        elif event_type == ERR_EVENT:
+            before = [t for t in self._triggers if self._related(t, event)][-MAX_MATCHES_PER_ERROR:]
+            self._pending.append({"error": event, "before": before, "after": []})
+
+        return finished
+
+    def _expire(self, now: float) -> List[Dict[str, Any]]:
+        """window가 지난 ERR 확정"""
+        finished = []
+        while self._pending and self._pending[0]["error"][0] + self.window < now:
+            entry = self._pending.popleft()
+            self._account(entry)
+            finished.append(entry)
+        return finished
+
+    def finish(self) -> List[Dict[str, Any]]:
+        """스트림 종료 시 남은 ERR 확정"""
+        return self._expire(float("inf"))
+
+    def _account(self, entry: Dict[str, Any]):
+        """요약 통계 반영"""
+        error = entry["error"]
+        self.errors += 1
+        self.victim_counts[error[2]] = self.victim_counts.get(error[2], 0) + 1
+        if entry["before"] or entry["after"]:
+            self.errors_with_any += 1
+        if entry["before"]:
+            # 가장 가까운 직전 트리거를 원인 후보로 간주
+            cause = entry["before"][-1]
+            self.errors_with_prior += 1
+            self.lag.add(error[0] - cause[0])
+            key = (cause[2], cause[3])
+            self.cause_counts[key] = self.cause_counts.get(key, 0) + 1
+            pair = (cause[2], error[2])
+            self.pair_counts[pair] = self.pair_counts.get(pair, 0) + 1
+
+
+def _print_event(event: Event):
+    """병합 타임라인 한 줄"""
+    marker = "🔴" if event[3] == ERR_EVENT else ("🔌" if event[3] in TRIGGER_EVENTS else "  ")
+    details = json.dumps(event[5], ensure_ascii=False)[:120] if event[5] else ""
+    print(f"{_format_ts(event[0])}  {event[1]:<10} {event[2]:<8} {marker} {event[3]:<22} {event[4]:<8} {details}")
+
+
+def _print_correlation(entry: Dict[str, Any]):
+    """ERR 1건 상관분석 결과"""
+    error = entry["error"]
+    print(f"\n🔴 {_format_ts(error[0])}  {error[1]} ({error[2]}) ERR_NETWORK_CHANGED")
+    if not entry["before"] and not entry["after"]:
+        print("   (window 안에 다른 워커 이벤트 없음)")
+        return
+    for trigger in entry["before"] + entry["after"]:
+        offset = trigger[0] - error[0]
+        print(f"   {offset:+8.3f}s  {trigger[1]:<10} {trigger[2]:<8} {trigger[3]:<22} {trigger[4]}")
+
+
+def _print_summary(analyzer: CorrelationAnalyzer, top: int = 10):
+    """상관분석 요약"""
+    total = analyzer.errors
+    print("\n" + "=" * 70)
+    print(f"📊 ERR_NETWORK_CHANGED 상관분석 요약 (window ±{analyzer.window:g}초)")
+    print("=" * 70)
+    if not total:
+        print("ERR_NETWORK_CHANGED 없음")
+        return
+
+    print(f"전체 ERR: {total}건")
+    print(f"  직전 {analyzer.window:g}초 안에 다른 워커 이벤트: {analyzer.errors_with_prior}건 "
+          f"({analyzer.errors_with_prior / total * 100:.1f}%)")
+    print(f"  전후 {analyzer.window:g}초 안에 다른 워커 이벤트: {analyzer.errors_with_any}건 "
+          f"({analyzer.errors_with_any / total * 100:.1f}%)")
+
+    if analyzer.lag.total:
+        lag = analyzer.lag
+        print(f"\n⏱️  직전 트리거 → ERR 지연: p50 ≤{lag.percentile(0.5):.2f}s  "
+              f"p95 ≤{lag.percentile(0.95):.2f}s  최대 {lag.maximum:.2f}s")
+        lower = 0.0
+        for index, count in enumerate(lag.counts):
+            upper = lag.buckets[index] if index < len(lag.buckets) else float("inf")
+            if count:
+                label = f"{lower:g}~{upper:g}s" if upper != float("inf") else f">{lower:g}s"
+                print(f"   {label:<12} {count:>7}  {'█' * max(1, int(count / lag.total * 40))}")
+            lower = upper
+        print(f"\n💡 워커 시작 간격(stagger)/터널 교체 간격은 p95 지연({lag.percentile(0.95):.2f}s) 이상 권장")
+
+    print("\n🔌 원인 후보 (직전 트리거 워커/이벤트):")
+    for (wg_user, event_type), count in sorted(analyzer.cause_counts.items(), key=lambda item: -item[1])[:top]:
+        print(f"   {wg_user:<8} {event_type:<22} {count:>7}")
+
+    print("\n🎯 ERR 발생 워커:")
+    for wg_user, count in sorted(analyzer.victim_counts.items(), key=lambda item: -item[1])[:top]:
+        print(f"   {wg_user:<8} {count:>7}")
+
+    print("\n🔗 트리거 → 피해 워커 조합:")
+    for (source, victim), count in sorted(analyzer.pair_counts.items(), key=lambda item: -item[1])[:top]:
+        print(f"   {source:<8} → {victim:<8} {count:>7}")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="워커 이벤트 로그 병합 및 ERR_NETWORK_CHANGED 상관분석",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+예시:
+  python3 analyze_vpn_logs.py                              # 전체 로그 병합
+  python3 analyze_vpn_logs.py --correlate                  # ±5초 상관분석
+  python3 analyze_vpn_logs.py --correlate -w 2 --summary-only
+  python3 analyze_vpn_logs.py --start 22:03:30 --end 22:03:40
+        """
+    )
+    parser.add_argument("--pattern", default=DEFAULT_EVENT_PATTERN,
+                        help=f"워커 이벤트 로그 glob (기본: {DEFAULT_EVENT_PATTERN})")
+    parser.add_argument("--chrome-log", default=DEFAULT_CHROME_LOG,
+                        help=f"CDP 네트워크 에러 로그 (기본: {DEFAULT_CHROME_LOG}, 빈 값이면 제외)")
+    parser.add_argument("--chrome-date", type=date.fromisoformat,
+                        help="CDP 로그 첫 줄의 날짜 YYYY-MM-DD (기본: 가장 이른 JSON 이벤트 날짜)")
+    parser.add_argument("--correlate", action="store_true", help="ERR_NETWORK_CHANGED 상관분석")
+    parser.add_argument("-w", "--window", type=float, default=DEFAULT_WINDOW,
+                        help=f"상관분석 전후 범위(초, 기본: {DEFAULT_WINDOW:g})")
+    parser.add_argument("--include-self", action="store_true", help="ERR 발생 워커 자신의 이벤트도 포함")
+    parser.add_argument("--summary-only", action="store_true", help="상관분석 요약만 출력")
+    parser.add_argument("--start", type=_parse_bound, help="시작 시각 (HH:MM[:SS] 또는 YYYY-MM-DD HH:MM:SS)")
+    parser.add_argument("--end", type=_parse_bound, help="종료 시각")
+    parser.add_argument("--type", action="append", dest="types", metavar="EVENT_TYPE",
+                        help="병합 출력 시 이벤트 타입 필터 (여러 번 지정 가능)")
+    args = parser.parse_args()
+
+    if args.window <= 0:
+        parser.error("--window는 0보다 커야 합니다")
+
+    event_paths = sorted(glob.glob(args.pattern))
+    if not event_paths:
+        print(f"❌ 이벤트 로그 없음: {args.pattern}")
+        sys.exit(1)
+
+    print(f"📂 이벤트 로그 {len(event_paths)}개"
+          + (f" + {args.chrome_log}" if args.chrome_log and os.path.exists(args.chrome_log) else ""),
+          file=sys.stderr)
+
+    events = (event for event in merged_events(event_paths, args.chrome_log or None, args.chrome_date)
+              if _in_range(event[0], args.start, args.end))
+
+    try:
+        if not args.correlate:
+            types = set(args.types or [])
+            for event in events:
+                if not types or event[3] in types:
+                    _print_event(event)
+            return
+
+        analyzer = CorrelationAnalyzer(window=args.window, include_self=args.include_self)
+        for event in events:
+            for entry in analyzer.feed(event):
+                if not args.summary_only:
+                    _print_correlation(entry)
+        for entry in analyzer.finish():
+            if not args.summary_only:
+                _print_correlation(entry)
+        _print_summary(analyzer)
+    except BrokenPipeError:
+        # | head 등으로 출력이 끊긴 경우
+        sys.stderr.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,322 @@
+#!/usr/bin/env python3
+"""
+Chrome 설치 레지스트리
+chrome-version/ 아래 설치된 빌드를 한 번 색인해서 uc_run_workers, uc_agent, BrowserCoreUC가 공유
+
+색인 항목: 레이블(디렉토리 이름), 전체 버전, 메이저 버전, chrome/chromedriver 경로, chromedriver 버전
+- 무효화: 버전 디렉토리 목록, 각 디렉토리와 VERSION/MAJOR_VERSION 파일의 mtime 서명이 바뀌면 다시 색인
+  (install-chrome-*.sh는 버전 디렉토리를 지우고 다시 만들기 때문에 항상 mtime이 바뀜,
+   채널 디렉토리의 VERSION 파일만 덮어쓰면 디렉토리 mtime은 그대로이므로 파일 mtime도 포함)
+- 색인 결과는 chrome-version/.registry.json에도 기록해서 짧게 사는 uc_agent 프로세스는
+  서명 확인 후 파일 하나만 읽음 (쓰기 권한이 없으면 메모리 색인만 사용)
+- chromedriver --version 확인은 비용이 있어 probe_drivers()에서만 수행 (러너 시작 시 1회)
+- prewarm(): 러너 시작 시 chrome/chromedriver 바이너리를 페이지 캐시에 미리 올림
+"""
+
+import os
+import re
+import json
+import threading
+import subprocess
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Optional, Dict, List
+
+
+CHROME_DIR = Path(__file__).resolve().parent.parent / "chrome-version"
+INDEX_FILE_NAME = ".registry.json"
+SIGNATURE_FILES = ("VERSION", "MAJOR_VERSION")  # 서명에 mtime을 포함하는 버전 디렉토리 내 파일
+CHANNELS = ("beta", "dev", "canary")
+
+
+@dataclass
+class ChromeBuild:
+    """설치된 Chrome 빌드 1개"""
+    label: str                              # 디렉토리 이름 (예: "144", "beta")
+    chrome_path: str                        # chrome-linux64/chrome
+    full_version: Optional[str] = None      # VERSION 파일 (예: "144.0.7559.59")
+    major_version: Optional[int] = None     # 메이저 버전 (uc.Chrome version_main)
+    chromedriver_path: Optional[str] = None  # chromedriver-linux64/chromedriver
+    driver_version: Optional[str] = None    # chromedriver --version (probe_drivers() 이후)
+
+    @property
+    def is_channel(self) -> bool:
+        """beta/dev/canary 채널 여부"""
+        return self.label in CHANNELS
+
+    @property
+    def driver_compatible(self) -> bool:
+        """
+        chromedriver 호환 여부
+
+        chromedriver가 없으면 False, 버전 확인 전이면 같은 디렉토리에 설치된 것으로 간주해 True
+        """
+        if not self.chromedriver_path:
+            return False
+        if not self.driver_version or self.major_version is None:
+            return True
+        return self.driver_version.split(".")[0] == str(self.major_version)
+
+
+def _read_text(path: Path) -> Optional[str]:
+    """파일 내용 (없으면 None)"""
+    try:
+        return path.read_text().strip() or None
+    except OSError:
+        return None
+
+
+class ChromeRegistry:
+    """chrome-version/ 색인 (프로세스당 1개, get_registry()로 접근)"""
+
+    def __init__(self, chrome_dir: Path = CHROME_DIR):
+        """
+        Args:
+            chrome_dir: Chrome 설치 루트 디렉토리
+        """
+        self.chrome_dir = Path(chrome_dir)
+        self.index_file = self.chrome_dir / INDEX_FILE_NAME
+        self._lock = threading.Lock()
+        self._signature: Optional[List] = None
+        self._builds: Dict[str, ChromeBuild] = {}
+
+    def _compute_signature(self) -> List:
+        """
+        버전 디렉토리 목록 + 각 디렉토리/VERSION/MAJOR_VERSION mtime 서명 (설치/삭제/재설치/버전 파일 갱신 감지)
+
+        chrome-version/ 자체의 mtime은 색인 파일 기록으로도 바뀌므로 사용하지 않습니다.
+        기존 파일을 덮어쓰면 디렉토리 mtime은 바뀌지 않으므로 버전 파일 mtime을 따로 포함합니다.
+        """
+        try:
+            signature = []
+            for entry in os.scandir(self.chrome_dir):
+                if entry.is_dir() and not entry.name.startswith("."):
+                    item = [entry.name, entry.stat().st_mtime_ns]
+                    for name in SIGNATURE_FILES:
+                        try:
+                            item.append(os.stat(os.path.join(entry.path, name)).st_mtime_ns)
+                        except OSError:
+                            item.append(None)
+                    signature.append(item)
+        except OSError:
+            return []
+        return sorted(signature)
+
+    def _scan(self) -> Dict[str, ChromeBuild]:
+        """chrome-version/ 전체 색인"""
+        builds = {}
+        if not self.chrome_dir.exists():
+            return builds
+
+        for version_dir in self.chrome_dir.iterdir():
+            if not version_dir.is_dir() or version_dir.name.startswith("."):
+                continue
+
+            chrome_bin = version_dir / "chrome-linux64" / "chrome"
+            if not chrome_bin.exists():
+                continue
+
+            label = version_dir.name
+            full_version = _read_text(version_dir / "VERSION")
+
+            # 메이저 버전: 숫자 레이블 → MAJOR_VERSION 파일 → VERSION 파일 순서 (채널만 파일 사용)
+            major_version = None
+            major_text = None if label.isdigit() else _read_text(version_dir / "MAJOR_VERSION")
+            if label.isdigit():
+                major_version = int(label)
+            elif major_text and major_text.isdigit():
+                major_version = int(major_text)
+            elif full_version and full_version.split(".")[0].isdigit():
+                major_version = int(full_version.split(".")[0])
+
+            driver_bin = version_dir / "chromedriver-linux64" / "chromedriver"
+
+            builds[label] = ChromeBuild(
+                label=label,
+                chrome_path=str(chrome_bin),
+                full_version=full_version,
+                major_version=major_version,
+                chromedriver_path=str(driver_bin) if driver_bin.exists() else None
+            )
+
+        return builds
+
+    def _load_index(self, signature: List) -> Optional[Dict[str, ChromeBuild]]:
+        """디스크 색인 로드 (서명이 같을 때만)"""
+        try:
+            with open(self.index_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("signature") != signature:
+                return None
+            return {label: ChromeBuild(**fields) for label, fields in data.get("builds", {}).items()}
+        except (OSError, ValueError, TypeError):
+            return None
+
+    def _save_index(self):
+        """디스크 색인 기록 (임시 파일 → rename, 권한 없으면 무시)"""
+        tmp_path = self.index_file.with_name(f"{INDEX_FILE_NAME}.{os.getpid()}.tmp")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({
+                    "signature": self._signature,
+                    "builds": {label: asdict(build) for label, build in self._builds.items()}
+                }, f, ensure_ascii=False, indent=2)
+            os.chmod(tmp_path, 0o666)
+            os.replace(tmp_path, self.index_file)
+        except OSError:
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+
+    def refresh(self, force: bool = False) -> Dict[str, ChromeBuild]:
+        """
+        서명이 바뀌었으면 다시 색인
+
+        Args:
+            force: 서명과 무관하게 다시 스캔
+
+        Returns:
+            레이블 → ChromeBuild
+        """
+        signature = self._compute_signature()
+
+        with self._lock:
+            if not force and signature == self._signature:
+                return self._builds
+
+            builds = None if force else self._load_index(signature)
+            if builds is None:
+                builds = self._scan()
+                self._signature = signature
+                self._builds = builds
+                self._save_index()
+            else:
+                self._signature = signature
+                self._builds = builds
+
+            return self._builds
+
+    def builds(self) -> Dict[str, ChromeBuild]:
+        """설치된 빌드 전체 (레이블 → ChromeBuild)"""
+        return self.refresh()
+
+    def get(self, label: str) -> Optional[ChromeBuild]:
+        """
+        레이블로 빌드 조회
+
+        Args:
+            label: 버전 레이블 (예: "144", "beta" - 채널은 대소문자 무시)
+
+        Returns:
+            ChromeBuild (없으면 None)
+        """
+        builds = self.refresh()
+        return builds.get(label) or builds.get(label.lower())
+
+    def labels(self) -> List[str]:
+        """설치된 버전 레이블 (정렬)"""
+        return sorted(self.refresh().keys())
+
+    def chrome_paths(self) -> Dict[str, str]:
+        """레이블 → chrome 바이너리 경로 (기존 scan_chrome_versions() 형식)"""
+        return {label: build.chrome_path for label, build in self.refresh().items()}
+
+    def probe_drivers(self, timeout: float = 10.0) -> Dict[str, Optional[str]]:
+        """
+        chromedriver --version 실행으로 드라이버 버전 확인 후 색인에 기록
+
+        Args:
+            timeout: 바이너리당 실행 타임아웃(초)
+
+        Returns:
+            레이블 → chromedriver 버전 (확인 실패 시 None)
+        """
+        results = {}
+        builds = self.refresh()
+
+        for label, build in builds.items():
+            if not build.chromedriver_path:
+                results[label] = None
+                continue
+            try:
+                output = subprocess.run(
+                    [build.chromedriver_path, "--version"],
+                    capture_output=True,
+                    text=True,
+                    timeout=timeout
+                ).stdout
+                match = re.search(r"(\d+(?:\.\d+)+)", output)
+                build.driver_version = match.group(1) if match else None
+            except (OSError, subprocess.SubprocessError):
+                build.driver_version = None
+            results[label] = build.driver_version
+
+        with self._lock:
+            self._save_index()
+        return results
+
+    def prewarm(self, labels: Optional[List[str]] = None):
+        """
+        chrome/chromedriver 바이너리를 페이지 캐시에 미리 로드 (readahead 요청)
+
+        Args:
+            labels: 대상 레이블 (None이면 전체)
+        """
+        builds = self.refresh()
+        for label in labels or list(builds.keys()):
+            build = builds.get(label)
+            if not build:
+                continue
+            for path in (build.chrome_path, build.chromedriver_path):
+                if not path:
+                    continue
+                try:
+                    fd = os.open(path, os.O_RDONLY)
+                except OSError:
+                    continue
+                try:
+                    if hasattr(os, "posix_fadvise"):
+                        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+                    else:
+                        while os.read(fd, 1024 * 1024):
+                            pass
+                except OSError:
+                    pass
+                finally:
+                    os.close(fd)
+
+    def prewarm_async(self) -> threading.Thread:
+        """prewarm() + probe_drivers()를 백그라운드 스레드로 실행"""
+        def _run():
+            self.probe_drivers()
+            self.prewarm()
+
+        thread = threading.Thread(target=_run, daemon=True, name="chrome-registry-prewarm")
+        thread.start()
+        return thread
+
+
+_registry: Optional[ChromeRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_registry() -> ChromeRegistry:
+    """프로세스 공용 ChromeRegistry"""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = ChromeRegistry()
+        return _registry
+
+
+if __name__ == "__main__":
+    registry = get_registry()
+    registry.probe_drivers()
+
+    print(f"📦 Chrome 설치 레지스트리: {registry.chrome_dir}")
+    for label in registry.labels():
+        build = registry.get(label)
+        compat = "✅" if build.driver_compatible else "❌"
+        print(f"  {label:<8} {build.full_version or '?':<16} major={build.major_version}  "
+              f"driver={build.driver_version or '-'} {compat}")
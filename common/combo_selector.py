@@ -0,0 +1,400 @@
+#!/usr/bin/env python3
+"""
+VPN 서버 × Chrome 버전 선택기 (Thompson sampling)
+
+러너(uc_run_workers)가 작업마다 무작위로 고르던 VPN 서버/Chrome 버전을
+(서버, 버전, 시간대 버킷)별 성공/차단 관측으로 학습해서 고름
+- 조합마다 Beta(성공 + 1, 차단 + 1) 사후분포에서 값을 하나씩 뽑아 가장 큰 조합 선택
+  → 차단이 잦은 조합은 덜 고르고, 관측이 적은 조합은 분포가 넓어 자연스럽게 탐색됨
+- 관측은 반감기(half_life_hours)로 지수 감쇠 → 차단 정책이 바뀌면 몇 시간 안에 따라감
+- 시간대 버킷(bucket_hours)별로 따로 학습하되, 관측이 적은 버킷은
+  다른 시간대 관측을 pool_weight 비율로 섞어서 사용
+- 기존 쿨다운 차단 목록(BlockedCombinationsManager)은 그대로 두고, 차단되지 않은 후보 안에서만 선택
+
+저장:
+    combo_selector.json (러너 디렉토리)
+    - 관측은 SAVE_DELAY초 동안 모아서 .lock 파일 flock 아래에서 디스크 내용과 병합 후 기록
+      (임시 파일 → fsync → rename, 러너 프로세스 여러 개가 같은 파일을 공유해도 관측이 합쳐짐)
+    - 파일 기록(flock 대기, 병합, fsync)은 self.lock 밖에서 수행 → 기록 중에도 선택/기록이 막히지 않음
+
+사용법:
+    selector = ComboSelector("combo_selector.json", servers=["1.2.3.4", "5.6.7.8"])
+    server_ip = selector.choose_server(versions)          # VPNAPIClient.allocate_key(server_ip)
+    version = selector.choose_version(server_ip, versions)
+    selector.record(server_ip, version, success=True)
+
+조회:
+    python3 common/combo_selector.py show                 # 현재 시간대 조합별 추정 성공률
+    python3 common/combo_selector.py show --all-hours
+    python3 common/combo_selector.py seed --since 1d      # 실행 이력 DB에서 관측 적재
+"""
+
+import os
+import sys
+import json
+import time
+import fcntl
+import random
+import atexit
+import threading
+from pathlib import Path
+from datetime import datetime
+from typing import Optional, Dict, List, Tuple, Sequence
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from common.constants import Config
+
+
+LOCAL_SERVER = "local"  # VPN 없이 실행한 작업의 서버 키
+ALL_HOURS = "*"         # 시간대 구분 없는 집계 버킷
+
+PRIOR_SUCCESS = 1.0
+PRIOR_BLOCK = 1.0
+MIN_WEIGHT = 0.01       # 감쇠 후 관측 합이 이보다 작으면 기록 시 삭제
+
+
+class ComboSelector:
+    """(서버, Chrome 버전, 시간대) 조합별 성공/차단 학습 + Thompson sampling 선택"""
+
+    SAVE_DELAY = 2.0        # 초
+    RELOAD_INTERVAL = 10.0  # 초
+
+    def __init__(self, json_path, servers: Optional[Sequence[str]] = None,
+                 half_life_hours: float = None, bucket_hours: int = None, pool_weight: float = None):
+        """
+        Args:
+            json_path: 상태 파일 경로
+            servers: 선택 후보 VPN 서버 IP 목록 (기록된 서버는 자동 추가)
+            half_life_hours: 관측 반감기 (기본: Config.SELECTOR_HALF_LIFE_HOURS)
+            bucket_hours: 시간대 버킷 크기 (기본: Config.SELECTOR_BUCKET_HOURS)
+            pool_weight: 다른 시간대 관측 반영 비율 (기본: Config.SELECTOR_POOL_WEIGHT)
+        """
+        self.json_path = Path(json_path)
+        self.lock_path = self.json_path.with_name(self.json_path.name + ".lock")
+        self.half_life = (half_life_hours or Config.SELECTOR_HALF_LIFE_HOURS) * 3600
+        self.bucket_hours = max(1, int(bucket_hours or Config.SELECTOR_BUCKET_HOURS))
+        self.pool_weight = Config.SELECTOR_POOL_WEIGHT if pool_weight is None else pool_weight
+        self.servers = list(servers or [])
+        self.lock = threading.Lock()
+        self._flush_lock = threading.Lock()  # 이 프로세스 안의 기록 직렬화 (self.lock과 별개)
+        self._rng = random.Random()
+        self._arms: Dict[str, List[float]] = {}      # 키 → [성공, 차단, 갱신 시각]
+        self._pending: List[Tuple[str, str, bool, float]] = []  # 기록 대기 관측
+        self._inflight: List[Tuple[str, str, bool, float]] = []  # 기록 중인 관측 (기록 중 다시 로드해도 반영)
+        self._file_state = None
+        self._last_check = time.time()
+        self._save_timer = None
+        self._arms = self._load()
+        atexit.register(self.flush)
+
+    # ------------------------------------------------------------
+    # 저장소
+    # ------------------------------------------------------------
+    def _stat_file(self):
+        """파일 상태 (inode, mtime, size) - 없으면 None"""
+        try:
+            st = os.stat(self.json_path)
+            return (st.st_ino, st.st_mtime_ns, st.st_size)
+        except OSError:
+            return None
+
+    def _load(self) -> Dict[str, List[float]]:
+        """상태 파일 로드 (파일 상태도 갱신)"""
+        arms, self._file_state = self._read_file()
+        return arms
+
+    def _read_file(self) -> Tuple[Dict[str, List[float]], Optional[tuple]]:
+        """
+        상태 파일 읽기 (없거나 손상되면 빈 상태)
+
+        Returns:
+            (조합별 관측, 읽은 파일 상태)
+        """
+        file_state = self._stat_file()
+        if file_state is None:
+            return {}, None
+        try:
+            with open(self.json_path, 'r') as f:
+                arms = json.load(f).get('arms', {})
+            return {key: [float(v) for v in value[:3]] for key, value in arms.items() if len(value) >= 3}, file_state
+        except (OSError, ValueError, TypeError, AttributeError) as e:
+            print(f"⚠️  조합 선택기 상태 로드 실패 - 빈 상태로 시작: {e}")
+            return {}, file_state
+
+    def _maybe_reload(self, now: float):
+        """다른 프로세스가 기록했으면 다시 로드 (lock 보유 상태에서 호출)"""
+        if now - self._last_check < self.RELOAD_INTERVAL:
+            return
+        self._last_check = now
+        if self._stat_file() != self._file_state:
+            arms = self._load()
+            for server, version, success, ts in self._inflight + self._pending:
+                self._observe(arms, server, version, success, ts)
+            self._arms = arms
+
+    def _schedule_save(self):
+        """SAVE_DELAY초 뒤 기록 예약 (lock 보유 상태에서 호출)"""
+        if self._save_timer is None:
+            self._save_timer = threading.Timer(self.SAVE_DELAY, self.flush)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+
+    def flush(self):
+        """
+        대기 중인 관측을 파일에 기록 (flock 아래에서 디스크 내용과 병합 → 임시 파일 → rename)
+
+        self.lock은 관측을 꺼낼 때와 결과를 반영할 때만 잡고, 파일 I/O는 lock 밖에서 수행합니다.
+        기록에 실패하면 꺼낸 관측을 대기열 앞에 되돌려 다음 기록(관측 또는 종료 시)에 함께 저장합니다.
+        """
+        with self._flush_lock:
+            with self.lock:
+                if self._save_timer is not None:
+                    self._save_timer.cancel()
+                    self._save_timer = None
+                if not self._pending:
+                    return
+                batch = self._inflight = self._pending
+                self._pending = []
+
+            tmp_path = self.json_path.with_name(f".{self.json_path.name}.{os.getpid()}.tmp")
+            lock_fd = None
+            try:
+                lock_fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o666)
+                fcntl.flock(lock_fd, fcntl.LOCK_EX)
+
+                now = time.time()
+                arms = self._read_file()[0]
+                for server, version, success, ts in batch:
+                    self._observe(arms, server, version, success, ts)
+                for key in [k for k, arm in arms.items() if sum(self._decayed(arm, now)) < MIN_WEIGHT]:
+                    del arms[key]
+
+                with open(tmp_path, 'w') as f:
+                    json.dump({'updated_at': round(now, 3), 'arms': arms}, f)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, self.json_path)
+                file_state = self._stat_file()
+            except Exception as e:
+                print(f"⚠️  조합 선택기 상태 저장 실패: {e}")
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+                with self.lock:
+                    self._pending = batch + self._pending
+                    self._inflight = []
+                return
+            finally:
+                if lock_fd is not None:
+                    os.close(lock_fd)  # flock 해제
+
+            with self.lock:
+                # 기록 중 들어온 관측은 새 상태에 다시 반영
+                for server, version, success, ts in self._pending:
+                    self._observe(arms, server, version, success, ts)
+                self._inflight = []
+                self._file_state = file_state
+                self._arms = arms
+
+    # ------------------------------------------------------------
+    # 관측
+    # ------------------------------------------------------------
+    def _bucket(self, ts: float) -> str:
+        """시각 → 시간대 버킷 이름 (예: bucket_hours=4, 14시 → "12")"""
+        hour = datetime.fromtimestamp(ts).hour
+        return str(hour - hour % self.bucket_hours)
+
+    @staticmethod
+    def _key(server: str, version: str, bucket: str) -> str:
+        return f"{server}|{version}|{bucket}"
+
+    def _decayed(self, arm: List[float], now: float) -> Tuple[float, float]:
+        """now 기준으로 감쇠한 (성공, 차단)"""
+        factor = 0.5 ** (max(0.0, now - arm[2]) / self.half_life)
+        return arm[0] * factor, arm[1] * factor
+
+    def _observe(self, arms: Dict[str, List[float]], server: str, version: str, success: bool, ts: float):
+        """관측 1건을 시간대 버킷 + 전체 버킷에 반영"""
+        for bucket in (self._bucket(ts), ALL_HOURS):
+            key = self._key(server, version, bucket)
+            arm = arms.get(key) or [0.0, 0.0, ts]
+            # 나중 시각 기준으로 맞춰서 더함 (관측 순서가 섞여도 결과 동일)
+            base = max(ts, arm[2])
+            factor = 0.5 ** ((base - arm[2]) / self.half_life)
+            arm = [arm[0] * factor, arm[1] * factor, base]
+            arm[0 if success else 1] += 0.5 ** ((base - ts) / self.half_life)
+            arms[key] = arm
+
+    def record(self, server: Optional[str], version: Optional[str], success: bool, ts: float = None):
+        """
+        작업 결과 기록 (성공 / 차단·timeout만 기록, 그 외 실패는 선택과 무관하므로 제외)
+
+        Args:
+            server: VPN 서버 IP (Local이면 None 또는 LOCAL_SERVER)
+            version: Chrome 버전
+            success: 성공 여부 (False = 차단/timeout)
+            ts: 관측 시각 (기본: 현재)
+        """
+        if not version or version == "random":
+            return
+        server = server or LOCAL_SERVER
+        ts = time.time() if ts is None else ts
+        with self.lock:
+            self._observe(self._arms, server, str(version), success, ts)
+            self._pending.append((server, str(version), success, ts))
+            if server != LOCAL_SERVER and server not in self.servers:
+                self.servers.append(server)
+            self._schedule_save()
+
+    # ------------------------------------------------------------
+    # 선택
+    # ------------------------------------------------------------
+    def _posterior(self, server: str, version: str, now: float) -> Tuple[float, float]:
+        """Beta 사후분포 파라미터 (현재 시간대 + 다른 시간대 pool_weight 비율)"""
+        empty = [0.0, 0.0, now]
+        s_bucket, b_bucket = self._decayed(self._arms.get(self._key(server, version, self._bucket(now)), empty), now)
+        s_all, b_all = self._decayed(self._arms.get(self._key(server, version, ALL_HOURS), empty), now)
+        alpha = PRIOR_SUCCESS + s_bucket + self.pool_weight * max(0.0, s_all - s_bucket)
+        beta = PRIOR_BLOCK + b_bucket + self.pool_weight * max(0.0, b_all - b_bucket)
+        return alpha, beta
+
+    def _sample(self, server: str, version: str, now: float) -> float:
+        alpha, beta = self._posterior(server, version, now)
+        return self._rng.betavariate(alpha, beta)
+
+    def choose_version(self, server: Optional[str], versions: Sequence[str]) -> Optional[str]:
+        """
+        서버에서 쓸 Chrome 버전 선택
+
+        Args:
+            server: VPN 서버 IP (Local이면 None 또는 LOCAL_SERVER)
+            versions: 후보 버전 (차단 목록에 걸린 버전은 미리 제외)
+
+        Returns:
+            선택된 버전 (후보가 없으면 None)
+        """
+        if not versions:
+            return None
+        server = server or LOCAL_SERVER
+        now = time.time()
+        with self.lock:
+            self._maybe_reload(now)
+            return max(versions, key=lambda v: self._sample(server, str(v), now))
+
+    def choose_server(self, versions: Sequence[str]) -> Optional[str]:
+        """
+        키를 할당받을 VPN 서버 선택 (서버마다 가장 좋은 버전의 표본으로 비교)
+
+        Args:
+            versions: 후보 Chrome 버전
+
+        Returns:
+            서버 IP (후보 서버를 모르거나 버전이 없으면 None → API 자동 선택)
+        """
+        if not self.servers or not versions:
+            return None
+        now = time.time()
+        with self.lock:
+            self._maybe_reload(now)
+            scores = {server: max(self._sample(server, str(v), now) for v in versions)
+                      for server in self.servers}
+        return max(scores, key=scores.get)
+
+    def is_empty(self) -> bool:
+        """관측이 하나도 없는지"""
+        with self.lock:
+            return not self._arms
+
+    def summary(self, all_hours: bool = False) -> List[Dict]:
+        """
+        조합별 추정치 (사후 평균 내림차순)
+
+        Args:
+            all_hours: True면 시간대 구분 없는 집계, False면 현재 시간대
+
+        Returns:
+            [{server, version, success, block, mean}, ...]
+        """
+        now = time.time()
+        with self.lock:
+            self._maybe_reload(now)
+            pairs = sorted({tuple(key.split("|")[:2]) for key in self._arms})
+            rows = []
+            for server, version in pairs:
+                if all_hours:
+                    s, b = self._decayed(self._arms.get(self._key(server, version, ALL_HOURS), [0.0, 0.0, now]), now)
+                    alpha, beta = PRIOR_SUCCESS + s, PRIOR_BLOCK + b
+                else:
+                    s, b = self._decayed(self._arms.get(self._key(server, version, self._bucket(now)), [0.0, 0.0, now]), now)
+                    alpha, beta = self._posterior(server, version, now)
+                rows.append({'server': server, 'version': version, 'success': s, 'block': b,
+                             'mean': alpha / (alpha + beta)})
+        return sorted(rows, key=lambda r: -r['mean'])
+
+    def seed_from_history(self, store, since: float) -> int:
+        """
+        실행 이력 DB(common/run_history.py)의 작업 결과로 관측 적재
+
+        Args:
+            store: RunHistoryStore
+            since: 시작 시각 (epoch)
+
+        Returns:
+            적재한 관측 수
+        """
+        from common.run_history import OUTCOME_SUCCESS, OUTCOME_TIMEOUT, OUTCOME_BLOCKED
+
+        rows = store.query(
+            "SELECT ts, vpn, vpn_server, chrome_version, outcome FROM runs "
+            "WHERE ts >= ? AND outcome IN (?, ?, ?) ORDER BY ts",
+            (since, OUTCOME_SUCCESS, OUTCOME_TIMEOUT, OUTCOME_BLOCKED)
+        )
+        count = 0
+        for row in rows:
+            if row['vpn'] not in ('L', None) and not row['vpn_server']:
+                continue  # 키 풀 작업인데 서버를 모르면 학습 불가
+            self.record(row['vpn_server'], row['chrome_version'], row['outcome'] == OUTCOME_SUCCESS, ts=row['ts'])
+            count += 1
+        self.flush()
+        return count
+
+
+if __name__ == "__main__":
+    import argparse
+
+    default_path = Path(__file__).resolve().parent.parent / "combo_selector.json"
+
+    parser = argparse.ArgumentParser(description="VPN 서버 × Chrome 버전 선택기 상태 조회")
+    parser.add_argument("--file", type=str, default=str(default_path), help="상태 파일")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    show_parser = sub.add_parser("show", help="조합별 추정 성공률")
+    show_parser.add_argument("--all-hours", action="store_true", help="시간대 구분 없이 집계")
+    show_parser.add_argument("--top", type=int, default=30, help="출력 개수")
+
+    seed_parser = sub.add_parser("seed", help="실행 이력 DB에서 관측 적재")
+    seed_parser.add_argument("--since", default="1d", help="적재 기간 (30m, 1h, 1d)")
+
+    args = parser.parse_args()
+    selector = ComboSelector(args.file)
+
+    if args.command == "show":
+        rows = selector.summary(all_hours=args.all_hours)
+        if not rows:
+            print("관측 없음")
+            sys.exit(0)
+        scope = "전체 시간대" if args.all_hours else f"현재 시간대 ({selector._bucket(time.time())}시~, 다른 시간대 {selector.pool_weight:.0%} 반영)"
+        print(f"기준: {scope}, 반감기 {selector.half_life / 3600:g}시간")
+        print(f"{'서버':<18} {'버전':>6} {'성공':>8} {'차단':>8} {'추정 성공률':>10}")
+        for r in rows[:args.top]:
+            print(f"{r['server']:<18} {r['version']:>6} {r['success']:>8.1f} {r['block']:>8.1f} {r['mean'] * 100:>9.1f}%")
+
+    elif args.command == "seed":
+        from common.run_history import get_store, parse_since
+
+        store = get_store()
+        if store is None:
+            sys.exit(1)
+        count = selector.seed_from_history(store, parse_since(args.since))
+        print(f"✅ 관측 {count}건 적재 → {selector.json_path}")
@@ -262,6 +262,20 @@ class Config:
 
         return str(profile_base)
 
+    # 템플릿 프로필 모드 (--profile-template 플래그로 설정됨)
+    # 버전별 골든 프로필(Cache/Code Cache만)을 실행마다 복제 → 종료 시 rename 한 번으로 폐기
+    ENABLE_PROFILE_TEMPLATE = False
+    PROFILE_TEMPLATE_MAX_AGE_HOURS = 24  # 템플릿 재생성 주기 (0이면 캐시 시드 갱신 시에만)
+    PROFILE_TEMPLATE_COPY_CACHE = False  # reflink 미지원 파일시스템에서도 캐시 복제 (실행마다 캐시 크기만큼 복사)
+
+    # 캐시 시드 (cache-seed/chrome-{ver}, uc_lib/core/cache_seed.py build로 생성)
+    # 프로필/템플릿의 Cache, Code Cache가 비어 있으면 시드를 복제해서 따뜻한 캐시로 시작
+    ENABLE_CACHE_SEED = True
+
+    # 업로드 중복 제거 (uc_lib/modules/upload_dedupe_index.py)
+    # 같은 메타데이터로 이미 올린 동일 이미지는 POST 없이 캐시된 서버 path 재사용 (기본 비활성)
+    ENABLE_UPLOAD_DEDUPE = False
+
     # 레거시 호환성 유지 (기본값)
     PROFILE_DIR_BASE = str(Path(__file__).parent.parent / "browser-profiles")
 
@@ -275,6 +289,50 @@ class Config:
     # Network Monitoring (ERR_NETWORK_CHANGED 감지용)
     ENABLE_NETWORK_ERROR_MONITOR = True  # CDP 네트워크 에러 모니터링 활성화
     NETWORK_ERROR_LOG_FILE = "/tmp/chrome_network_errors.log"  # 네트워크 에러 로그 파일
+    NETWORK_ERROR_MONITOR_MODE = "cdp"  # "cdp": 전용 CDP 세션 이벤트 구독, "log": performance 로그 폴링 (레거시)
+    ENABLE_PERFORMANCE_LOG = False  # goog:loggingPrefs performance 수집 (log 모드 모니터 사용 시 자동 활성화)
+
+    # 단계별 지연 추적 (common/tracing.py, 러너 → 에이전트로 job_id 전파)
+    ENABLE_TRACING = True
+    TRACE_DIR = "/tmp/rank_traces"  # 사용자/날짜별 spans_{user}_{YYYYMMDD}.jsonl
+    TRACE_RETENTION_DAYS = 3  # 이 기간이 지난 날짜 파일은 기록 시 삭제
+
+    # 러너 메트릭 엔드포인트 (uc_run_workers --metrics-port, 127.0.0.1 전용)
+    METRICS_PORT = 9108
+
+    # WebDriver 명령 집계 (uc_lib/core/driver_accounting.py, uc_agent --driver-accounting으로 활성화)
+    ENABLE_DRIVER_ACCOUNTING = False
+    DRIVER_N_PLUS_ONE_THRESHOLD = 10  # 같은 호출 위치에서 연속 N회 이상이면 N+1 의심
+    DRIVER_BURST_GAP = 1.0  # 연속 호출로 볼 최대 간격(초)
+
+    # 작업 단위 프로파일링 (common/profiling.py, --profile로 활성화)
+    PROFILE_MODE = None  # None / "cprofile" / "sample"
+    PROFILE_DIR = "/tmp/rank_profiles"  # 스크린샷이 없는 작업의 프로파일 저장 위치
+
+    # VPN 서버 × Chrome 버전 선택 (common/combo_selector.py, uc_run_workers --selector)
+    COMBO_SELECTOR = "bandit"  # "bandit": 성공/차단 학습 (Thompson sampling) / "random": 무작위
+    SELECTOR_HALF_LIFE_HOURS = 6.0  # 관측 반감기 (시간)
+    SELECTOR_BUCKET_HOURS = 4  # 시간대 버킷 크기 (0시부터 N시간 단위)
+    SELECTOR_POOL_WEIGHT = 0.3  # 다른 시간대 관측 반영 비율 (관측이 적은 시간대 보완)
+    SELECTOR_SEED_SINCE = "1d"  # 상태 파일이 없을 때 실행 이력 DB에서 적재할 기간
+
+    # Network Phase Policy (검색 결과 탐색 중 대역폭 절감, BrowserCoreUC.set_network_phase)
+    # browse: 트래커 URL + 미디어 차단 / capture: 트래커만 차단 (캡처 화면에 보이는 리소스는 허용)
+    # 대상 사이트가 보는 요청이 달라지므로 기본 비활성 (--network-phase-policy 플래그로 설정됨)
+    ENABLE_NETWORK_PHASE_POLICY = False
+    NETWORK_PHASE_BLOCK_FONTS = False  # browse 단계 폰트 차단 (캡처 페이지 글꼴이 바뀔 수 있어 기본 비활성)
+    NETWORK_PHASE_BLOCK_IMAGES = False  # browse 단계 이미지 차단 (캡처 페이지 이미지 누락 위험, 기본 비활성)
+    NETWORK_TRACKER_URL_PATTERNS = [  # Network.setBlockedURLs 패턴 (제3자 분석/광고 트래커)
+        "*google-analytics.com*",
+        "*googletagmanager.com*",
+        "*doubleclick.net*",
+        "*googleadservices.com*",
+        "*googlesyndication.com*",
+        "*connect.facebook.net*",
+        "*analytics.tiktok.com*",
+        "*criteo.com*",
+        "*criteo.net*",
+    ]
 
     # Highlight Settings (상품 강조 표시 + 순위 배지 통합)
     ENABLE_HIGHLIGHT = True  # 하이라이트(P/I/V 포함) 표시 여부 (False: 표시 안 함)
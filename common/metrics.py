@@ -0,0 +1,334 @@
+#!/usr/bin/env python3
+"""
+메트릭 레지스트리 + Prometheus 텍스트 형식 HTTP 엔드포인트
+
+외부 라이브러리 없이 카운터/게이지/히스토그램을 모아 /metrics로 노출
+- 러너(uc_run_workers)가 프로세스 1개에서 모든 워커 스레드의 메트릭을 수집
+- 다른 사용자 프로세스(uc_agent, wgNNN)가 남기는 JSONL 파일은 JsonlTail로 조회 시점에 증분 읽기
+  (span 파일 → 단계별 지연 히스토그램, 이벤트 로그 → ERR_NETWORK_CHANGED 카운터)
+
+사용법:
+    from common.metrics import REGISTRY, start_http_server
+
+    jobs = REGISTRY.counter("rank_jobs_total", "완료된 작업 수", ["outcome"])
+    jobs.inc(outcome="success")
+
+    start_http_server(9108)     # curl http://127.0.0.1:9108/metrics
+"""
+
+import os
+import glob
+import json
+import math
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Tuple, Callable, Optional, Sequence
+
+
+DEFAULT_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, 30, 60, 120, 300, 600)
+
+
+def _escape(value) -> str:
+    """라벨 값 이스케이프"""
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence, extra: Optional[Tuple[str, str]] = None) -> str:
+    """{a="1",b="2"} 형식 라벨 문자열"""
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(f'{extra[0]}="{extra[1]}"')
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    """숫자 출력 (정수는 소수점 없이)"""
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    """라벨별 값 저장 공통 부분"""
+
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict) -> Tuple:
+        """라벨 dict → 저장 키 (누락된 라벨은 빈 문자열)"""
+        return tuple("" if labels.get(name) is None else str(labels[name]) for name in self.labelnames)
+
+    def render(self) -> List[str]:
+        """HELP/TYPE + 샘플 줄"""
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"] + self._samples()
+
+    def _samples(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """단조 증가 카운터"""
+
+    kind = "counter"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._values: Dict[Tuple, float] = {}
+
+    def inc(self, amount: float = 1, **labels):
+        """증가"""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels) -> float:
+        """현재 값"""
+        with self._lock:
+            return self._values.get(self._key(labels), 0)
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(v)}" for key, v in items]
+
+
+class Gauge(_Metric):
+    """현재 값 게이지 (set_function으로 조회 시점 계산 가능)"""
+
+    kind = "gauge"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._values: Dict[Tuple, float] = {}
+        self._function: Optional[Callable[[], Dict[Tuple, float]]] = None
+
+    def set(self, value: float, **labels):
+        """값 설정"""
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+    def inc(self, amount: float = 1, **labels):
+        """증가"""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount: float = 1, **labels):
+        """감소"""
+        self.inc(-amount, **labels)
+
+    def set_function(self, function: Callable[[], Dict[Tuple, float]]):
+        """
+        조회 시점에 값을 계산하는 함수 지정
+
+        Args:
+            function: 라벨 값 튜플 → 값 dict를 반환 (라벨이 없으면 {(): 값})
+        """
+        self._function = function
+
+    def _samples(self) -> List[str]:
+        if self._function:
+            try:
+                items = sorted(self._function().items())
+            except Exception:
+                items = []
+        else:
+            with self._lock:
+                items = sorted(self._values.items())
+        return [f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(v)}" for key, v in items]
+
+
+class Histogram(_Metric):
+    """누적 버킷 히스토그램 (tail latency 계산용)"""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # 라벨 키 → [버킷별 개수..., 합계, 전체 개수]
+        self._values: Dict[Tuple, List[float]] = {}
+
+    def observe(self, value: float, **labels):
+        """관측값 추가"""
+        key = self._key(labels)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = [0] * len(self.buckets) + [0.0, 0]
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state[index] += 1
+            state[-2] += value
+            state[-1] += 1
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            items = sorted((key, list(state)) for key, state in self._values.items())
+        lines = []
+        for key, state in items:
+            for index, bound in enumerate(self.buckets):
+                labels = _format_labels(self.labelnames, key, ("le", _format_value(bound)))
+                lines.append(f"{self.name}_bucket{labels} {state[index]}")
+            lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, key, ('le', '+Inf'))} {state[-1]}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labelnames, key)} {_format_value(state[-2])}")
+            lines.append(f"{self.name}_count{_format_labels(self.labelnames, key)} {state[-1]}")
+        return lines
+
+
+class MetricsRegistry:
+    """메트릭 모음 (이름 중복 등록 시 기존 객체 반환)"""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._collectors: List[Callable[[], None]] = []
+        self._lock = threading.Lock()
+
+    def _register(self, cls, name: str, *args, **kwargs):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, *args, **kwargs)
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter, name, documentation, labelnames)
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge, name, documentation, labelnames)
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self._register(Histogram, name, documentation, labelnames, buckets=buckets)
+
+    def add_collector(self, collector: Callable[[], None]):
+        """조회 직전에 호출할 함수 등록 (파일 증분 읽기 등)"""
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        """Prometheus 텍스트 형식 (version 0.0.4)"""
+        for collector in list(self._collectors):
+            try:
+                collector()
+            except Exception as e:
+                print(f"⚠️  메트릭 수집 실패: {e}")
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+
+class JsonlTail:
+    """
+    JSONL 파일 묶음 증분 읽기 (다른 프로세스가 O_APPEND로 쓰는 로그용)
+
+    - 처음 발견한 파일은 기존 내용을 건너뛰고 끝에서 시작 (from_start=False)
+    - 파일이 교체되거나(inode 변경) 잘리면 처음부터 다시 읽음
+    - 한 번에 max_bytes까지만 읽어 조회 지연을 제한
+    """
+
+    def __init__(self, pattern: str, handler: Callable[[dict], None],
+                 from_start: bool = False, max_bytes: int = 8 * 1024 * 1024):
+        """
+        Args:
+            pattern: glob 패턴 (예: "/tmp/vpn_events_*.log")
+            handler: 레코드 1개 처리 함수
+            from_start: 기존 내용부터 읽을지 여부
+            max_bytes: 호출 1회당 파일별 최대 읽기 크기
+        """
+        self.pattern = pattern
+        self.handler = handler
+        self.from_start = from_start
+        self.max_bytes = max_bytes
+        self._offsets: Dict[str, Tuple[int, int]] = {}  # 경로 → (inode, offset)
+        self._lock = threading.Lock()
+        self._primed = False
+
+    def poll(self):
+        """새로 추가된 줄 처리"""
+        with self._lock:
+            for path in glob.glob(self.pattern):
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+
+                inode, offset = self._offsets.get(path, (None, None))
+                if offset is None:
+                    offset = 0 if (self.from_start or self._primed) else st.st_size
+                elif inode != st.st_ino or st.st_size < offset:
+                    offset = 0
+                if st.st_size == offset:
+                    self._offsets[path] = (st.st_ino, offset)
+                    continue
+
+                try:
+                    with open(path, "rb") as f:
+                        f.seek(offset)
+                        data = f.read(self.max_bytes)
+                except OSError:
+                    continue
+
+                # 마지막 줄바꿈까지만 처리 (기록 중인 줄은 다음 호출에서)
+                end = data.rfind(b"\n") + 1
+                for line in data[:end].splitlines():
+                    try:
+                        self.handler(json.loads(line))
+                    except ValueError:
+                        continue
+                self._offsets[path] = (st.st_ino, offset + end)
+            self._primed = True
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    """GET /metrics 처리"""
+
+    registry: MetricsRegistry = REGISTRY
+
+    def do_GET(self):
+        if self.path.split("?")[0] not in ("/metrics", "/"):
+            self.send_error(404)
+            return
+        body = self.registry.render().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass  # 접근 로그 출력 안 함
+
+
+def start_http_server(port: int, host: str = "127.0.0.1",
+                      registry: MetricsRegistry = REGISTRY) -> ThreadingHTTPServer:
+    """
+    /metrics HTTP 서버를 daemon 스레드로 시작
+
+    Args:
+        port: 포트
+        host: 바인드 주소 (기본: 로컬 전용)
+        registry: 노출할 레지스트리
+
+    Returns:
+        ThreadingHTTPServer (shutdown()으로 종료)
+    """
+    handler = type("MetricsHandler", (_MetricsHandler,), {"registry": registry})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True, name="metrics-http")
+    thread.start()
+    return server
@@ -4,6 +4,12 @@ CDP 네트워크 에러 모니터 (ERR_NETWORK_CHANGED 실시간 감지)
 
 Chrome DevTools Protocol을 사용하여 브라우저 네트워크 에러를 실시간으로 감지하고 로깅합니다.
 특히 ERR_NETWORK_CHANGED 오류 발생 시 타임스탬프를 기록하여 시스템 네트워크 이벤트와 상관분석이 가능합니다.
+
+모드:
+- "cdp" (기본): 전용 CDP WebSocket 세션에서 필요한 이벤트만 구독
+  (Network.loadingFailed, Page.frameNavigated, Log.entryAdded)
+  → chromedriver 세션을 점유하지 않고, 구독하지 않은 이벤트는 JSON 파싱도 하지 않음
+- "log" (레거시): driver.get_log('performance') 폴링 (goog:loggingPrefs performance 필요)
 """
 
 import threading
@@ -19,23 +25,37 @@ try:
 except ImportError:
     UNIFIED_LOGGER_AVAILABLE = False
 
+# 직접 CDP 세션 (이벤트 구독 모드)
+try:
+    from uc_lib.core.cdp_session import CDPSession
+    CDP_SESSION_AVAILABLE = True
+except ImportError:
+    CDP_SESSION_AVAILABLE = False
+
+# 구독 모드에서 처리하는 이벤트
+SUBSCRIBED_EVENTS = ('Network.loadingFailed', 'Page.frameNavigated', 'Log.entryAdded')
+
 class NetworkErrorMonitor:
     """CDP 네트워크 에러 모니터"""
 
-    def __init__(self, driver, worker_id: str, interface: str = None, log_file="/tmp/chrome_network_errors.log"):
+    def __init__(self, driver, worker_id: str, interface: str = None, log_file="/tmp/chrome_network_errors.log", mode: str = "cdp"):
         """
         Args:
             driver: Selenium WebDriver 인스턴스
             worker_id: 워커 식별자 (예: "Worker-1")
             interface: VPN 인터페이스 (예: "wg101")
             log_file: 로그 파일 경로
+            mode: "cdp" (이벤트 구독) 또는 "log" (performance 로그 폴링)
         """
         self.driver = driver
         self.worker_id = worker_id
         self.interface = interface or "N/A"
         self.log_file = log_file
+        self.mode = mode
         self.monitoring = False
         self.monitor_thread: Optional[threading.Thread] = None
+        self.cdp_session = None  # 구독 모드 전용 세션
+        self.active_mode = None  # 실제 동작 중인 모드 ("cdp"/"log")
 
         # 에러 카운터
         self.error_count = 0
@@ -81,7 +101,7 @@ class NetworkErrorMonitor:
             return False
 
     def check_network_errors(self):
-        """CDP 로그에서 네트워크 에러 확인"""
+        """CDP 로그에서 네트워크 에러 확인 (log 모드)"""
         try:
             # Chrome 로그 가져오기
             logs = self.driver.get_log('performance')
@@ -92,116 +112,7 @@ class NetworkErrorMonitor:
                     method = message.get('message', {}).get('method', '')
                     params = message.get('message', {}).get('params', {})
 
-                    # Network.loadingFailed 이벤트 감지
-                    if method == 'Network.loadingFailed':
-                        error_text = params.get('errorText', '')
-                        request_id = params.get('requestId', 'unknown')
-                        canceled = params.get('canceled', False)
-
-                        # ERR_NETWORK_CHANGED 감지
-                        if 'ERR_NETWORK_CHANGED' in error_text:
-                            self.network_changed_count += 1
-                            self.error_count += 1
-
-                            self.log(
-                                f"🚨 ERR_NETWORK_CHANGED 감지! "
-                                f"(발생 횟수: {self.network_changed_count})",
-                                "CRITICAL"
-                            )
-                            self.log(
-                                f"   요청 ID: {request_id}",
-                                "CRITICAL"
-                            )
-                            self.log(
-                                f"   취소 여부: {canceled}",
-                                "CRITICAL"
-                            )
-
-                            # 추가 디버그 정보
-                            if 'type' in params:
-                                self.log(
-                                    f"   리소스 타입: {params['type']}",
-                                    "CRITICAL"
-                                )
-
-                            # 통합 로거에 이벤트 기록
-                            if UNIFIED_LOGGER_AVAILABLE:
-                                log_event(
-                                    worker_id=self.worker_id,
-                                    event_type=EventType.ERR_NETWORK_CHANGED,
-                                    interface=self.interface,
-                                    details={
-                                        'request_id': request_id,
-                                        'canceled': canceled,
-                                        'resource_type': params.get('type', 'unknown'),
-                                        'error_text': error_text
-                                    }
-                                )
-
-                        # 기타 네트워크 에러 (차단 관련만 출력)
-                        elif error_text and 'ERR_' in error_text:
-                            self.error_count += 1
-                            # HTTP2_PROTOCOL_ERROR만 출력 (쿠팡 차단 신호)
-                            if 'HTTP2_PROTOCOL_ERROR' in error_text or 'H1192' in error_text:
-                                self.log(
-                                    f"⚠️  차단 감지: {error_text} (RequestID: {request_id})",
-                                    "WARNING"
-                                )
-                            # 나머지는 카운트만 (콘솔 출력 안 함)
-
-                    # Page.frameNavigated 이벤트 감지 (페이지 로드)
-                    elif method == 'Page.frameNavigated':
-                        frame = params.get('frame', {})
-                        url = frame.get('url', '')
-
-                        # ERR_NETWORK_CHANGED 에러 페이지 감지
-                        if 'chrome-error://' in url and 'ERR_NETWORK_CHANGED' in url:
-                            self.network_changed_count += 1
-                            self.error_count += 1
-                            self.log(
-                                f"🚨 ERR_NETWORK_CHANGED 에러 페이지 감지! "
-                                f"(발생 횟수: {self.network_changed_count})",
-                                "CRITICAL"
-                            )
-                            self.log(f"   URL: {url}", "CRITICAL")
-
-                            # 통합 로거에 이벤트 기록
-                            if UNIFIED_LOGGER_AVAILABLE:
-                                log_event(
-                                    worker_id=self.worker_id,
-                                    event_type=EventType.ERR_NETWORK_CHANGED,
-                                    interface=self.interface,
-                                    details={
-                                        'source': 'chrome-error-page',
-                                        'url': url
-                                    }
-                                )
-                        elif url and 'about:blank' not in url and 'chrome-error://' not in url:
-                            self.log(f"📄 페이지 로드: {url[:100]}", "INFO")
-
-                        # 에러 페이지 일반 감지 (ERR_ 포함)
-                        elif 'chrome-error://' in url:
-                            error_match = url.split('/')[-1] if '/' in url else 'UNKNOWN'
-                            if error_match.startswith('ERR_'):
-                                self.error_count += 1
-                                self.log(f"⚠️  Chrome 에러 페이지: {error_match}", "WARNING")
-
-                    # Log.entryAdded 이벤트 감지 (콘솔 에러)
-                    elif method == 'Log.entryAdded':
-                        entry_obj = params.get('entry', {})
-                        level = entry_obj.get('level', '')
-                        text = entry_obj.get('text', '')
-
-                        if level == 'error' and text:
-                            # ERR_NETWORK_CHANGED가 콘솔에 출력될 수도 있음
-                            if 'ERR_NETWORK_CHANGED' in text:
-                                self.network_changed_count += 1
-                                self.log(
-                                    f"🚨 ERR_NETWORK_CHANGED (콘솔): {text}",
-                                    "CRITICAL"
-                                )
-                            else:
-                                self.log(f"❌ 콘솔 에러: {text[:200]}", "WARNING")
+                    self.handle_event(method, params)
 
                 except json.JSONDecodeError:
                     continue
@@ -213,6 +124,125 @@ class NetworkErrorMonitor:
             # get_log 실패는 무시 (브라우저가 닫혔을 수 있음)
             pass
 
+    def handle_event(self, method: str, params: dict):
+        """
+        CDP 이벤트 1건 처리 (log 모드/구독 모드 공통)
+
+        Args:
+            method: 이벤트 이름 (예: "Network.loadingFailed")
+            params: 이벤트 파라미터
+        """
+        # Network.loadingFailed 이벤트 감지
+        if method == 'Network.loadingFailed':
+            error_text = params.get('errorText', '')
+            request_id = params.get('requestId', 'unknown')
+            canceled = params.get('canceled', False)
+
+            # ERR_NETWORK_CHANGED 감지
+            if 'ERR_NETWORK_CHANGED' in error_text:
+                self.network_changed_count += 1
+                self.error_count += 1
+
+                self.log(
+                    f"🚨 ERR_NETWORK_CHANGED 감지! "
+                    f"(발생 횟수: {self.network_changed_count})",
+                    "CRITICAL"
+                )
+                self.log(
+                    f"   요청 ID: {request_id}",
+                    "CRITICAL"
+                )
+                self.log(
+                    f"   취소 여부: {canceled}",
+                    "CRITICAL"
+                )
+
+                # 추가 디버그 정보
+                if 'type' in params:
+                    self.log(
+                        f"   리소스 타입: {params['type']}",
+                        "CRITICAL"
+                    )
+
+                # 통합 로거에 이벤트 기록
+                if UNIFIED_LOGGER_AVAILABLE:
+                    log_event(
+                        worker_id=self.worker_id,
+                        event_type=EventType.ERR_NETWORK_CHANGED,
+                        interface=self.interface,
+                        details={
+                            'request_id': request_id,
+                            'canceled': canceled,
+                            'resource_type': params.get('type', 'unknown'),
+                            'error_text': error_text
+                        }
+                    )
+
+            # 기타 네트워크 에러 (차단 관련만 출력)
+            elif error_text and 'ERR_' in error_text:
+                self.error_count += 1
+                # HTTP2_PROTOCOL_ERROR만 출력 (쿠팡 차단 신호)
+                if 'HTTP2_PROTOCOL_ERROR' in error_text or 'H1192' in error_text:
+                    self.log(
+                        f"⚠️  차단 감지: {error_text} (RequestID: {request_id})",
+                        "WARNING"
+                    )
+                # 나머지는 카운트만 (콘솔 출력 안 함)
+
+        # Page.frameNavigated 이벤트 감지 (페이지 로드)
+        elif method == 'Page.frameNavigated':
+            frame = params.get('frame', {})
+            url = frame.get('url', '')
+
+            # ERR_NETWORK_CHANGED 에러 페이지 감지
+            if 'chrome-error://' in url and 'ERR_NETWORK_CHANGED' in url:
+                self.network_changed_count += 1
+                self.error_count += 1
+                self.log(
+                    f"🚨 ERR_NETWORK_CHANGED 에러 페이지 감지! "
+                    f"(발생 횟수: {self.network_changed_count})",
+                    "CRITICAL"
+                )
+                self.log(f"   URL: {url}", "CRITICAL")
+
+                # 통합 로거에 이벤트 기록
+                if UNIFIED_LOGGER_AVAILABLE:
+                    log_event(
+                        worker_id=self.worker_id,
+                        event_type=EventType.ERR_NETWORK_CHANGED,
+                        interface=self.interface,
+                        details={
+                            'source': 'chrome-error-page',
+                            'url': url
+                        }
+                    )
+            elif url and 'about:blank' not in url and 'chrome-error://' not in url:
+                self.log(f"📄 페이지 로드: {url[:100]}", "INFO")
+
+            # 에러 페이지 일반 감지 (ERR_ 포함)
+            elif 'chrome-error://' in url:
+                error_match = url.split('/')[-1] if '/' in url else 'UNKNOWN'
+                if error_match.startswith('ERR_'):
+                    self.error_count += 1
+                    self.log(f"⚠️  Chrome 에러 페이지: {error_match}", "WARNING")
+
+        # Log.entryAdded 이벤트 감지 (콘솔 에러)
+        elif method == 'Log.entryAdded':
+            entry_obj = params.get('entry', {})
+            level = entry_obj.get('level', '')
+            text = entry_obj.get('text', '')
+
+            if level == 'error' and text:
+                # ERR_NETWORK_CHANGED가 콘솔에 출력될 수도 있음
+                if 'ERR_NETWORK_CHANGED' in text:
+                    self.network_changed_count += 1
+                    self.log(
+                        f"🚨 ERR_NETWORK_CHANGED (콘솔): {text}",
+                        "CRITICAL"
+                    )
+                else:
+                    self.log(f"❌ 콘솔 에러: {text[:200]}", "WARNING")
+
     def monitor_loop(self, interval=0.5):
         """네트워크 에러 모니터링 루프"""
         self.log(f"네트워크 에러 모니터링 시작 (간격: {interval}초)", "INFO")
@@ -247,15 +277,62 @@ class NetworkErrorMonitor:
 
         self.log("네트워크 에러 모니터링 종료", "INFO")
 
+    def start_subscription(self) -> bool:
+        """
+        구독 모드 시작: 전용 CDP 세션에서 필요한 이벤트만 수신
+
+        Network/Page/Log 도메인은 이 세션에서만 활성화되므로 이벤트가 chromedriver
+        세션으로 흘러가지 않고, 구독하지 않은 이벤트는 CDPSession이 파싱 전에 버립니다.
+
+        Returns:
+            성공 여부 (실패 시 호출자가 log 모드로 fallback)
+        """
+        if not CDP_SESSION_AVAILABLE:
+            return False
+
+        try:
+            self.cdp_session = CDPSession.from_driver(self.driver)
+            for method in SUBSCRIBED_EVENTS:
+                self.cdp_session.on(method, lambda params, method=method: self.handle_event(method, params))
+
+            self.cdp_session.send_batch([
+                ('Network.enable', None),
+                ('Page.enable', None),
+                ('Log.enable', None),
+            ])
+        except Exception as e:
+            self.log(f"CDP 이벤트 구독 실패: {e}", "WARNING")
+            if self.cdp_session:
+                self.cdp_session.close()
+                self.cdp_session = None
+            return False
+
+        self.monitoring = True
+        self.active_mode = "cdp"
+        self.log("CDP 이벤트 구독 모니터링 시작 (전용 세션)", "INFO")
+        return True
+
     def start(self, interval=0.5):
-        """백그라운드 모니터링 시작"""
+        """
+        백그라운드 모니터링 시작
+
+        Args:
+            interval: log 모드 폴링 간격(초) (구독 모드에서는 사용하지 않음)
+        """
         if self.monitoring:
             self.log("이미 모니터링 중입니다", "WARNING")
             return
 
+        # 구독 모드 우선 (폴링 스레드 없음)
+        if self.mode == "cdp":
+            if self.start_subscription():
+                return
+            self.log("log 모드로 전환 (goog:loggingPrefs performance 필요)", "WARNING")
+
         # CDP 활성화
         if not self.enable_network_monitoring():
             return
+        self.active_mode = "log"
 
         # 백그라운드 스레드 시작
         self.monitor_thread = threading.Thread(
@@ -274,6 +351,10 @@ class NetworkErrorMonitor:
 
         self.monitoring = False
 
+        if self.cdp_session:
+            self.cdp_session.close()
+            self.cdp_session = None
+
         if self.monitor_thread:
             self.monitor_thread.join(timeout=2)
 
@@ -289,7 +370,8 @@ class NetworkErrorMonitor:
         return {
             'total_errors': self.error_count,
             'network_changed_errors': self.network_changed_count,
-            'monitoring': self.monitoring
+            'monitoring': self.monitoring,
+            'mode': self.active_mode
         }
 
 # 사용 예시
@@ -0,0 +1,443 @@
+#!/usr/bin/env python3
+"""
+작업 단위 프로파일링 (--profile, 기본 비활성)
+
+uc_agent의 run_agent_selenium_uc / SearchWorkflow.execute를 감싸서 작업 1건마다 프로파일 파일을 남김
+- cprofile: cProfile 결정적 프로파일 → {스크린샷}.profile.prof (pstats)
+- sample:   샘플링 스택 수집 (기본 5ms) → {스크린샷}.profile.collapsed (flamegraph.pl / speedscope 입력)
+- 공통:     WebDriver 명령별 호출 수/누적 시간 + 구간 시간 → {스크린샷}.profile.json
+           (driver.execute 래퍼는 instrument_driver() 하나, 명령 집계(driver_accounting)도 관찰자로 등록)
+
+파일 위치: 작업 중 저장된 스크린샷과 같은 디렉토리 (스크린샷이 없으면 Config.PROFILE_DIR)
+          스크린샷 옆의 파일은 cleanup_screenshots()가 스크린샷과 같은 최신 N건 기준으로 정리
+
+사용법:
+    python3 uc_agent.py --work-api --profile            # cprofile
+    python3 uc_run_workers.py -t 4 --profile sample     # 모든 작업을 샘플링
+
+    python3 common/profiling.py merge screenshots/      # 작업별 파일 병합 (함수/스택/WebDriver 명령 상위)
+"""
+
+import os
+import sys
+import json
+import time
+import pstats
+import cProfile
+import threading
+import functools
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Optional, Dict, List, Callable
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from common.constants import Config
+from common.tracing import current_job_id
+
+
+MODES = ("cprofile", "sample")
+ENV_PROFILE = "RANK_PROFILE"
+SAMPLE_INTERVAL = 0.005   # 초
+MAX_STACK_DEPTH = 128
+
+_active: Optional["ProfileSession"] = None
+_active_lock = threading.Lock()
+
+
+def profile_mode() -> Optional[str]:
+    """현재 프로파일 모드 (Config.PROFILE_MODE → 환경 변수 순서, 비활성이면 None)"""
+    mode = Config.PROFILE_MODE or os.environ.get(ENV_PROFILE)
+    return mode if mode in MODES else None
+
+
+class StackSampler:
+    """대상 스레드의 호출 스택을 주기적으로 수집 (collapsed stack 형식으로 집계)"""
+
+    def __init__(self, thread_id: int, interval: float = SAMPLE_INTERVAL):
+        """
+        Args:
+            thread_id: 샘플링할 스레드 ident
+            interval: 샘플링 간격(초)
+        """
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks: Dict[str, int] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _sample(self):
+        frame = sys._current_frames().get(self.thread_id)
+        names = []
+        while frame is not None and len(names) < MAX_STACK_DEPTH:
+            code = frame.f_code
+            names.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+            frame = frame.f_back
+        if names:
+            key = ";".join(reversed(names))
+            self.stacks[key] = self.stacks.get(key, 0) + 1
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self._sample()
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, daemon=True, name="profile-sampler")
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=1)
+
+
+class ProfileSession:
+    """작업 1건 프로파일 (start → stop → write)"""
+
+    def __init__(self, mode: str, name: str):
+        """
+        Args:
+            mode: cprofile / sample
+            name: 최상위 구간 이름 (예: "agent.run")
+        """
+        self.mode = mode
+        self.name = name
+        self.artifact: Optional[str] = None
+        self.started_at = time.time()
+        self.wall_seconds = 0.0
+        self.sections: Dict[str, List[float]] = {}     # 구간 → [횟수, 누적 초]
+        self.webdriver: Dict[str, List[float]] = {}    # 명령 → [횟수, 누적 초]
+        self._lock = threading.Lock()
+        self._profiler: Optional[cProfile.Profile] = None
+        self._sampler: Optional[StackSampler] = None
+        self._start_perf = 0.0
+
+    def start(self):
+        """프로파일 시작 (현재 스레드 대상)"""
+        self._start_perf = time.perf_counter()
+        if self.mode == "cprofile":
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+        else:
+            self._sampler = StackSampler(threading.get_ident())
+            self._sampler.start()
+
+    def stop(self):
+        """프로파일 종료"""
+        if self._profiler:
+            self._profiler.disable()
+        if self._sampler:
+            self._sampler.stop()
+        self.wall_seconds = time.perf_counter() - self._start_perf
+
+    def record_command(self, command: str, seconds: float):
+        """WebDriver 명령 1건 기록"""
+        with self._lock:
+            entry = self.webdriver.get(command)
+            if entry is None:
+                entry = self.webdriver[command] = [0, 0.0]
+            entry[0] += 1
+            entry[1] += seconds
+
+    @contextmanager
+    def section(self, name: str):
+        """중첩 구간 시간 기록 (프로파일러는 하나만 사용)"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            with self._lock:
+                entry = self.sections.setdefault(name, [0, 0.0])
+                entry[0] += 1
+                entry[1] += time.perf_counter() - start
+
+    def _output_stem(self) -> Path:
+        """출력 파일 경로 접두어 (스크린샷 옆, 없으면 PROFILE_DIR)"""
+        if self.artifact:
+            artifact = Path(self.artifact)
+            return artifact.with_name(f"{artifact.stem}.profile")
+
+        label = current_job_id() or datetime.fromtimestamp(self.started_at).strftime("%Y%m%d_%H%M%S")
+        directory = Path(Config.PROFILE_DIR)
+        try:
+            if not directory.exists():
+                directory.mkdir(parents=True, exist_ok=True)
+                os.chmod(directory, 0o777)  # 모든 wg 사용자가 기록 가능
+        except OSError:
+            pass
+        return directory / f"{label}_{os.getpid()}.profile"
+
+    def write(self) -> Optional[Path]:
+        """
+        프로파일 파일 기록 (실패 무시)
+
+        Returns:
+            파일 경로 접두어 (실패 시 None)
+        """
+        stem = self._output_stem()
+        try:
+            if self._profiler:
+                self._profiler.dump_stats(f"{stem}.prof")
+            if self._sampler:
+                with open(f"{stem}.collapsed", "w", encoding="utf-8") as f:
+                    for stack, count in sorted(self._sampler.stacks.items(), key=lambda item: -item[1]):
+                        f.write(f"{stack} {count}\n")
+
+            webdriver_total = sum(entry[1] for entry in self.webdriver.values())
+            summary = {
+                "name": self.name,
+                "mode": self.mode,
+                "job_id": current_job_id(),
+                "pid": os.getpid(),
+                "started_at": datetime.fromtimestamp(self.started_at).isoformat(),
+                "wall_seconds": round(self.wall_seconds, 4),
+                "artifact": self.artifact,
+                "sections": {name: {"count": int(c), "seconds": round(s, 4)}
+                             for name, (c, s) in self.sections.items()},
+                "webdriver": {cmd: {"count": int(c), "seconds": round(s, 4)}
+                              for cmd, (c, s) in sorted(self.webdriver.items(), key=lambda item: -item[1][1])},
+                "webdriver_seconds": round(webdriver_total, 4),
+            }
+            with open(f"{stem}.json", "w", encoding="utf-8") as f:
+                json.dump(summary, f, ensure_ascii=False, indent=2)
+
+            print(f"🔬 프로파일 저장: {stem}.* (WebDriver {webdriver_total:.1f}s / 전체 {self.wall_seconds:.1f}s)")
+            return stem
+        except OSError as e:
+            print(f"⚠️  프로파일 저장 실패: {e}")
+            return None
+
+
+def current_session() -> Optional[ProfileSession]:
+    """진행 중인 프로파일 세션 (없으면 None)"""
+    return _active
+
+
+def note_artifact(path: Optional[str]):
+    """
+    작업 산출물(스크린샷) 경로 기록 → 프로파일 파일을 같은 위치에 저장
+
+    Args:
+        path: 스크린샷 파일 경로
+    """
+    session = _active
+    if session is not None and path:
+        session.artifact = str(path)
+
+
+def _command_name(driver_command: str, params: Optional[Dict]) -> str:
+    """CDP 명령은 메서드 이름까지 구분 (executeCdpCommand:Network.enable)"""
+    if driver_command == "executeCdpCommand" and params:
+        return f"{driver_command}:{params.get('cmd')}"
+    return driver_command
+
+
+def instrument_driver(driver, observer: Optional[Callable[[str, Optional[Dict], float], None]] = None) -> bool:
+    """
+    WebDriver.execute를 감싸서 명령별 호출 수/시간 기록 (--profile 세션 + 등록된 관찰자)
+
+    find_element, execute_script, WebElement 메서드 등 모든 명령이 driver.execute를 거칩니다.
+    같은 driver에 여러 번 호출해도 한 번만 감싸고, 관찰자만 추가합니다.
+
+    Args:
+        driver: Selenium WebDriver (uc.Chrome)
+        observer: 명령마다 호출할 함수 (명령 이름, 파라미터, 소요 초)
+                  None이면 --profile 활성 시에만 감쌈
+
+    Returns:
+        감싸기(또는 관찰자 추가) 여부
+    """
+    if driver is None or (observer is None and not profile_mode()):
+        return False
+
+    observers = getattr(driver, "_command_observers", None)
+    if observers is None:
+        observers = []
+        original = driver.execute
+
+        def execute(driver_command, params=None):
+            session = _active
+            if session is None and not observers:
+                return original(driver_command, params)
+            start = time.perf_counter()
+            try:
+                return original(driver_command, params)
+            finally:
+                seconds = time.perf_counter() - start
+                command = _command_name(driver_command, params)
+                if session is not None:
+                    session.record_command(command, seconds)
+                for callback in observers:
+                    callback(command, params, seconds)
+
+        try:
+            driver.execute = execute
+            driver._command_observers = observers
+        except AttributeError:
+            return False
+
+    if observer is not None and observer not in observers:
+        observers.append(observer)
+    return True
+
+
+def profiled(name: str):
+    """
+    --profile 활성 시 함수 실행을 프로파일하는 데코레이터
+
+    이미 세션이 있으면(바깥 함수가 프로파일 중) 구간 시간만 기록하고,
+    없으면 새 세션을 시작해서 종료 시 파일을 기록합니다.
+
+    Args:
+        name: 구간 이름
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            global _active
+            mode = profile_mode()
+            if not mode:
+                return func(*args, **kwargs)
+
+            session = _active
+            if session is not None:
+                with session.section(name):
+                    return func(*args, **kwargs)
+
+            session = ProfileSession(mode, name)
+            with _active_lock:
+                _active = session
+            session.start()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                session.stop()
+                with _active_lock:
+                    _active = None
+                session.write()
+        return wrapper
+    return decorator
+
+
+# ============================================================
+# 병합 CLI
+# ============================================================
+def _collect_files(paths: List[str], suffix: str) -> List[Path]:
+    """경로/디렉토리에서 *.profile{suffix} 파일 수집"""
+    files = []
+    for raw in paths:
+        path = Path(raw)
+        if path.is_dir():
+            files.extend(sorted(path.rglob(f"*.profile{suffix}")))
+        elif path.name.endswith(f".profile{suffix}"):
+            files.append(path)
+        elif path.with_name(f"{path.name}{suffix}").exists():
+            files.append(path.with_name(f"{path.name}{suffix}"))
+    return files
+
+
+def merge_profiles(paths: List[str], top: int = 30, out_prof: Optional[str] = None,
+                   out_collapsed: Optional[str] = None):
+    """
+    작업별 프로파일 병합 출력
+
+    Args:
+        paths: 파일 또는 디렉토리 목록
+        top: 출력할 상위 항목 수
+        out_prof: 병합 pstats 저장 경로
+        out_collapsed: 병합 collapsed stack 저장 경로
+    """
+    summaries = _collect_files(paths, ".json")
+    prof_files = _collect_files(paths, ".prof")
+    collapsed_files = _collect_files(paths, ".collapsed")
+
+    print(f"📂 작업 {len(summaries)}건 (pstats {len(prof_files)}, collapsed {len(collapsed_files)})")
+
+    # WebDriver 명령 / 구간 합계
+    webdriver: Dict[str, List[float]] = {}
+    sections: Dict[str, List[float]] = {}
+    wall_total = 0.0
+    webdriver_total = 0.0
+    for path in summaries:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            continue
+        wall_total += data.get("wall_seconds", 0)
+        webdriver_total += data.get("webdriver_seconds", 0)
+        for target, source in ((webdriver, data.get("webdriver", {})), (sections, data.get("sections", {}))):
+            for key, value in source.items():
+                entry = target.setdefault(key, [0, 0.0])
+                entry[0] += value.get("count", 0)
+                entry[1] += value.get("seconds", 0)
+
+    if summaries:
+        share = webdriver_total / wall_total * 100 if wall_total else 0
+        print(f"\n⏱️  전체 {wall_total:.1f}s 중 WebDriver 명령 {webdriver_total:.1f}s ({share:.1f}%)")
+        print(f"\n{'WebDriver 명령':<48} {'호출':>8} {'누적(s)':>9} {'평균(ms)':>9} {'작업당':>7}")
+        for command, (count, seconds) in sorted(webdriver.items(), key=lambda item: -item[1][1])[:top]:
+            print(f"{command[:48]:<48} {int(count):>8} {seconds:>9.2f} {seconds / count * 1000:>9.1f} "
+                  f"{count / len(summaries):>7.1f}")
+        if sections:
+            print(f"\n{'구간':<32} {'횟수':>6} {'누적(s)':>9}")
+            for name, (count, seconds) in sorted(sections.items(), key=lambda item: -item[1][1]):
+                print(f"{name:<32} {int(count):>6} {seconds:>9.2f}")
+
+    # pstats 병합
+    if prof_files:
+        stats = pstats.Stats(str(prof_files[0]))
+        for path in prof_files[1:]:
+            try:
+                stats.add(str(path))
+            except (OSError, TypeError, ValueError):
+                continue
+        if out_prof:
+            stats.dump_stats(out_prof)
+            print(f"\n💾 병합 pstats: {out_prof}")
+        print(f"\n📊 누적 시간 상위 {top}개 함수 (cprofile)")
+        stats.sort_stats("cumulative").print_stats(top)
+
+    # collapsed stack 병합
+    if collapsed_files:
+        stacks: Dict[str, int] = {}
+        leaves: Dict[str, int] = {}
+        total = 0
+        for path in collapsed_files:
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    for line in f:
+                        stack, _, count = line.rstrip("\n").rpartition(" ")
+                        if not stack or not count.isdigit():
+                            continue
+                        stacks[stack] = stacks.get(stack, 0) + int(count)
+                        leaf = stack.rsplit(";", 1)[-1]
+                        leaves[leaf] = leaves.get(leaf, 0) + int(count)
+                        total += int(count)
+            except OSError:
+                continue
+        if out_collapsed:
+            with open(out_collapsed, "w", encoding="utf-8") as f:
+                for stack, count in sorted(stacks.items(), key=lambda item: -item[1]):
+                    f.write(f"{stack} {count}\n")
+            print(f"\n💾 병합 collapsed stack: {out_collapsed} (flamegraph.pl {out_collapsed} > flame.svg)")
+        print(f"\n📊 샘플 상위 {top}개 leaf 함수 (sample, 전체 {total}개)")
+        for leaf, count in sorted(leaves.items(), key=lambda item: -item[1])[:top]:
+            print(f"{count / total * 100:6.1f}%  {count:>7}  {leaf}")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="작업별 프로파일 병합")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    merge_parser = sub.add_parser("merge", help="프로파일 파일/디렉토리 병합")
+    merge_parser.add_argument("paths", nargs="+", help="*.profile.* 파일 또는 디렉토리")
+    merge_parser.add_argument("--top", type=int, default=30, help="출력할 상위 항목 수")
+    merge_parser.add_argument("--out-prof", help="병합 pstats 저장 경로 (snakeviz 등으로 열람)")
+    merge_parser.add_argument("--out-collapsed", help="병합 collapsed stack 저장 경로")
+
+    args = parser.parse_args()
+    if args.command == "merge":
+        merge_profiles(args.paths, top=args.top, out_prof=args.out_prof, out_collapsed=args.out_collapsed)
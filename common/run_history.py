@@ -0,0 +1,507 @@
+#!/usr/bin/env python3
+"""
+실행 이력 저장소 (SQLite, WAL 모드)
+
+일자별 TXT 로그(logs/YYYY-MM-DD.txt), 키워드별 JSONL, 워커별 이벤트 로그(/tmp/vpn_events_wgNNN.log),
+차단 목록(blocked_combinations.json)에 흩어진 실행 결과를 한 곳에 모아
+"최근 1시간 Chrome 버전 × VPN 서버별 성공률" 같은 질의를 인덱스로 바로 처리
+
+테이블:
+    runs    작업 1건 결과 (시각, 워커, VPN/서버, Chrome 버전, 키워드, 결과, 순위, 소요 시간)
+    events  워커 이벤트 (import-events로 /tmp/vpn_events_*.log 적재)
+    blocks  VPN + Chrome 버전 조합 차단/해제 이력
+
+- 기록은 메모리 큐에 쌓고 백그라운드 스레드가 FLUSH_INTERVAL초 또는 FLUSH_SIZE건마다
+  한 트랜잭션으로 일괄 INSERT (프로세스 종료 시 atexit로 남은 기록 flush)
+- WAL 모드라 러너가 기록하는 중에도 조회 CLI가 잠금 없이 읽음
+
+사용법:
+    python3 common/run_history.py stats --since 1h --by chrome_version,vpn_server
+    python3 common/run_history.py recent --keyword 노트북 --limit 20
+    python3 common/run_history.py blocks --since 1d
+    python3 common/run_history.py import-logs            # 기존 logs/*.txt 적재
+    python3 common/run_history.py import-events          # /tmp/vpn_events_*.log 적재
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import atexit
+import sqlite3
+import threading
+from pathlib import Path
+from datetime import datetime
+from typing import Optional, Dict, Any, List, Tuple
+
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+DB_PATH = PROJECT_ROOT / "logs" / "run_history.db"
+
+FLUSH_INTERVAL = 2.0   # 초
+FLUSH_SIZE = 200       # 건
+
+# 결과 분류
+OUTCOME_SUCCESS = "success"
+OUTCOME_FAILED = "failed"
+OUTCOME_TIMEOUT = "timeout"
+OUTCOME_BLOCKED = "blocked"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id              INTEGER PRIMARY KEY,
+    ts              REAL NOT NULL,
+    worker_id       INTEGER,
+    vpn             TEXT,
+    vpn_server      TEXT,
+    chrome_version  TEXT,
+    keyword         TEXT,
+    screenshot_id   INTEGER,
+    outcome         TEXT NOT NULL,
+    error           TEXT,
+    rank            INTEGER,
+    elapsed         REAL
+);
+CREATE INDEX IF NOT EXISTS idx_runs_ts ON runs (ts);
+CREATE INDEX IF NOT EXISTS idx_runs_keyword_ts ON runs (keyword, ts);
+CREATE INDEX IF NOT EXISTS idx_runs_worker_ts ON runs (worker_id, ts);
+CREATE INDEX IF NOT EXISTS idx_runs_version_server_ts ON runs (chrome_version, vpn_server, ts);
+CREATE INDEX IF NOT EXISTS idx_runs_outcome_ts ON runs (outcome, ts);
+
+CREATE TABLE IF NOT EXISTS events (
+    id          INTEGER PRIMARY KEY,
+    ts          REAL NOT NULL,
+    worker      TEXT,
+    wg_user     TEXT,
+    event_type  TEXT NOT NULL,
+    interface   TEXT,
+    details     TEXT,
+    UNIQUE (ts, wg_user, event_type)
+);
+CREATE INDEX IF NOT EXISTS idx_events_type_ts ON events (event_type, ts);
+CREATE INDEX IF NOT EXISTS idx_events_user_ts ON events (wg_user, ts);
+
+CREATE TABLE IF NOT EXISTS blocks (
+    id              INTEGER PRIMARY KEY,
+    ts              REAL NOT NULL,
+    vpn             TEXT,
+    chrome_version  TEXT,
+    action          TEXT NOT NULL,
+    reason          TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_blocks_ts ON blocks (ts);
+"""
+
+RUN_COLUMNS = ("ts", "worker_id", "vpn", "vpn_server", "chrome_version", "keyword",
+               "screenshot_id", "outcome", "error", "rank", "elapsed")
+EVENT_COLUMNS = ("ts", "worker", "wg_user", "event_type", "interface", "details")
+BLOCK_COLUMNS = ("ts", "vpn", "chrome_version", "action", "reason")
+
+# stats --by 에 허용하는 컬럼 (SQL 식별자로 그대로 사용)
+GROUP_COLUMNS = ("worker_id", "vpn", "vpn_server", "chrome_version", "keyword", "outcome", "error")
+
+
+def _connect(db_path: Path) -> sqlite3.Connection:
+    """WAL 모드 연결 (스키마 생성 포함)"""
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(str(db_path), timeout=10.0, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.executescript(SCHEMA)
+
+    # 다른 wg 사용자 프로세스도 기록할 수 있도록 (-wal/-shm 포함)
+    for suffix in ("", "-wal", "-shm"):
+        try:
+            os.chmod(f"{db_path}{suffix}", 0o666)
+        except OSError:
+            pass
+    return conn
+
+
+class RunHistoryStore:
+    """실행 이력 저장소 (기록은 일괄 처리, 조회는 즉시)"""
+
+    def __init__(self, db_path: Path = DB_PATH, flush_interval: float = FLUSH_INTERVAL,
+                 flush_size: int = FLUSH_SIZE):
+        """
+        Args:
+            db_path: SQLite 파일 경로
+            flush_interval: 일괄 기록 주기(초)
+            flush_size: 이 건수가 쌓이면 주기와 무관하게 기록
+        """
+        self.db_path = Path(db_path)
+        self.flush_interval = flush_interval
+        self.flush_size = flush_size
+
+        self._conn = _connect(self.db_path)
+        self._conn_lock = threading.Lock()
+        self._pending: Dict[str, List[Tuple]] = {"runs": [], "events": [], "blocks": []}
+        self._pending_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._closed = False
+
+        self._flusher = threading.Thread(target=self._flush_loop, daemon=True, name="run-history-flush")
+        self._flusher.start()
+        atexit.register(self.close)
+
+    # ------------------------------------------------------------
+    # 기록
+    # ------------------------------------------------------------
+    def _enqueue(self, table: str, row: Tuple):
+        """기록 대기열 추가 (FLUSH_SIZE 도달 시 flush 스레드 깨움)"""
+        with self._pending_lock:
+            self._pending[table].append(row)
+            size = sum(len(rows) for rows in self._pending.values())
+        if size >= self.flush_size:
+            self._wakeup.set()
+
+    def record_run(self, worker_id: Optional[int], outcome: str, vpn: Optional[str] = None,
+                   vpn_server: Optional[str] = None, chrome_version: Optional[str] = None,
+                   keyword: Optional[str] = None, screenshot_id: Optional[int] = None,
+                   error: Optional[str] = None, rank: Optional[int] = None,
+                   elapsed: Optional[float] = None, ts: Optional[float] = None):
+        """
+        작업 결과 1건 기록
+
+        Args:
+            worker_id: 워커 ID
+            outcome: success / failed / timeout / blocked
+            vpn: 'L', 'VPN' 등 선택된 VPN 모드
+            vpn_server: VPN 서버 IP (키 풀 사용 시)
+            chrome_version: Chrome 버전
+            keyword: 검색 키워드
+            screenshot_id: 작업 ID
+            error: 실패 사유
+            rank: 발견 순위
+            elapsed: 소요 시간(초)
+            ts: 발생 시각 (None이면 현재)
+        """
+        self._enqueue("runs", (ts or time.time(), worker_id, vpn, vpn_server, chrome_version, keyword,
+                               screenshot_id, outcome, error, rank, elapsed))
+
+    def record_block(self, vpn: Optional[str], chrome_version: Optional[str], action: str,
+                     reason: Optional[str] = None, ts: Optional[float] = None):
+        """
+        차단 조합 변경 기록
+
+        Args:
+            vpn: VPN
+            chrome_version: Chrome 버전
+            action: blocked / cleared
+            reason: 차단 사유
+            ts: 발생 시각 (None이면 현재)
+        """
+        self._enqueue("blocks", (ts or time.time(), vpn, chrome_version, action, reason))
+
+    def record_event(self, event: Dict[str, Any]):
+        """
+        워커 이벤트 기록 (unified_event_logger 레코드 형식)
+
+        Args:
+            event: {"timestamp", "worker_id", "wg_user", "event_type", "interface", "details"}
+        """
+        try:
+            ts = datetime.strptime(event["timestamp"], "%Y-%m-%d %H:%M:%S.%f").timestamp()
+        except (KeyError, ValueError):
+            return
+        self._enqueue("events", (ts, event.get("worker_id"), event.get("wg_user"), event.get("event_type"),
+                                 event.get("interface"), json.dumps(event.get("details") or {}, ensure_ascii=False)))
+
+    def flush(self) -> int:
+        """
+        대기 중인 기록을 한 트랜잭션으로 저장
+
+        Returns:
+            저장한 건수
+        """
+        with self._pending_lock:
+            pending = self._pending
+            self._pending = {"runs": [], "events": [], "blocks": []}
+
+        total = sum(len(rows) for rows in pending.values())
+        if not total:
+            return 0
+
+        statements = {
+            "runs": f"INSERT INTO runs ({', '.join(RUN_COLUMNS)}) VALUES ({', '.join('?' * len(RUN_COLUMNS))})",
+            "events": f"INSERT OR IGNORE INTO events ({', '.join(EVENT_COLUMNS)}) VALUES ({', '.join('?' * len(EVENT_COLUMNS))})",
+            "blocks": f"INSERT INTO blocks ({', '.join(BLOCK_COLUMNS)}) VALUES ({', '.join('?' * len(BLOCK_COLUMNS))})",
+        }
+
+        try:
+            with self._conn_lock, self._conn:
+                for table, rows in pending.items():
+                    if rows:
+                        self._conn.executemany(statements[table], rows)
+        except sqlite3.Error as e:
+            print(f"⚠️  실행 이력 저장 실패 ({total}건): {e}")
+            return 0
+        return total
+
+    def _flush_loop(self):
+        """주기적 flush (daemon 스레드)"""
+        while not self._closed:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            self.flush()
+
+    def close(self):
+        """남은 기록 flush 후 연결 종료"""
+        if self._closed:
+            return
+        self._closed = True
+        self._wakeup.set()
+        self.flush()
+        with self._conn_lock:
+            self._conn.close()
+
+    # ------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------
+    def query(self, sql: str, params: Tuple = ()) -> List[sqlite3.Row]:
+        """읽기 질의 (대기 중인 기록 먼저 저장)"""
+        self.flush()
+        with self._conn_lock:
+            self._conn.row_factory = sqlite3.Row
+            try:
+                return self._conn.execute(sql, params).fetchall()
+            finally:
+                self._conn.row_factory = None
+
+    def success_rates(self, since: float, group_by: List[str], keyword: Optional[str] = None) -> List[sqlite3.Row]:
+        """
+        그룹별 성공률
+
+        Args:
+            since: 시작 시각 (epoch)
+            group_by: GROUP_COLUMNS 중 그룹 컬럼
+            keyword: 키워드 필터
+
+        Returns:
+            그룹 컬럼 + total, success, success_rate, avg_elapsed
+        """
+        columns = [c for c in group_by if c in GROUP_COLUMNS] or ["chrome_version"]
+        where = "ts >= ?"
+        params: List[Any] = [since]
+        if keyword:
+            where += " AND keyword = ?"
+            params.append(keyword)
+
+        sql = (
+            f"SELECT {', '.join(columns)}, COUNT(*) AS total, "
+            f"SUM(outcome = '{OUTCOME_SUCCESS}') AS success, "
+            f"ROUND(100.0 * SUM(outcome = '{OUTCOME_SUCCESS}') / COUNT(*), 1) AS success_rate, "
+            f"ROUND(AVG(elapsed), 1) AS avg_elapsed "
+            f"FROM runs WHERE {where} GROUP BY {', '.join(columns)} ORDER BY total DESC"
+        )
+        return self.query(sql, tuple(params))
+
+    def recent_runs(self, limit: int = 20, keyword: Optional[str] = None,
+                    worker_id: Optional[int] = None) -> List[sqlite3.Row]:
+        """최근 작업 결과 (최신순)"""
+        where, params = [], []
+        if keyword:
+            where.append("keyword = ?")
+            params.append(keyword)
+        if worker_id is not None:
+            where.append("worker_id = ?")
+            params.append(worker_id)
+        sql = f"SELECT * FROM runs {'WHERE ' + ' AND '.join(where) if where else ''} ORDER BY ts DESC LIMIT ?"
+        return self.query(sql, tuple(params) + (limit,))
+
+    def block_history(self, since: float) -> List[sqlite3.Row]:
+        """차단/해제 이력 (최신순)"""
+        return self.query("SELECT * FROM blocks WHERE ts >= ? ORDER BY ts DESC", (since,))
+
+    # ------------------------------------------------------------
+    # 기존 로그 적재
+    # ------------------------------------------------------------
+    def import_daily_logs(self, logs_dir: Path = PROJECT_ROOT / "logs") -> int:
+        """
+        일자별 TXT 로그(logs/YYYY-MM-DD.txt) 적재
+
+        형식: "2025-01-01 12:00:00 | Worker-1 | VPN 3    | Chrome 144    | SUCCESS | screenshot_id: 123"
+
+        Returns:
+            적재한 건수
+        """
+        pattern = re.compile(
+            r"^(\S+ \S+) \| Worker-(\d+) \| (.+?)\s*\| Chrome (\S+)\s*\| (SUCCESS|FAILED)\s*\| (.*)$"
+        )
+        imported = 0
+        for log_file in sorted(Path(logs_dir).glob("????-??-??.txt")):
+            with open(log_file, "r", encoding="utf-8", errors="replace") as f:
+                for line in f:
+                    match = pattern.match(line.rstrip("\n"))
+                    if not match:
+                        continue
+                    ts_text, worker, vpn_text, version, status, details = match.groups()
+                    try:
+                        ts = datetime.strptime(ts_text, "%Y-%m-%d %H:%M:%S").timestamp()
+                    except ValueError:
+                        continue
+
+                    vpn = "L" if vpn_text.strip() == "Local" else vpn_text.replace("VPN", "").strip()
+                    screenshot_id = None
+                    id_match = re.search(r"screenshot_id: (\d+)", details)
+                    if id_match:
+                        screenshot_id = int(id_match.group(1))
+
+                    success = status == "SUCCESS"
+                    self.record_run(
+                        worker_id=int(worker),
+                        outcome=OUTCOME_SUCCESS if success else OUTCOME_FAILED,
+                        vpn=vpn,
+                        chrome_version=version,
+                        screenshot_id=screenshot_id,
+                        error=None if success else details,
+                        ts=ts
+                    )
+                    imported += 1
+        self.flush()
+        return imported
+
+    def import_event_logs(self, pattern: str = "/tmp/vpn_events_*.log") -> int:
+        """
+        워커별 이벤트 로그 적재 (중복 이벤트는 무시)
+
+        Returns:
+            읽은 이벤트 수
+        """
+        import glob
+
+        imported = 0
+        for log_file in sorted(glob.glob(pattern)):
+            try:
+                with open(log_file, "r", encoding="utf-8", errors="replace") as f:
+                    for line in f:
+                        try:
+                            self.record_event(json.loads(line))
+                            imported += 1
+                        except ValueError:
+                            continue
+            except OSError:
+                continue
+        self.flush()
+        return imported
+
+
+_store: Optional[RunHistoryStore] = None
+_store_lock = threading.Lock()
+
+
+def get_store() -> Optional[RunHistoryStore]:
+    """
+    프로세스 공용 저장소 (DB를 열 수 없으면 None)
+
+    Returns:
+        RunHistoryStore 또는 None
+    """
+    global _store
+    with _store_lock:
+        if _store is None:
+            try:
+                _store = RunHistoryStore()
+            except (sqlite3.Error, OSError) as e:
+                print(f"⚠️  실행 이력 저장소 사용 불가: {e}")
+                _store = False
+        return _store or None
+
+
+def parse_since(text: str) -> float:
+    """
+    기간 문자열 → 시작 시각 (epoch)
+
+    Args:
+        text: "30m", "1h", "7d" 또는 "YYYY-MM-DD[ HH:MM]"
+
+    Returns:
+        epoch 초
+    """
+    match = re.fullmatch(r"(\d+)\s*([smhd])", text.strip())
+    if match:
+        seconds = {"s": 1, "m": 60, "h": 3600, "d": 86400}[match.group(2)]
+        return time.time() - int(match.group(1)) * seconds
+    for fmt in ("%Y-%m-%d %H:%M", "%Y-%m-%d"):
+        try:
+            return datetime.strptime(text, fmt).timestamp()
+        except ValueError:
+            continue
+    raise ValueError(f"기간 형식 오류: {text}")
+
+
+def _print_rows(rows: List[sqlite3.Row], columns: Optional[List[str]] = None):
+    """결과 표 출력"""
+    if not rows:
+        print("(결과 없음)")
+        return
+
+    columns = columns or list(rows[0].keys())
+    cells = []
+    for row in rows:
+        values = []
+        for column in columns:
+            value = row[column]
+            if column == "ts" and value is not None:
+                value = datetime.fromtimestamp(value).strftime("%m-%d %H:%M:%S")
+            values.append("-" if value is None else str(value))
+        cells.append(values)
+
+    widths = [max(len(column), *(len(values[i]) for values in cells)) for i, column in enumerate(columns)]
+    print("  ".join(column.ljust(width) for column, width in zip(columns, widths)))
+    print("  ".join("-" * width for width in widths))
+    for values in cells:
+        print("  ".join(value.ljust(width) for value, width in zip(values, widths)))
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="실행 이력 조회 (SQLite)")
+    parser.add_argument("--db", type=str, default=str(DB_PATH), help=f"DB 경로 (기본: {DB_PATH})")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    stats_parser = sub.add_parser("stats", help="그룹별 성공률")
+    stats_parser.add_argument("--since", default="1h", help="조회 기간 (30m, 1h, 7d, 2025-01-01)")
+    stats_parser.add_argument("--by", default="chrome_version,vpn_server",
+                              help=f"그룹 컬럼 (쉼표 구분: {', '.join(GROUP_COLUMNS)})")
+    stats_parser.add_argument("--keyword", default=None, help="키워드 필터")
+
+    recent_parser = sub.add_parser("recent", help="최근 작업 결과")
+    recent_parser.add_argument("--limit", type=int, default=20)
+    recent_parser.add_argument("--keyword", default=None)
+    recent_parser.add_argument("--worker", type=int, default=None)
+
+    blocks_parser = sub.add_parser("blocks", help="차단/해제 이력")
+    blocks_parser.add_argument("--since", default="1d")
+
+    sub.add_parser("import-logs", help="기존 logs/YYYY-MM-DD.txt 적재")
+    events_parser = sub.add_parser("import-events", help="/tmp/vpn_events_*.log 적재")
+    events_parser.add_argument("--pattern", default="/tmp/vpn_events_*.log")
+
+    args = parser.parse_args()
+    store = RunHistoryStore(Path(args.db))
+    started = time.perf_counter()
+
+    try:
+        if args.command == "stats":
+            by = [c.strip() for c in args.by.split(",") if c.strip()]
+            _print_rows(store.success_rates(parse_since(args.since), by, keyword=args.keyword))
+        elif args.command == "recent":
+            _print_rows(store.recent_runs(args.limit, keyword=args.keyword, worker_id=args.worker),
+                        ["ts", "worker_id", "vpn_server", "chrome_version", "keyword", "outcome", "rank", "elapsed", "error"])
+        elif args.command == "blocks":
+            _print_rows(store.block_history(parse_since(args.since)),
+                        ["ts", "vpn", "chrome_version", "action", "reason"])
+        elif args.command == "import-logs":
+            print(f"✅ 일자별 로그 {store.import_daily_logs()}건 적재")
+        elif args.command == "import-events":
+            print(f"✅ 이벤트 {store.import_event_logs(args.pattern)}건 적재")
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    finally:
+        store.close()
+
+    print(f"\n⏱️  {(time.perf_counter() - started) * 1000:.1f}ms")
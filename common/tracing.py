@@ -0,0 +1,388 @@
+#!/usr/bin/env python3
+"""
+작업 단계별 지연 추적 (span)
+
+러너(uc_run_workers) → 에이전트(uc_agent) → 워크플로우까지 같은 job_id로 단계별 소요 시간을 기록
+- 전파: 러너가 자식 프로세스 환경 변수(RANK_TRACE_JOB_ID, RANK_TRACE_PARENT)로 job_id와 부모 span을 넘김
+- 기록: span이 끝날 때마다 JSON 한 줄을 O_APPEND로 추가 (프로세스 사용자/날짜별 파일)
+    /tmp/rank_traces/spans_{사용자}_{YYYYMMDD}.jsonl
+    TRACE_RETENTION_DAYS가 지난 자기 파일은 날짜가 바뀔 때 삭제
+- 조회: python3 common/tracing.py job <job_id>      단계별 타임라인
+        python3 common/tracing.py stages --since 1h  단계별 p50/p95/최대
+
+사용법:
+    from common.tracing import span, traced
+
+    with span("vpn.connect", worker=1):
+        ...
+
+    @traced("browser.launch")
+    def launch(self, ...):
+        ...
+"""
+
+import os
+import sys
+import json
+import math
+import time
+import getpass
+import secrets
+import functools
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Optional, Dict, Any, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from common.constants import Config
+
+
+ENV_JOB_ID = "RANK_TRACE_JOB_ID"
+ENV_PARENT = "RANK_TRACE_PARENT"
+
+_local = threading.local()
+_pruned_days: Dict[str, str] = {}  # 파일 종류 → 오래된 파일 정리를 마지막으로 수행한 날짜
+
+
+def _trace_user() -> str:
+    """현재 프로세스 사용자 이름"""
+    try:
+        return getpass.getuser()
+    except Exception:
+        return str(os.getuid())
+
+
+def dated_file(kind: str, day: Optional[str] = None) -> Path:
+    """
+    현재 프로세스 사용자의 날짜별 기록 파일
+
+    Args:
+        kind: 파일 종류 (spans, driver_commands)
+        day: YYYYMMDD (None이면 오늘)
+
+    Returns:
+        Config.TRACE_DIR/{kind}_{사용자}_{YYYYMMDD}.jsonl
+    """
+    day = day or datetime.now().strftime("%Y%m%d")
+    return Path(Config.TRACE_DIR) / f"{kind}_{_trace_user()}_{day}.jsonl"
+
+
+def _file_day(path: Path) -> Optional[str]:
+    """기록 파일 이름의 날짜 (YYYYMMDD, 날짜 없는 이전 형식이면 None)"""
+    day = path.stem.rsplit("_", 1)[-1]
+    return day if len(day) == 8 and day.isdigit() else None
+
+
+def _prune_old_files(kind: str, today: str):
+    """보관 기간이 지난 자기 파일 삭제 (날짜가 바뀔 때 종류별 프로세스당 1회)"""
+    if _pruned_days.get(kind) == today:
+        return
+    _pruned_days[kind] = today
+    cutoff = (datetime.now() - timedelta(days=Config.TRACE_RETENTION_DAYS)).strftime("%Y%m%d")
+    directory = Path(Config.TRACE_DIR)
+    user = _trace_user()
+    legacy = directory / f"{kind}_{user}.jsonl"  # 날짜 없는 이전 형식
+    for path in [legacy, *directory.glob(f"{kind}_{user}_*.jsonl")]:
+        day = _file_day(path)
+        if path == legacy or (day is not None and day < cutoff):
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+
+def append_record(kind: str, record: Dict[str, Any]):
+    """
+    날짜별 기록 파일에 JSON 한 줄 추가 (O_APPEND, 실패 무시)
+
+    Args:
+        kind: 파일 종류 (spans, driver_commands)
+        record: 기록할 레코드
+    """
+    today = datetime.now().strftime("%Y%m%d")
+    path = dated_file(kind, today)
+    try:
+        if not path.parent.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            os.chmod(path.parent, 0o777)  # 모든 wg 사용자가 자기 파일 생성 가능
+    except OSError:
+        pass
+    try:
+        fd = os.open(str(path), os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    except OSError:
+        return
+    try:
+        os.write(fd, (json.dumps(record, ensure_ascii=False, default=str) + "\n").encode("utf-8"))
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+    _prune_old_files(kind, today)
+
+
+def _write_span(record: Dict[str, Any]):
+    """span 한 줄 기록 (실패 무시)"""
+    if Config.ENABLE_TRACING:
+        append_record("spans", record)
+
+
+def new_job_id(prefix: Any = None) -> str:
+    """
+    작업 ID 생성
+
+    Args:
+        prefix: 앞에 붙일 값 (예: screenshot_id)
+
+    Returns:
+        "{prefix}-{무작위 8자리}" 형식 ID
+    """
+    suffix = secrets.token_hex(4)
+    return f"{prefix}-{suffix}" if prefix is not None else suffix
+
+
+def set_job_id(job_id: Optional[str]):
+    """
+    현재 스레드의 작업 ID 설정 (러너 워커 스레드에서 작업마다 호출)
+
+    Args:
+        job_id: 작업 ID (None이면 해제)
+    """
+    _local.job_id = job_id
+    _local.stack = []
+
+
+def current_job_id() -> Optional[str]:
+    """
+    현재 작업 ID (스레드 설정 → 환경 변수 순서)
+
+    환경 변수는 매번 읽으므로 zygote에서 fork된 자식도 갱신된 값을 사용합니다.
+    """
+    return getattr(_local, "job_id", None) or os.environ.get(ENV_JOB_ID)
+
+
+def _stack() -> List[str]:
+    """현재 스레드의 열린 span ID 스택"""
+    stack = getattr(_local, "stack", None)
+    if stack is None:
+        stack = _local.stack = []
+    return stack
+
+
+def current_span_id() -> Optional[str]:
+    """현재 열린 span ID (없으면 부모 프로세스에서 전달된 span)"""
+    stack = _stack()
+    return stack[-1] if stack else os.environ.get(ENV_PARENT)
+
+
+def child_env() -> Dict[str, str]:
+    """
+    자식 프로세스로 전파할 환경 변수
+
+    Returns:
+        {RANK_TRACE_JOB_ID, RANK_TRACE_PARENT} (작업 ID가 없으면 빈 dict)
+    """
+    job_id = current_job_id()
+    if not job_id:
+        return {}
+    env = {ENV_JOB_ID: job_id}
+    parent = current_span_id()
+    if parent:
+        env[ENV_PARENT] = parent
+    return env
+
+
+class Span:
+    """진행 중인 span (end() 또는 with 블록 종료 시 기록)"""
+
+    def __init__(self, name: str, attrs: Optional[Dict[str, Any]] = None):
+        """
+        Args:
+            name: 단계 이름 (예: "browser.launch", "search.page")
+            attrs: 추가 속성
+        """
+        self.name = name
+        self.attrs = dict(attrs or {})
+        self.job_id = current_job_id()
+        self.parent_id = current_span_id()
+        self.span_id = secrets.token_hex(4)
+        self.start = time.time()
+        self._start_perf = time.perf_counter()
+        self._ended = False
+        _stack().append(self.span_id)
+
+    def set(self, **attrs):
+        """속성 추가 (예: 결과 값)"""
+        self.attrs.update(attrs)
+
+    def end(self, status: str = "ok", error: Optional[str] = None):
+        """
+        span 종료 및 기록 (여러 번 호출해도 한 번만 기록)
+
+        Args:
+            status: ok / error / fail
+            error: 오류 메시지
+        """
+        if self._ended:
+            return
+        self._ended = True
+
+        stack = _stack()
+        if self.span_id in stack:
+            del stack[stack.index(self.span_id):]
+
+        record = {
+            "job_id": self.job_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "start": round(self.start, 6),
+            "duration_ms": round((time.perf_counter() - self._start_perf) * 1000, 2),
+            "status": status,
+            "pid": os.getpid(),
+        }
+        if error:
+            record["error"] = error[:300]
+        if self.attrs:
+            record["attrs"] = self.attrs
+        _write_span(record)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.end()
+        else:
+            self.end("error", f"{exc_type.__name__}: {exc}")
+        return False
+
+
+def span(name: str, **attrs) -> Span:
+    """
+    span 시작 (with 블록 또는 end() 호출로 종료)
+
+    Args:
+        name: 단계 이름
+        **attrs: 추가 속성
+
+    Returns:
+        Span
+    """
+    return Span(name, attrs)
+
+
+def traced(name: str):
+    """
+    함수/메서드 전체를 span으로 감싸는 데코레이터
+
+    반환값이 False이면 status="fail"로 기록합니다 (성공 여부를 bool로 반환하는 메서드용).
+
+    Args:
+        name: 단계 이름
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            current = Span(name)
+            try:
+                result = func(*args, **kwargs)
+            except BaseException as e:
+                current.end("error", f"{type(e).__name__}: {e}")
+                raise
+            current.end("ok" if result is not False else "fail")
+            return result
+        return wrapper
+    return decorator
+
+
+# ============================================================
+# 조회 CLI
+# ============================================================
+def _iter_spans(trace_dir: Path, since: Optional[float] = None):
+    """
+    모든 사용자 span 파일 순회
+
+    Args:
+        trace_dir: span 파일 디렉토리
+        since: 이 시각(epoch) 이전 날짜 파일은 읽지 않음 (None이면 전체)
+    """
+    since_day = datetime.fromtimestamp(since).strftime("%Y%m%d") if since else None
+    for path in sorted(trace_dir.glob("spans_*.jsonl")):
+        day = _file_day(path)
+        if since_day and day and day < since_day:
+            continue
+        try:
+            with open(path, "r", encoding="utf-8", errors="replace") as f:
+                for line in f:
+                    try:
+                        yield json.loads(line)
+                    except ValueError:
+                        continue
+        except OSError:
+            continue
+
+
+def _percentile(values: List[float], q: float) -> float:
+    """정렬된 값의 백분위수 (nearest-rank)"""
+    if not values:
+        return 0.0
+    index = min(len(values) - 1, max(0, math.ceil(q * len(values)) - 1))
+    return values[index]
+
+
+if __name__ == "__main__":
+    import argparse
+    import re
+
+    parser = argparse.ArgumentParser(description="작업 단계별 지연 추적 조회")
+    parser.add_argument("--dir", type=str, default=Config.TRACE_DIR, help="span 파일 디렉토리")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    job_parser = sub.add_parser("job", help="작업 1건 타임라인")
+    job_parser.add_argument("job_id")
+
+    stages_parser = sub.add_parser("stages", help="단계별 지연 분포")
+    stages_parser.add_argument("--since", default="1h", help="조회 기간 (30m, 1h, 1d)")
+
+    args = parser.parse_args()
+    trace_dir = Path(args.dir)
+
+    if args.command == "job":
+        spans = sorted((s for s in _iter_spans(trace_dir) if s.get("job_id") == args.job_id),
+                       key=lambda s: s["start"])
+        if not spans:
+            print(f"작업 {args.job_id}의 span 없음")
+            sys.exit(1)
+
+        depth = {}
+        origin = spans[0]["start"]
+        for s in spans:
+            level = depth.get(s.get("parent_id"), -1) + 1
+            depth[s["span_id"]] = level
+            marker = {"ok": "✓", "fail": "✗", "error": "💥"}.get(s.get("status"), "?")
+            attrs = f"  {s['attrs']}" if s.get("attrs") else ""
+            print(f"{(s['start'] - origin):8.2f}s  {'  ' * level}{marker} {s['name']:<32} "
+                  f"{s['duration_ms'] / 1000:8.2f}s{attrs}")
+
+    elif args.command == "stages":
+        match = re.fullmatch(r"(\d+)([mhd])", args.since)
+        if not match:
+            parser.error("--since 형식: 30m, 1h, 1d")
+        since = time.time() - int(match.group(1)) * {"m": 60, "h": 3600, "d": 86400}[match.group(2)]
+
+        durations: Dict[str, List[float]] = {}
+        failures: Dict[str, int] = {}
+        for s in _iter_spans(trace_dir, since):
+            if s.get("start", 0) < since:
+                continue
+            durations.setdefault(s["name"], []).append(s["duration_ms"] / 1000)
+            if s.get("status") != "ok":
+                failures[s["name"]] = failures.get(s["name"], 0) + 1
+
+        print(f"{'단계':<32} {'건수':>6} {'실패':>5} {'p50':>8} {'p95':>8} {'최대':>8}")
+        for name, values in sorted(durations.items(), key=lambda item: -sum(item[1])):
+            values.sort()
+            print(f"{name:<32} {len(values):>6} {failures.get(name, 0):>5} "
+                  f"{_percentile(values, 0.5):>7.2f}s {_percentile(values, 0.95):>7.2f}s {values[-1]:>7.2f}s")
+        print(f"\n기준: {datetime.fromtimestamp(since).strftime('%Y-%m-%d %H:%M')} 이후")
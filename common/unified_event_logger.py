@@ -20,16 +20,32 @@ ERR_NETWORK_CHANGED 발생 시 모든 워커의 로그를 타임스탬프 기준
         interface="wg101",
         details={"server_ip": "1.2.3.4"}
     )
+
+버퍼링:
+    log_event()는 호출 시각으로 레코드를 만든 뒤 메모리 큐에만 넣고 즉시 반환합니다.
+    백그라운드 스레드가 FLUSH_INTERVAL초 또는 FLUSH_SIZE건마다 파일별로 모아 한 번에 기록하고,
+    네트워크 오류 계열 이벤트는 호출한 스레드에서 앞서 쌓인 이벤트와 함께 즉시(동기) 기록하므로
+    SIGKILL로 종료되어도 상관분석 대상 이벤트는 유실되지 않습니다.
+    프로세스 종료 시 atexit와 SIGTERM 핸들러에서 남은 이벤트를 기록합니다
+    (os._exit 전에는 flush_events() 호출).
 """
 
 import os
 import json
+import queue
+import atexit
+import signal
+import threading
 from datetime import datetime
 from enum import Enum
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, List
 from pathlib import Path
 
 
+FLUSH_INTERVAL = 0.5   # 초
+FLUSH_SIZE = 64        # 건
+
+
 class EventType(Enum):
     """이벤트 타입 정의"""
     # VPN 이벤트
@@ -125,7 +141,7 @@ def log_event(
     # 로그 파일 경로: /tmp/vpn_events_wg101.log
     log_file = f"/tmp/vpn_events_{wg_user}.log"
 
-    # 타임스탬프 (마이크로초 정밀도)
+    # 타임스탬프 (마이크로초 정밀도, 기록 시각이 아닌 호출 시각)
     timestamp = datetime.now()
     timestamp_str = timestamp.strftime("%H:%M:%S.%f")[:-3]  # 밀리초까지
     timestamp_full = timestamp.strftime("%Y-%m-%d %H:%M:%S.%f")
@@ -138,24 +154,162 @@ def log_event(
         "wg_user": wg_user,
         "event_type": event_type.value,
         "interface": interface or "N/A",
-        "details": details or {}
+        "details": dict(details) if details else {}
     }
 
-    try:
-        file_exists = os.path.exists(log_file)
+    # 직렬화/파일 기록은 백그라운드 스레드에서 수행
+    _get_writer().submit(log_file, event_record, urgent=event_type in URGENT_EVENTS)
+
+
+# 즉시 flush를 요청하는 이벤트 (ERR_NETWORK_CHANGED 상관분석 대상)
+URGENT_EVENTS = frozenset({
+    EventType.ERR_NETWORK_CHANGED,
+    EventType.NETWORK_ERROR,
+    EventType.VPN_ERROR,
+    EventType.ERROR,
+})
+
+
+class _BufferedEventWriter:
+    """큐 기반 이벤트 기록기 (파일별 일괄 O_APPEND 기록)"""
+
+    def __init__(self, flush_interval: float = FLUSH_INTERVAL, flush_size: int = FLUSH_SIZE):
+        """
+        Args:
+            flush_interval: 주기적 기록 간격(초)
+            flush_size: 이 건수가 쌓이면 주기와 무관하게 기록
+        """
+        self.flush_interval = flush_interval
+        self.flush_size = flush_size
+        self._queue: "queue.SimpleQueue" = queue.SimpleQueue()
+        self._wakeup = threading.Event()
+        self._write_lock = threading.RLock()  # SIGTERM 핸들러가 기록 중인 스레드에서 재진입할 수 있음
+        self._pending = 0
+        self._thread = threading.Thread(target=self._run, daemon=True, name="event-log-writer")
+        self._thread.start()
+
+    def submit(self, log_file: str, record: Dict[str, Any], urgent: bool = False):
+        """
+        이벤트 레코드 추가 (urgent가 아니면 블로킹 없음)
+
+        Args:
+            log_file: 기록할 파일
+            record: 이벤트 레코드
+            urgent: 호출한 스레드에서 즉시 기록 (앞서 쌓인 이벤트 포함, 순서 유지)
+        """
+        self._queue.put((log_file, record))
+        self._pending += 1  # 대략적인 건수 (정확할 필요 없음)
+        if urgent:
+            self.flush()
+        elif self._pending >= self.flush_size:
+            self._wakeup.set()
+
+    def _drain(self) -> Dict[str, List[str]]:
+        """큐에 쌓인 레코드를 파일별 JSON 줄로 변환"""
+        batches: Dict[str, List[str]] = {}
+        while True:
+            try:
+                log_file, record = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                line = json.dumps(record, ensure_ascii=False, default=str)
+            except (TypeError, ValueError):
+                continue
+            batches.setdefault(log_file, []).append(line + "\n")
+        self._pending = 0
+        return batches
+
+    def flush(self):
+        """대기 중인 이벤트를 파일별로 한 번에 기록"""
+        with self._write_lock:
+            for log_file, lines in self._drain().items():
+                try:
+                    fd = os.open(log_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o666)
+                except OSError:
+                    continue  # 로깅 실패 무시 (권한 오류 등은 정상)
+                try:
+                    try:
+                        os.fchmod(fd, 0o666)  # 모든 사용자가 쓸 수 있도록
+                    except OSError:
+                        pass
+                    os.write(fd, "".join(lines).encode("utf-8"))
+                except OSError:
+                    pass
+                finally:
+                    os.close(fd)
+
+    def _run(self):
+        """주기적 flush (daemon 스레드)"""
+        while True:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            self.flush()
+
 
-        # 파일이 없으면 생성 (append 모드)
-        with open(log_file, 'a') as f:
-            f.write(json.dumps(event_record, ensure_ascii=False) + "\n")
+_writer: Optional[_BufferedEventWriter] = None
+_writer_lock = threading.Lock()
 
-        # 파일이 새로 생성되었으면 666 권한 설정 (모든 사용자가 쓸 수 있음)
-        if not file_exists:
-            os.chmod(log_file, 0o666)
-    except Exception as e:
-        # 로깅 실패 무시 (권한 오류 등은 정상)
+
+def _get_writer() -> _BufferedEventWriter:
+    """프로세스 공용 기록기 (첫 이벤트에서 생성)"""
+    global _writer
+    if _writer is None:
+        with _writer_lock:
+            if _writer is None:
+                _writer = _BufferedEventWriter()
+                _install_sigterm_flush()
+    return _writer
+
+
+def flush_events():
+    """대기 중인 이벤트 즉시 기록 (atexit 및 os._exit 직전 호출용)"""
+    if _writer is not None:
+        _writer.flush()
+
+
+_previous_sigterm = None
+
+
+def _on_sigterm(signum, frame):
+    """SIGTERM 수신 시 남은 이벤트를 기록한 뒤 기존 처리로 넘김"""
+    flush_events()
+    previous = _previous_sigterm
+    if callable(previous):
+        previous(signum, frame)
+    elif previous != signal.SIG_IGN:
+        # 기본 동작(종료) 복원 후 같은 시그널로 다시 종료
+        signal.signal(signum, signal.SIG_DFL)
+        os.kill(os.getpid(), signum)
+
+
+def _install_sigterm_flush():
+    """SIGTERM 핸들러 등록 (메인 스레드에서만 가능, 실패 시 atexit에만 의존)"""
+    global _previous_sigterm
+    if threading.current_thread() is not threading.main_thread():
+        return
+    try:
+        current = signal.getsignal(signal.SIGTERM)
+        if current is _on_sigterm:
+            return
+        signal.signal(signal.SIGTERM, _on_sigterm)
+        _previous_sigterm = current
+    except (ValueError, OSError):
         pass
 
 
+def _reset_after_fork():
+    """fork된 자식은 기록 스레드가 없으므로 새 기록기를 만들도록 초기화"""
+    global _writer, _writer_lock
+    _writer = None
+    _writer_lock = threading.Lock()
+
+
+atexit.register(flush_events)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
 # 편의 함수: get_instance() 호환성 유지 (사용되지 않음)
 class UnifiedEventLogger:
     """더미 클래스 (하위 호환성)"""
@@ -79,6 +79,9 @@ def cleanup_screenshots(
     """
     스크린샷 디렉토리 정리
 
+    스크린샷 옆에 저장된 작업별 프로파일(*.profile.*, --profile)도 같은 작업 수만큼 유지합니다.
+    (작업 1건당 pstats/collapsed + json 2개)
+
     Args:
         base_dir: 스크린샷 기본 디렉토리
         keep_count: 유지할 파일 개수
@@ -86,13 +89,21 @@ def cleanup_screenshots(
     Returns:
         삭제된 파일 개수
     """
-    return cleanup_old_files(
+    deleted = cleanup_old_files(
         directory=base_dir,
         keep_count=keep_count,
         file_pattern="*.png",
         recursive=True,
         dry_run=False
     )
+    deleted += cleanup_old_files(
+        directory=base_dir,
+        keep_count=keep_count * 2,
+        file_pattern="*.profile.*",
+        recursive=True,
+        dry_run=False
+    )
+    return deleted
 
 
 def cleanup_debug_logs(
@@ -3,26 +3,75 @@
 키워드별 사이클 로거
 
 각 키워드마다 별도의 로그 파일을 생성하고 최신 50개만 유지합니다.
+
+- 기록: O_APPEND로 한 줄씩 추가 (기존 파일을 읽거나 다시 쓰지 않음)
+  여러 워커가 같은 키워드에 동시에 기록해도 줄 단위로 원자적이라 유실 없음
+- 정리(compaction): 파일이 COMPACT_BYTES를 넘으면 파일 잠금 후 최신 MAX_ENTRIES개만 남기고 교체
+  (compact_all()로 주기적 정리도 가능)
+- 조회: 파일 끝에서부터 필요한 줄만 역방향으로 읽음
 """
 
+import os
 import json
+import fcntl
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, List
+
+
+MAX_ENTRIES = 50              # 키워드별 보관 개수
+COMPACT_BYTES = 128 * 1024    # 이 크기를 넘으면 기록 직후 정리
+TAIL_BLOCK_SIZE = 8192
+
+
+def _tail_lines(path: Path, count: int) -> List[bytes]:
+    """
+    파일 끝에서 마지막 count개 줄 읽기
+
+    Args:
+        path: 파일 경로
+        count: 줄 개수
+
+    Returns:
+        줄 리스트 (오래된 것 → 최신 순, 빈 줄 제외)
+    """
+    with open(path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        position = f.tell()
+        data = b""
+        # 마지막 줄 앞의 줄바꿈까지 포함해 count+1개 구분자를 찾을 때까지 역방향 읽기
+        while position > 0 and data.count(b"\n") <= count:
+            read_size = min(TAIL_BLOCK_SIZE, position)
+            position -= read_size
+            f.seek(position)
+            data = f.read(read_size) + data
+
+    lines = [line for line in data.split(b"\n") if line.strip()]
+    if position > 0:
+        lines = lines[1:]  # 블록 경계에서 잘린 첫 줄
+    return lines[-count:] if count > 0 else []
 
 
 class KeywordLogger:
     """키워드별 사이클 로그 관리"""
 
-    def __init__(self, base_dir: str = "/home/tech/rank_screenshot/logs/keyword_cycles"):
+    def __init__(
+        self,
+        base_dir: str = "/home/tech/rank_screenshot/logs/keyword_cycles",
+        max_entries: int = MAX_ENTRIES,
+        compact_bytes: int = COMPACT_BYTES
+    ):
         """
         Args:
             base_dir: 로그 파일 저장 디렉토리
+            max_entries: 키워드별 보관 개수 (정리 시 기준)
+            compact_bytes: 정리를 시작하는 파일 크기
         """
         self.base_dir = Path(base_dir)
+        self.max_entries = max_entries
+        self.compact_bytes = compact_bytes
 
         # umask를 일시적으로 0으로 설정하여 777 권한으로 디렉토리 생성
-        import os
         old_umask = os.umask(0)
         try:
             self.base_dir.mkdir(parents=True, mode=0o777, exist_ok=True)
@@ -83,31 +132,109 @@ class KeywordLogger:
             "keyword": keyword,
             **cycle_data
         }
+        line = (json.dumps(log_entry, ensure_ascii=False) + '\n').encode('utf-8')
 
-        # 기존 로그 읽기
-        existing_logs = []
-        if log_file.exists():
+        try:
+            size = self._append_line(log_file, line)
+        except Exception as e:
+            print(f"⚠️  로그 저장 실패: {e}")
+            return
+
+        # 크기 초과 시 최신 max_entries개만 남기고 정리
+        if size > self.compact_bytes:
+            self.compact(keyword)
+
+    def _append_line(self, log_file: Path, line: bytes) -> int:
+        """
+        한 줄 추가 (O_APPEND 단일 write)
+
+        정리 중인 파일에 쓰지 않도록 공유 잠금을 잡고,
+        잠금 대기 중 파일이 교체됐으면 새 파일로 다시 엽니다.
+
+        Args:
+            log_file: 로그 파일 경로
+            line: 줄바꿈 포함 JSON 한 줄
+
+        Returns:
+            기록 후 파일 크기
+        """
+        while True:
+            fd = os.open(str(log_file), os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o666)
             try:
-                with open(log_file, 'r', encoding='utf-8') as f:
-                    existing_logs = [json.loads(line) for line in f if line.strip()]
-            except Exception as e:
-                print(f"⚠️  기존 로그 읽기 실패: {e}")
-                existing_logs = []
+                fcntl.flock(fd, fcntl.LOCK_SH)
+                try:
+                    if os.fstat(fd).st_ino != os.stat(log_file).st_ino:
+                        continue  # 정리로 교체된 이전 파일
+                except FileNotFoundError:
+                    continue
+
+                try:
+                    os.fchmod(fd, 0o666)  # 다른 wg 사용자도 기록 가능
+                except OSError:
+                    pass
+                os.write(fd, line)
+                return os.fstat(fd).st_size
+            finally:
+                os.close(fd)
+
+    def compact(self, keyword: str) -> int:
+        """
+        로그 파일을 최신 max_entries개로 정리 (파일 잠금 후 임시 파일 → rename)
 
-        # 새 로그 추가
-        existing_logs.append(log_entry)
+        Args:
+            keyword: 검색 키워드
 
-        # 최신 50개만 유지
-        if len(existing_logs) > 50:
-            existing_logs = existing_logs[-50:]
+        Returns:
+            정리 후 남은 로그 개수 (정리하지 않았으면 -1)
+        """
+        log_file = self._get_log_file(keyword)
+        try:
+            fd = os.open(str(log_file), os.O_RDONLY)
+        except FileNotFoundError:
+            return -1
 
-        # 로그 파일 쓰기
         try:
-            with open(log_file, 'w', encoding='utf-8') as f:
-                for log in existing_logs:
-                    f.write(json.dumps(log, ensure_ascii=False) + '\n')
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            try:
+                if os.fstat(fd).st_ino != os.stat(log_file).st_ino:
+                    return -1  # 다른 워커가 이미 정리함
+            except FileNotFoundError:
+                return -1
+
+            lines = _tail_lines(log_file, self.max_entries)
+            tmp_file = log_file.with_name(f".{log_file.name}.{os.getpid()}.tmp")
+            with open(tmp_file, 'wb') as f:
+                for line in lines:
+                    f.write(line + b'\n')
+            try:
+                os.chmod(tmp_file, 0o666)
+            except OSError:
+                pass
+            os.replace(tmp_file, log_file)
+            return len(lines)
         except Exception as e:
-            print(f"⚠️  로그 저장 실패: {e}")
+            print(f"⚠️  로그 정리 실패 ({log_file.name}): {e}")
+            return -1
+        finally:
+            os.close(fd)
+
+    def compact_all(self) -> int:
+        """
+        크기 기준을 넘은 모든 키워드 로그 정리 (주기 작업용)
+
+        Returns:
+            정리한 파일 수
+        """
+        compacted = 0
+        for log_file in self.base_dir.glob("*.jsonl"):
+            try:
+                if log_file.stat().st_size <= self.compact_bytes:
+                    continue
+            except OSError:
+                continue
+            if self.compact(log_file.stem) >= 0:
+                compacted += 1
+        return compacted
 
     def get_recent_logs(self, keyword: str, limit: int = 10) -> list:
         """
@@ -126,9 +253,13 @@ class KeywordLogger:
             return []
 
         try:
-            with open(log_file, 'r', encoding='utf-8') as f:
-                logs = [json.loads(line) for line in f if line.strip()]
-            return logs[-limit:]
+            logs = []
+            for line in _tail_lines(log_file, limit):
+                try:
+                    logs.append(json.loads(line))
+                except ValueError:
+                    continue  # 기록 중 잘린 줄
+            return logs
         except Exception as e:
             print(f"⚠️  로그 조회 실패: {e}")
             return []
@@ -143,7 +274,7 @@ class KeywordLogger:
         Returns:
             통계 정보 (성공률, 평균 실행시간 등)
         """
-        logs = self.get_recent_logs(keyword, limit=50)
+        logs = self.get_recent_logs(keyword, limit=self.max_entries)
 
         if not logs:
             return None
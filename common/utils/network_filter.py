@@ -2,12 +2,46 @@
 네트워크 필터 모듈
 
 쿠팡 메인 페이지 최적화를 위한 광고/트래킹 차단
+
+판정 구조:
+- 차단 도메인 + 차단 패턴 / 화이트리스트 / 콘솔 필터: 각각 하나의 정규식 alternation으로 미리 컴파일
+  (도메인은 기존 ".*domain.*"과 같은 의미인 이스케이프 문자열 검색, URL 전체 대상)
+- should_block() 판정 결과는 패턴별 개별 검사와 동일 (test_network_filter.py에서 비교)
+- RequestInterceptor: CDP Fetch.requestPaused에서 요청마다 should_block() 적용
+  (BrowserCoreUC.enable_request_interception()으로 명시적으로 켤 때만 사용)
 """
 
 import json
 import re
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Optional
+
+
+class _PatternSet:
+    """정규식 리스트를 하나의 alternation으로 검색 (합칠 수 없는 패턴이면 개별 검색)"""
+
+    def __init__(self, patterns: List[str]):
+        """
+        Args:
+            patterns: 정규식 문자열 리스트 (모두 IGNORECASE)
+        """
+        self.combined = None
+        self.separate = []
+        if not patterns:
+            return
+        try:
+            # 역참조(\1 등)는 alternation 안에서 그룹 번호가 바뀌므로 개별 컴파일
+            if any(re.search(r"\\[1-9]|\(\?P=", p) for p in patterns):
+                raise re.error("backreference")
+            self.combined = re.compile("|".join(f"(?:{p})" for p in patterns), re.IGNORECASE)
+        except re.error:
+            self.separate = [re.compile(p, re.IGNORECASE) for p in patterns]
+
+    def search(self, text: str) -> bool:
+        """하나라도 일치하면 True"""
+        if self.combined is not None:
+            return self.combined.search(text) is not None
+        return any(pattern.search(text) for pattern in self.separate)
 
 
 class NetworkFilter:
@@ -17,6 +51,8 @@ class NetworkFilter:
         self.config_path = Path(__file__).parent.parent.parent / config_path
         self.config = self.load_config()
         self.blocked_patterns = self._compile_patterns()
+        self.whitelist_patterns = _PatternSet(self.config['domain_whitelist']['domains'])
+        self.console_only_patterns = _PatternSet(self.config['console_only_filters']['patterns'])
 
     def load_config(self) -> Dict:
         """필터 설정 로드"""
@@ -31,30 +67,15 @@ class NetworkFilter:
         with open(self.config_path, 'r', encoding='utf-8') as f:
             return json.load(f)
 
-    def _compile_patterns(self) -> List:
-        """차단 패턴을 정규표현식으로 컴파일"""
-        patterns = []
-
-        # full_filters 도메인을 패턴으로 변환
-        for domain in self.config['full_filters']['domains']:
-            # domain.com → .*domain\.com.*
-            pattern = f".*{re.escape(domain)}.*"
-            patterns.append(re.compile(pattern, re.IGNORECASE))
-
-        # full_filters 패턴 추가
-        for pattern_str in self.config['full_filters']['patterns']:
-            patterns.append(re.compile(pattern_str, re.IGNORECASE))
-
-        return patterns
+    def _compile_patterns(self) -> _PatternSet:
+        """차단 도메인(문자열 그대로 검색) + 차단 패턴을 하나로 컴파일"""
+        patterns = [re.escape(domain) for domain in self.config['full_filters']['domains']]
+        patterns.extend(self.config['full_filters']['patterns'])
+        return _PatternSet(patterns)
 
     def is_whitelisted_domain(self, url: str) -> bool:
-        """화이트리스트 도메인 체크"""
-        whitelist = self.config['domain_whitelist']['domains']
-        for domain in whitelist:
-            # 정규표현식 패턴 지원 (예: image[0-9]*.coupangcdn.com)
-            if re.search(domain, url, re.IGNORECASE):
-                return True
-        return False
+        """화이트리스트 도메인 체크 (정규식 패턴 지원, 예: image[0-9]*.coupangcdn.com)"""
+        return self.whitelist_patterns.search(url)
 
     def should_block(self, url: str) -> bool:
         """
@@ -66,33 +87,22 @@ class NetworkFilter:
         Returns:
             True: 차단, False: 허용
         """
+        # 차단 도메인/패턴은 화이트리스트 도메인에도 적용 (예: coupang.com/ad/*, coupang.com/tracking/*)
+        if self.blocked_patterns.search(url):
+            return True
+
         # 화이트리스트 도메인이면 허용
         if self.is_whitelisted_domain(url):
-            # 화이트리스트 도메인이더라도 특정 패턴은 차단
-            # 예: coupang.com/ad/*, coupang.com/tracking/*
-            for pattern in self.blocked_patterns:
-                if pattern.search(url):
-                    return True
             return False
 
-        # 화이트리스트가 아니면 차단 패턴 확인
-        for pattern in self.blocked_patterns:
-            if pattern.search(url):
-                return True
-
         # 기본: 외부 도메인은 차단
         # coupang.com 관련 도메인이 아니면 모두 차단
-        if not ('coupang' in url.lower() or 'localhost' in url.lower()):
-            return True
-
-        return False
+        lowered = url.lower()
+        return not ('coupang' in lowered or 'localhost' in lowered)
 
     def should_filter_console_only(self, url: str) -> bool:
         """콘솔 전용 필터 (로그에는 기록, 콘솔에는 출력 안 함)"""
-        for pattern in self.config['console_only_filters']['patterns']:
-            if re.search(pattern, url, re.IGNORECASE):
-                return True
-        return False
+        return self.console_only_patterns.search(url)
 
     def get_blocked_url_patterns(self) -> List[str]:
         """
@@ -136,3 +146,122 @@ class NetworkFilter:
         print(f"   - 차단 패턴: {len(self.config['full_filters']['patterns'])}개")
         print(f"   - 화이트리스트: {len(self.config['domain_whitelist']['domains'])}개")
         print(f"   - 콘솔 필터: {len(self.config['console_only_filters']['patterns'])}개\n")
+
+
+class RequestInterceptor:
+    """
+    CDP Fetch.requestPaused 기반 요청 단위 필터
+
+    --host-rules와 달리 런타임에 켜고 끌 수 있으며, 요청마다 NetworkFilter.should_block()으로
+    판정해 Fetch.failRequest(BlockedByClient) 또는 Fetch.continueRequest로 응답합니다.
+
+    blocked_resource_types를 지정하면 해당 리소스 타입(Media, Font 등)은 URL과 무관하게 차단합니다.
+    Fetch.enable은 세션당 하나의 패턴 집합만 유지하므로 두 기능을 하나의 인스턴스에서 처리합니다.
+    """
+
+    def __init__(
+        self,
+        session,
+        network_filter: Optional[NetworkFilter] = None,
+        resource_types: Optional[List[str]] = None,
+        blocked_resource_types: Optional[List[str]] = None
+    ):
+        """
+        Args:
+            session: CDPSession (uc_lib.core.cdp_session)
+            network_filter: URL 판정에 사용할 NetworkFilter (None이면 리소스 타입 차단만)
+            resource_types: network_filter를 적용할 리소스 타입 (예: ["Script", "XHR"], None이면 전체)
+            blocked_resource_types: 무조건 차단할 리소스 타입 (예: ["Media", "Font"])
+        """
+        self.session = session
+        self.network_filter = network_filter
+        self.resource_types = resource_types
+        self.blocked_resource_types = set(blocked_resource_types or [])
+        self.active = False
+
+        # 통계
+        self.blocked_count = 0
+        self.allowed_count = 0
+
+    def start(self) -> bool:
+        """
+        요청 가로채기 시작
+
+        Returns:
+            성공 여부
+        """
+        if self.active:
+            return True
+
+        if self.network_filter and not self.resource_types:
+            patterns = [{'urlPattern': '*', 'requestStage': 'Request'}]
+        else:
+            # 필요한 리소스 타입만 가로채기 (나머지 요청은 일시정지 없이 진행)
+            rtypes = set(self.blocked_resource_types)
+            if self.network_filter:
+                rtypes.update(self.resource_types)
+            patterns = [
+                {'urlPattern': '*', 'resourceType': rtype, 'requestStage': 'Request'}
+                for rtype in sorted(rtypes)
+            ]
+
+        if not patterns:
+            return False
+
+        self.session.on('Fetch.requestPaused', self._on_request_paused)
+        try:
+            self.session.send('Fetch.enable', {'patterns': patterns})
+        except Exception as e:
+            self.session.off('Fetch.requestPaused', self._on_request_paused)
+            print(f"   ⚠️  요청 가로채기 시작 실패: {e}")
+            return False
+
+        self.active = True
+        return True
+
+    def stop(self):
+        """요청 가로채기 중지"""
+        if not self.active:
+            return
+
+        self.active = False
+        try:
+            self.session.send('Fetch.disable')
+        except Exception:
+            pass
+        self.session.off('Fetch.requestPaused', self._on_request_paused)
+
+    def _on_request_paused(self, params: Dict):
+        """
+        Fetch.requestPaused 콜백 (CDP 수신 스레드 → 응답은 기다리지 않음)
+
+        Args:
+            params: 이벤트 파라미터
+        """
+        request_id = params.get('requestId')
+        url = params.get('request', {}).get('url', '')
+
+        if params.get('resourceType') in self.blocked_resource_types:
+            blocked = True
+        elif url.startswith(('data:', 'blob:', 'chrome')) or not self.network_filter:
+            blocked = False
+        else:
+            blocked = self.network_filter.should_block(url)
+
+        if not blocked:
+            self.allowed_count += 1
+            self.session.send_nowait('Fetch.continueRequest', {'requestId': request_id})
+        else:
+            self.blocked_count += 1
+            self.session.send_nowait('Fetch.failRequest', {
+                'requestId': request_id,
+                'errorReason': 'BlockedByClient'
+            })
+
+    def get_stats(self) -> Dict:
+        """가로채기 통계"""
+        return {
+            'active': self.active,
+            'blocked': self.blocked_count,
+            'allowed': self.allowed_count
+        }
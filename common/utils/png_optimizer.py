@@ -0,0 +1,401 @@
+#!/usr/bin/env python3
+"""
+스크린샷 PNG 재압축 유틸리티
+screenshots/ 아래 보관된 Selenium 원본 PNG(1~3MB)를 캡처 경로와 분리해서 재압축
+
+모드:
+- lossless: 무손실 최대 압축 (zopfli 설치 시 zopfli, 아니면 Pillow optimize)
+- palette:  256색 팔레트 양자화 (손실, 가장 작음)
+
+업로드가 끝난 파일만 대상으로 하며(min_age), 수정 시간은 보존하므로
+cleanup_screenshots()의 최신 N개 유지 정책에 영향을 주지 않습니다.
+
+사용법:
+    python3 -m common.utils.png_optimizer                    # screenshots/ 재압축
+    python3 -m common.utils.png_optimizer --mode palette -w 4
+    python3 -m common.utils.png_optimizer --benchmark        # 인코딩 시간 vs 크기 비교
+"""
+
+import io
+import os
+import json
+import time
+import threading
+import multiprocessing
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional, Dict, Any, List
+import logging
+
+try:
+    from PIL import Image
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
+try:
+    from zopfli.png import optimize as zopfli_optimize_png
+    ZOPFLI_AVAILABLE = True
+except ImportError:
+    ZOPFLI_AVAILABLE = False
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SCREENSHOTS_DIR = Path(__file__).parent.parent.parent / "screenshots"
+
+# 이미 처리한 파일 기록 (상대 경로 → 처리 후 크기)
+STATE_FILENAME = ".png_optimized.json"
+
+MODES = ("lossless", "palette")
+
+
+def encode_png(img, mode: str = "lossless") -> bytes:
+    """
+    이미지를 지정 모드로 PNG 인코딩
+
+    Args:
+        img: PIL Image
+        mode: "lossless" 또는 "palette"
+
+    Returns:
+        PNG 바이트
+    """
+    buffer = io.BytesIO()
+
+    if mode == "palette":
+        quantized = img.convert("RGB").quantize(
+            colors=256, method=Image.Quantize.FASTOCTREE, dither=Image.Dither.NONE
+        )
+        quantized.save(buffer, format="PNG", optimize=True)
+        return buffer.getvalue()
+
+    img.save(buffer, format="PNG", optimize=True)
+    data = buffer.getvalue()
+
+    if ZOPFLI_AVAILABLE:
+        data = zopfli_optimize_png(data)
+
+    return data
+
+
+def optimize_png(filepath: str, mode: str = "lossless") -> Dict[str, Any]:
+    """
+    PNG 파일 하나를 재압축 (더 작아질 때만 교체)
+
+    Args:
+        filepath: PNG 파일 경로
+        mode: "lossless" 또는 "palette"
+
+    Returns:
+        {"path", "before", "after", "elapsed", "replaced", "error"}
+    """
+    result = {"path": str(filepath), "before": 0, "after": 0, "elapsed": 0.0, "replaced": False, "error": None}
+    started = time.time()
+
+    try:
+        path = Path(filepath)
+        st = path.stat()
+        result["before"] = result["after"] = st.st_size
+
+        with Image.open(path) as img:
+            img.load()
+            data = encode_png(img, mode)
+
+        if len(data) < st.st_size:
+            # 같은 디렉토리 임시 파일 → rename (원자적 교체), 권한/수정시간 보존
+            tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.chmod(tmp_path, st.st_mode & 0o777)
+            os.utime(tmp_path, ns=(st.st_atime_ns, st.st_mtime_ns))
+            os.replace(tmp_path, path)
+
+            result["after"] = len(data)
+            result["replaced"] = True
+
+    except Exception as e:
+        result["error"] = str(e)
+
+    result["elapsed"] = time.time() - started
+    return result
+
+
+def _lower_priority():
+    """워커 프로세스 우선순위 낮춤 (브라우저 작업 방해 최소화)"""
+    try:
+        os.nice(10)
+    except OSError:
+        pass
+
+
+def _create_pool(workers: int) -> ProcessPoolExecutor:
+    """
+    재압축 프로세스 풀 생성 (forkserver, 없으면 spawn)
+
+    멀티스레드 러너에서 fork하면 다른 스레드가 잡고 있던 lock을 자식이 물려받아 멈출 수 있으므로
+    깨끗한 forkserver 프로세스에서 워커를 만듭니다.
+    """
+    method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    return ProcessPoolExecutor(max_workers=workers, initializer=_lower_priority,
+                               mp_context=multiprocessing.get_context(method))
+
+
+def _load_state(base_dir: Path) -> Dict[str, int]:
+    try:
+        with open(base_dir / STATE_FILENAME, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def _save_state(base_dir: Path, state: Dict[str, int]):
+    state_path = base_dir / STATE_FILENAME
+    tmp_path = state_path.with_name(f"{STATE_FILENAME}.{os.getpid()}.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(state, f)
+    try:
+        os.chmod(tmp_path, 0o666)
+    except OSError:
+        pass
+    os.replace(tmp_path, state_path)
+
+
+def optimize_directory(
+    base_dir: Path = DEFAULT_SCREENSHOTS_DIR,
+    mode: str = "lossless",
+    workers: int = 2,
+    min_age: float = 60.0,
+    verbose: bool = True,
+    executor: Optional[ProcessPoolExecutor] = None
+) -> Dict[str, Any]:
+    """
+    디렉토리 아래 PNG를 프로세스 풀로 재압축
+
+    Args:
+        base_dir: 대상 디렉토리 (기본: screenshots/)
+        mode: "lossless" 또는 "palette"
+        workers: 프로세스 수 (기본: 2, executor 지정 시 무시)
+        min_age: 최소 경과 시간(초) - 캡처/오버레이/업로드 중인 파일 제외 (기본: 60)
+        verbose: 결과 출력 여부
+        executor: 재사용할 프로세스 풀 (None이면 이번 실행용 풀 생성 후 종료)
+
+    Returns:
+        {"files", "replaced", "errors", "before", "after", "saved", "elapsed"}
+    """
+    summary = {"files": 0, "replaced": 0, "errors": 0, "before": 0, "after": 0, "saved": 0, "elapsed": 0.0}
+
+    if not PIL_AVAILABLE:
+        logger.warning("Pillow 미설치 - PNG 재압축 불가")
+        return summary
+
+    base_dir = Path(base_dir)
+    if not base_dir.exists():
+        return summary
+
+    started = time.time()
+    state = _load_state(base_dir)
+    now = time.time()
+
+    targets: List[Path] = []
+    for path in base_dir.rglob("*.png"):
+        try:
+            st = path.stat()
+        except OSError:
+            continue
+        if now - st.st_mtime < min_age:
+            continue
+        if state.get(str(path.relative_to(base_dir))) == st.st_size:
+            continue  # 이미 처리됨
+        targets.append(path)
+
+    if not targets:
+        return summary
+
+    if executor is not None:
+        results = list(executor.map(optimize_png, targets, [mode] * len(targets), chunksize=4))
+    else:
+        with _create_pool(workers) as pool:
+            results = list(pool.map(optimize_png, targets, [mode] * len(targets), chunksize=4))
+
+    for result in results:
+        summary["files"] += 1
+        if result["error"]:
+            summary["errors"] += 1
+            logger.warning(f"재압축 실패 ({result['path']}): {result['error']}")
+            continue
+
+        summary["before"] += result["before"]
+        summary["after"] += result["after"]
+        if result["replaced"]:
+            summary["replaced"] += 1
+        state[str(Path(result["path"]).relative_to(base_dir))] = result["after"]
+
+    # 삭제된 파일 기록 정리
+    state = {rel: size for rel, size in state.items() if (base_dir / rel).exists()}
+    try:
+        _save_state(base_dir, state)
+    except OSError as e:
+        logger.warning(f"재압축 상태 저장 실패: {e}")
+
+    summary["saved"] = summary["before"] - summary["after"]
+    summary["elapsed"] = time.time() - started
+
+    if verbose:
+        ratio = (summary["saved"] / summary["before"] * 100) if summary["before"] else 0
+        print(f"🗜️  PNG 재압축 ({mode}): {summary['replaced']}/{summary['files']}개 교체, "
+              f"{summary['before'] / 1024 / 1024:.1f}MB → {summary['after'] / 1024 / 1024:.1f}MB "
+              f"({ratio:.1f}% 절감, {summary['elapsed']:.1f}초)")
+
+    return summary
+
+
+def start_background_optimizer(
+    base_dir: Path = DEFAULT_SCREENSHOTS_DIR,
+    mode: str = "lossless",
+    workers: int = 2,
+    interval: float = 300.0
+) -> threading.Thread:
+    """
+    주기적으로 optimize_directory()를 실행하는 데몬 스레드 시작 (프로세스 풀은 한 번만 생성해서 재사용)
+
+    Args:
+        base_dir: 대상 디렉토리
+        mode: "lossless" 또는 "palette"
+        workers: 프로세스 수
+        interval: 실행 간격(초) (기본: 300)
+
+    Returns:
+        시작된 스레드
+    """
+    executor = _create_pool(workers)
+
+    def _loop():
+        nonlocal executor
+        while True:
+            time.sleep(interval)
+            try:
+                optimize_directory(base_dir, mode=mode, executor=executor)
+            except BrokenProcessPool as e:
+                # 워커 프로세스가 비정상 종료되면 풀을 새로 만듦
+                print(f"⚠️  PNG 재압축 오류: {e} - 프로세스 풀 재생성")
+                executor.shutdown(wait=False)
+                executor = _create_pool(workers)
+            except Exception as e:
+                print(f"⚠️  PNG 재압축 오류: {e}")
+
+    thread = threading.Thread(target=_loop, name="PNGOptimizer", daemon=True)
+    thread.start()
+    return thread
+
+
+def _find_sample(base_dir: Path) -> Optional[Path]:
+    """벤치마크용 최신 스크린샷 찾기"""
+    candidates = list(base_dir.rglob("*.png")) if base_dir.exists() else []
+    if not candidates:
+        return None
+    return max(candidates, key=lambda p: p.stat().st_mtime)
+
+
+def _synthetic_sample():
+    """스크린샷이 없을 때 사용할 1300x1200 합성 이미지 (상품 목록 유사 패턴)"""
+    from PIL import ImageDraw
+
+    img = Image.new("RGB", (1300, 1200), (255, 255, 255))
+    draw = ImageDraw.Draw(img)
+    for row in range(5):
+        for col in range(4):
+            x, y = 40 + col * 310, 40 + row * 230
+            for i in range(180):
+                draw.line([(x, y + i), (x + 180, y + i)], fill=((col * 60 + i) % 256, (row * 50 + i) % 256, 180))
+            draw.text((x + 190, y + 10), f"상품 {row * 4 + col + 1}", fill=(33, 33, 33))
+            draw.text((x + 190, y + 40), "12,900원", fill=(174, 0, 0))
+    return img
+
+
+def benchmark(sample: Optional[str] = None, runs: int = 3) -> List[Dict[str, Any]]:
+    """
+    인코딩 설정별 시간/크기 비교
+
+    Args:
+        sample: 샘플 PNG 경로 (없으면 최신 스크린샷, 그것도 없으면 합성 이미지)
+        runs: 설정별 반복 횟수 (중앙값 사용)
+
+    Returns:
+        [{"name", "size", "ms"}, ...]
+    """
+    if not PIL_AVAILABLE:
+        print("❌ Pillow 미설치")
+        return []
+
+    sample_path = Path(sample) if sample else _find_sample(DEFAULT_SCREENSHOTS_DIR)
+    if sample_path:
+        img = Image.open(sample_path)
+        img.load()
+        original_size = sample_path.stat().st_size
+        source = str(sample_path)
+    else:
+        img = _synthetic_sample()
+        original_size = None
+        source = "합성 이미지"
+
+    def _save(**kwargs):
+        buffer = io.BytesIO()
+        img.save(buffer, format="PNG", **kwargs)
+        return buffer.getvalue()
+
+    cases = [
+        ("compress_level=1", lambda: _save(compress_level=1)),
+        ("compress_level=6 (기본)", lambda: _save(compress_level=6)),
+        ("compress_level=9", lambda: _save(compress_level=9)),
+        ("optimize=True", lambda: _save(optimize=True)),
+        ("palette 256", lambda: encode_png(img, "palette")),
+    ]
+    if ZOPFLI_AVAILABLE:
+        cases.append(("optimize+zopfli", lambda: encode_png(img, "lossless")))
+
+    print(f"\n📊 PNG 인코딩 벤치마크")
+    print(f"   샘플: {source} ({img.size[0]}x{img.size[1]}, {img.mode})")
+    if original_size:
+        print(f"   원본: {original_size / 1024:.1f} KB")
+    print(f"   {'설정':<24} {'크기(KB)':>10} {'시간(ms)':>10} {'원본 대비':>10}")
+
+    results = []
+    for name, encode in cases:
+        timings = []
+        for _ in range(runs):
+            started = time.perf_counter()
+            data = encode()
+            timings.append((time.perf_counter() - started) * 1000)
+        timings.sort()
+        entry = {"name": name, "size": len(data), "ms": timings[len(timings) // 2]}
+        results.append(entry)
+
+        ratio = f"{entry['size'] / original_size * 100:.0f}%" if original_size else "-"
+        print(f"   {name:<24} {entry['size'] / 1024:>10.1f} {entry['ms']:>10.0f} {ratio:>10}")
+
+    if not ZOPFLI_AVAILABLE:
+        print("   (zopfli 미설치 - 'pip install zopfli' 시 optimize+zopfli 항목 추가)")
+
+    return results
+
+
+if __name__ == "__main__":
+    import argparse
+
+    logging.basicConfig(level=logging.INFO)
+
+    parser = argparse.ArgumentParser(description="스크린샷 PNG 재압축")
+    parser.add_argument("--dir", type=str, default=str(DEFAULT_SCREENSHOTS_DIR), help="대상 디렉토리")
+    parser.add_argument("--mode", choices=MODES, default="lossless", help="압축 모드 (기본: lossless)")
+    parser.add_argument("-w", "--workers", type=int, default=2, help="프로세스 수 (기본: 2)")
+    parser.add_argument("--min-age", type=float, default=60.0, help="최소 경과 시간(초) (기본: 60)")
+    parser.add_argument("--benchmark", action="store_true", help="인코딩 시간 vs 크기 벤치마크")
+    parser.add_argument("--sample", type=str, default=None, help="벤치마크 샘플 PNG")
+    args = parser.parse_args()
+
+    if args.benchmark:
+        benchmark(args.sample)
+    else:
+        optimize_directory(Path(args.dir), mode=args.mode, workers=args.workers, min_age=args.min_age)
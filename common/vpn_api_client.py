@@ -15,6 +15,9 @@ from pathlib import Path
 # VPN 연결 추적 모듈
 from .vpn_connection_tracker import get_vpn_tracker
 
+# 단계별 지연 추적
+from .tracing import traced
+
 # 통합 이벤트 로거 import
 try:
     from .unified_event_logger import log_event, EventType
@@ -221,6 +224,7 @@ class VPNConnection:
         self.config_path = None
         self.vpn_key_data = None
 
+    @traced("vpn.connect")
     def connect(self, server_ip: Optional[str] = None) -> bool:
         """
         VPN 연결 (키 할당 + WireGuard 시작)
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+네트워크 필터 판정 비교 테스트
+컴파일된 NetworkFilter.should_block()이 기존(패턴별 개별 검사) 판정과 같은지 URL 묶음으로 확인
+
+실행:
+    python3 test_network_filter.py
+    python3 -m pytest test_network_filter.py
+"""
+
+import re
+import sys
+import json
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+from common.utils.network_filter import NetworkFilter
+
+
+# 실제 설정과 같은 형태의 필터 설정 (도메인, 정규식 패턴, 화이트리스트 정규식)
+FILTER_CONFIG = {
+    "console_only_filters": {"patterns": [r"/log\.gif", r"ljc\.coupang\.com"]},
+    "full_filters": {
+        "domains": [
+            "google-analytics.com",
+            "googletagmanager.com",
+            "doubleclick.net",
+            "facebook.net",
+            "criteo.com",
+            "ads.coupang.com",
+        ],
+        "patterns": [
+            r"/ad/",
+            r"/tracking/",
+            r"/gtm\.js",
+            r"/banner/",
+            r"pixel\?",
+        ],
+    },
+    "domain_whitelist": {
+        "domains": [
+            r"coupang\.com",
+            r"image[0-9]*\.coupangcdn\.com",
+            r"static\.coupangcdn\.com",
+            r"thumbnail[0-9]*\.coupangcdn\.com",
+        ]
+    },
+}
+
+URL_CORPUS = [
+    # 쿠팡 본 도메인
+    "https://www.coupang.com/",
+    "https://www.coupang.com/np/search?q=노트북&page=2",
+    "https://www.coupang.com/vp/products/123456?itemId=1&vendorItemId=2",
+    "https://www.coupang.com/ad/impression?id=1",
+    "https://www.coupang.com/tracking/click?x=1",
+    "https://WWW.COUPANG.COM/AD/x",
+    "https://ads.coupang.com/serve?slot=1",
+    "https://ljc.coupang.com/api/v2/submit",
+    "https://m.coupang.com/nm/search?q=test",
+    # 쿠팡 CDN
+    "https://image7.coupangcdn.com/image/retail/images/1.jpg",
+    "https://thumbnail10.coupangcdn.com/thumbnails/remote/230x230ex/image/1.jpg",
+    "https://static.coupangcdn.com/banner/main.png",
+    "https://static.coupangcdn.com/js/app.js",
+    "https://front.coupangcdn.com/gtm.js",
+    "https://img1a.coupangcdn.com/image/x.png",
+    # 제3자 트래커/광고
+    "https://www.google-analytics.com/collect?v=1",
+    "https://www.googletagmanager.com/gtm.js?id=GTM-1",
+    "https://stats.g.doubleclick.net/r/collect",
+    "https://connect.facebook.net/en_US/fbevents.js",
+    "https://static.criteo.com/js/ld/publishertag.js",
+    "https://GOOGLE-ANALYTICS.COM/analytics.js",
+    # 쿼리/경로에 도메인 문자열이 들어간 경우
+    "https://www.coupang.com/redirect?to=https://doubleclick.net/x",
+    "https://example.com/?ref=coupang",
+    "https://cdn.example.com/lib.js?site=www.coupang.com",
+    "https://example.com/path/criteo.com.js",
+    # 기타 외부 도메인
+    "https://fonts.googleapis.com/css?family=Noto+Sans",
+    "https://cdn.jsdelivr.net/npm/jquery.js",
+    "https://example.com/pixel?id=1",
+    "http://localhost:8080/health",
+    "http://127.0.0.1/",
+    "https://notcoupang.example.org/",
+    "https://coupang.evil.example/phish",
+    # 특수 스킴/비정상 URL
+    "data:image/png;base64,AAAA",
+    "blob:https://www.coupang.com/1234",
+    "chrome-extension://abc/script.js",
+    "about:blank",
+    "",
+    "https://[::1]/",
+    "https://www.coupang.com:443/np/categories/1",
+]
+
+
+class LegacyNetworkFilter:
+    """기존 판정 로직 (패턴별 개별 컴파일/검사) - 비교 기준"""
+
+    def __init__(self, config):
+        self.config = config
+        self.blocked_patterns = []
+        for domain in config['full_filters']['domains']:
+            self.blocked_patterns.append(re.compile(f".*{re.escape(domain)}.*", re.IGNORECASE))
+        for pattern_str in config['full_filters']['patterns']:
+            self.blocked_patterns.append(re.compile(pattern_str, re.IGNORECASE))
+
+    def is_whitelisted_domain(self, url):
+        for domain in self.config['domain_whitelist']['domains']:
+            if re.search(domain, url, re.IGNORECASE):
+                return True
+        return False
+
+    def should_block(self, url):
+        if self.is_whitelisted_domain(url):
+            for pattern in self.blocked_patterns:
+                if pattern.search(url):
+                    return True
+            return False
+        for pattern in self.blocked_patterns:
+            if pattern.search(url):
+                return True
+        if not ('coupang' in url.lower() or 'localhost' in url.lower()):
+            return True
+        return False
+
+    def should_filter_console_only(self, url):
+        for pattern in self.config['console_only_filters']['patterns']:
+            if re.search(pattern, url, re.IGNORECASE):
+                return True
+        return False
+
+
+def _make_filters(config):
+    """같은 설정으로 기존/현재 필터 생성 (설정 파일은 임시 경로)"""
+    tmp = tempfile.NamedTemporaryFile("w", suffix=".json", delete=False, encoding="utf-8")
+    with tmp:
+        json.dump(config, tmp)
+    return LegacyNetworkFilter(config), NetworkFilter(config_path=tmp.name)
+
+
+def _mismatches(config):
+    legacy, current = _make_filters(config)
+    diffs = []
+    for url in URL_CORPUS:
+        checks = [
+            ("should_block", legacy.should_block(url), current.should_block(url)),
+            ("is_whitelisted_domain", legacy.is_whitelisted_domain(url), current.is_whitelisted_domain(url)),
+            ("should_filter_console_only", legacy.should_filter_console_only(url), current.should_filter_console_only(url)),
+        ]
+        for name, expected, actual in checks:
+            if bool(expected) != bool(actual):
+                diffs.append((name, url, expected, actual))
+    return diffs
+
+
+def test_should_block_matches_legacy():
+    assert _mismatches(FILTER_CONFIG) == []
+
+
+def test_should_block_matches_legacy_with_backreference_pattern():
+    config = json.loads(json.dumps(FILTER_CONFIG))
+    config['full_filters']['patterns'].append(r"/(ad|tracking)/\1/")
+    assert _mismatches(config) == []
+
+
+def test_should_block_matches_legacy_with_empty_config():
+    config = {
+        'console_only_filters': {'patterns': []},
+        'full_filters': {'domains': [], 'patterns': []},
+        'domain_whitelist': {'domains': ['coupang.com']},
+    }
+    assert _mismatches(config) == []
+
+
+if __name__ == "__main__":
+    failed = 0
+    for name, func in sorted(globals().items()):
+        if name.startswith("test_") and callable(func):
+            try:
+                func()
+                print(f"✅ {name}")
+            except AssertionError:
+                failed += 1
+                print(f"❌ {name}")
+    sys.exit(1 if failed else 0)
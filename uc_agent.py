@@ -22,8 +22,10 @@ from uc_lib.workflows.search_workflow import SearchWorkflow
 
 # 공통 모듈 (common/)
 from common.vpn_api_client import VPNAPIClient
+from common.chrome_registry import get_registry
 from common.utils.network_validator import verify_vpn_connection, print_verification_result
 from common.fingerprint_spoofer import FingerprintSpoofer
+from common.profiling import profiled, instrument_driver, MODES as PROFILE_MODES
 
 # UC 전용 모듈
 from uc_lib.modules.screenshot_processor import ScreenshotProcessor
@@ -107,6 +109,7 @@ def wait_for_user_or_close(driver, core, close_after: bool = False):
             print("\n⚠️  Ctrl+C detected. Shutting down...\n")
 
 
+@profiled("agent.run")
 def run_agent_selenium_uc(
     instance_id: int = 1,
     keyword: str = "노트북",
@@ -202,6 +205,9 @@ def run_agent_selenium_uc(
             print("❌ Failed to launch browser")
             return
 
+        # --profile: WebDriver 명령별 호출 수/시간 기록
+        instrument_driver(driver)
+
         # 버전 저장
         if version:
             save_last_version(version)
@@ -639,20 +645,8 @@ def run_work_api_mode(
 
 
 def scan_chrome_versions() -> dict:
-    """chrome-version/ 폴더를 스캔하여 설치된 버전 목록 반환"""
-    chrome_dir = Path(__file__).parent / "chrome-version"
-    versions = {}
-
-    if not chrome_dir.exists():
-        return versions
-
-    for version_dir in chrome_dir.iterdir():
-        if version_dir.is_dir():
-            chrome_bin = version_dir / "chrome-linux64" / "chrome"
-            if chrome_bin.exists():
-                versions[version_dir.name] = str(chrome_bin)
-
-    return versions
+    """설치된 Chrome 버전 목록 반환 (레이블 → chrome 경로, 공용 레지스트리 사용)"""
+    return get_registry().chrome_paths()
 
 
 def get_random_chrome_version() -> str:
@@ -893,6 +887,13 @@ Examples:
         help="Delete old profile and start fresh (기본: 프로필 유지 + 쿠키/세션만 삭제)"
     )
 
+    browser_group.add_argument(
+        "--profile-template",
+        action="store_true",
+        default=False,
+        help="Clone a per-version golden profile (Cache/Code Cache only) each launch (종료 시 즉시 폐기)"
+    )
+
     # ===================================================================
     # 🔧 고급 옵션
     # ===================================================================
@@ -913,6 +914,13 @@ Examples:
         help="Enable network filter on main page (차단: 광고/트래킹)"
     )
 
+    advanced_group.add_argument(
+        "--network-phase-policy",
+        action="store_true",
+        default=False,
+        help="Block trackers/media while browsing search results (검색 결과 탐색 중 트래커+미디어 차단, 캡처 단계는 트래커만)"
+    )
+
     advanced_group.add_argument(
         "--adjust",
         action="store_true",
@@ -959,6 +967,21 @@ Examples:
         help="Display current IP address (uses api.ipify.org)"
     )
 
+    debug_group.add_argument(
+        "--profile",
+        nargs="?",
+        const="cprofile",
+        choices=PROFILE_MODES,
+        default=None,
+        help="작업 프로파일 기록 (cprofile: pstats / sample: collapsed stack) + WebDriver 명령 통계"
+    )
+
+    debug_group.add_argument(
+        "--driver-accounting",
+        action="store_true",
+        help="WebDriver 명령 호출 위치별 집계 + N+1 감지 (작업 종료 시 요약, 조회: python3 uc_lib/core/driver_accounting.py)"
+    )
+
     debug_group.add_argument(
         "--interactive",
         action="store_true",
@@ -972,6 +995,18 @@ Examples:
     Config.DEBUG_MODE = args.debug
     if args.debug:
         print("🐛 디버그 모드 활성화")
+    if args.profile_template:
+        Config.ENABLE_PROFILE_TEMPLATE = True
+        print("🧬 템플릿 프로필 모드 활성화")
+    if args.network_phase_policy:
+        Config.ENABLE_NETWORK_PHASE_POLICY = True
+        print("🚦 네트워크 단계 정책 활성화")
+    if args.profile:
+        Config.PROFILE_MODE = args.profile
+        print(f"🔬 프로파일 모드 활성화 ({args.profile})")
+    if args.driver_accounting:
+        Config.ENABLE_DRIVER_ACCOUNTING = True
+        print("📊 WebDriver 명령 집계 활성화")
 
     # === 버전 선택 (최우선 처리) ===
     # --version random 처리
@@ -19,8 +19,16 @@ except ImportError:
     raise
 
 from common.constants import Config
-from common.utils.network_filter import NetworkFilter
+from common.utils.network_filter import NetworkFilter, RequestInterceptor
 from common.network_error_monitor import NetworkErrorMonitor
+from common.chrome_registry import get_registry
+from common.tracing import traced
+from uc_lib.core.profile_template import ProfileTemplateManager
+from uc_lib.core.profile_reaper import ProfileReaper
+from uc_lib.core.chromedriver_cache import get_patched_chromedriver
+from uc_lib.core.cdp_session import get_cdp_session, close_cdp_session
+from uc_lib.core.cache_seed import seed_profile_cache
+from uc_lib.core.driver_accounting import CommandAccounting
 
 # 통합 이벤트 로거
 try:
@@ -45,12 +53,18 @@ class BrowserCoreUC:
         self.vpn_interface = vpn_interface
         self.driver = None
         self.profile_dir = None  # launch()에서 버전별로 설정
+        self.template_manager = None  # 템플릿 프로필 모드에서 사용
+        self.template_run_dir = None  # 템플릿 복제본 (종료 시 폐기)
 
         # Network filter (광고/트래킹 차단)
         self.network_filter = NetworkFilter()
+        self.request_interceptor = None  # Fetch.requestPaused 기반 요청 단위 필터
+        self.request_filter_enabled = False  # enable_request_interception() 상태
+        self.network_phase = None  # set_network_phase() 상태 ("browse"/"capture"/None)
 
         # Network error monitor (ERR_NETWORK_CHANGED 감지)
         self.network_error_monitor = None
+        self.command_accounting = None  # WebDriver 명령 집계 (ENABLE_DRIVER_ACCOUNTING)
 
         # Chrome Extension 경로 (네트워크 필터용)
         project_root = Path(__file__).parent.parent.parent
@@ -65,20 +79,8 @@ class BrowserCoreUC:
         }
 
     def _scan_chrome_versions(self) -> dict:
-        """chrome-version/ 폴더를 스캔하여 설치된 버전 목록 반환"""
-        chrome_dir = Path(__file__).parent.parent.parent / "chrome-version"
-        versions = {}
-
-        if not chrome_dir.exists():
-            return versions
-
-        for version_dir in chrome_dir.iterdir():
-            if version_dir.is_dir():
-                chrome_bin = version_dir / "chrome-linux64" / "chrome"
-                if chrome_bin.exists():
-                    versions[version_dir.name] = str(chrome_bin)
-
-        return versions
+        """설치된 Chrome 버전 목록 반환 (레이블 → chrome 경로, 공용 레지스트리 사용)"""
+        return get_registry().chrome_paths()
 
     def get_chrome_options(self, use_profile: bool = True, window_position: str = None, enable_network_filter: bool = False):
         """
@@ -157,12 +159,17 @@ class BrowserCoreUC:
         # }
         # options.add_experimental_option("prefs", prefs)
 
-        # Performance 로그 활성화 (네트워크 필터 디버깅용)
-        options.add_experimental_option("perfLoggingPrefs", {
-            "enableNetwork": True,
-            "enablePage": False,
-        })
-        options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+        # Performance 로그 (log 모드 네트워크 모니터 또는 명시적 요청 시에만)
+        # 켜 두면 chromedriver가 모든 Network 이벤트를 버퍼링하므로 기본은 비활성화
+        use_log_monitor = (
+            Config.ENABLE_NETWORK_ERROR_MONITOR and Config.NETWORK_ERROR_MONITOR_MODE == "log"
+        )
+        if Config.ENABLE_PERFORMANCE_LOG or use_log_monitor:
+            options.add_experimental_option("perfLoggingPrefs", {
+                "enableNetwork": True,
+                "enablePage": False,
+            })
+            options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
 
         return options
 
@@ -177,6 +184,7 @@ class BrowserCoreUC:
             "height": int(base_height * ratio)
         }
 
+    @traced("browser.launch")
     def launch(
         self,
         version: Optional[str] = None,
@@ -187,7 +195,8 @@ class BrowserCoreUC:
         window_height: int = 1200,
         window_x: int = 10,
         window_y: int = 10,
-        enable_network_filter: bool = False
+        enable_network_filter: bool = False,
+        use_profile_template: Optional[bool] = None
     ):
         """
         Chrome 실행 (undetected-chromedriver)
@@ -202,36 +211,31 @@ class BrowserCoreUC:
             window_x: 창 X 위치 (기본: 10)
             window_y: 창 Y 위치 (기본: 10)
             enable_network_filter: 네트워크 필터 활성화 여부
+            use_profile_template: 템플릿 프로필 복제 사용 (None이면 Config.ENABLE_PROFILE_TEMPLATE)
 
         Returns:
             WebDriver 객체
         """
-        # Chrome 버전 선택
+        # Chrome 버전 선택 (공용 레지스트리: 경로/메이저 버전/chromedriver를 한 번에 조회)
+        registry = get_registry()
         if version:
-            # Check if it's a channel (beta, dev, canary)
-            if version.lower() in ['beta', 'dev', 'canary']:
-                channel_dir = Path(Config.PROFILE_DIR_BASE).parent / "chrome-version" / version.lower()
-                chrome_path = channel_dir / "chrome-linux64" / "chrome"
-
-                if not chrome_path.exists():
+            build = registry.get(version)
+            if not build:
+                # Check if it's a channel (beta, dev, canary)
+                if version.lower() in ['beta', 'dev', 'canary']:
                     raise ValueError(f"Chrome {version} not found. Run: ./install-chrome-channels.sh {version.lower()}")
-
-                chrome_path = str(chrome_path)
-                # Keep version as channel name for profile directory
-            else:
-                # Regular version number
-                versions = self._scan_chrome_versions()
-                chrome_path = versions.get(version)
-                if not chrome_path:
-                    raise ValueError(f"Chrome {version} not found")
+                raise ValueError(f"Chrome {version} not found")
         else:
             # Random version
             import random
-            versions = self._scan_chrome_versions()
-            if not versions:
+            builds = registry.builds()
+            if not builds:
                 raise ValueError("Chrome이 설치되어 있지 않습니다")
-            version = random.choice(list(versions.keys()))
-            chrome_path = versions[version]
+            build = random.choice(list(builds.values()))
+
+        # Keep version as channel name for profile directory
+        version = build.label
+        chrome_path = build.chrome_path
 
         # 프로필 디렉토리 설정
         # VPN 또는 로컬: 사용자별 홈 디렉토리 사용 (사용자 격리)
@@ -239,91 +243,110 @@ class BrowserCoreUC:
 
         vpn_num = os.getenv('VPN_EXECUTED')
 
-        # 버전별 프로필 사용 (사용자 자체가 이미 wg101, wg102로 분리되어 있음)
-        self.profile_dir = Path(profile_base) / f"chrome-{version}"
+        # 템플릿 프로필 모드: 골든 프로필을 복제해서 사용 (종료 시 rename만으로 폐기)
+        if use_profile_template is None:
+            use_profile_template = Config.ENABLE_PROFILE_TEMPLATE
+        self.template_run_dir = None
+
+        if use_profile and use_profile_template:
+            self.template_manager = ProfileTemplateManager(profile_base)
+            self.profile_dir = self.template_manager.create_run_dir(version)
+            self.template_run_dir = self.profile_dir
+            print(f"📁 Profile directory: {self.profile_dir}")
+            print(f"   Mode: Template clone ({self.template_manager.template_dir(version)})")
+        else:
+            # 버전별 프로필 사용 (사용자 자체가 이미 wg101, wg102로 분리되어 있음)
+            self.profile_dir = Path(profile_base) / f"chrome-{version}"
 
-        # 프로필 디렉토리 처리
-        # VPN 번호별로 이미 분리되어 있으므로 각 사용자가 자신의 디렉토리만 사용
-        print(f"📁 Profile directory: {self.profile_dir}")
-        print(f"   Parent directory: {self.profile_dir.parent}")
-        print(f"   Current user: {os.getenv('USER', 'unknown')}")
-        print(f"   VPN user: vpn{vpn_num}" if vpn_num else "   VPN: Not used")
+            # 프로필 디렉토리 처리
+            # VPN 번호별로 이미 분리되어 있으므로 각 사용자가 자신의 디렉토리만 사용
+            print(f"📁 Profile directory: {self.profile_dir}")
+            print(f"   Parent directory: {self.profile_dir.parent}")
+            print(f"   Current user: {os.getenv('USER', 'unknown')}")
+            print(f"   VPN user: vpn{vpn_num}" if vpn_num else "   VPN: Not used")
 
-        # 상위 디렉토리 존재 및 권한 확인
-        parent_dir = self.profile_dir.parent
-        if not parent_dir.exists():
-            print(f"   ❌ Parent directory does not exist: {parent_dir}")
-            raise ValueError(f"Parent directory does not exist: {parent_dir}")
+            # 상위 디렉토리 존재 및 권한 확인
+            parent_dir = self.profile_dir.parent
+            if not parent_dir.exists():
+                print(f"   ❌ Parent directory does not exist: {parent_dir}")
+                raise ValueError(f"Parent directory does not exist: {parent_dir}")
 
-        import stat
-        parent_stat = parent_dir.stat()
-        parent_mode = stat.filemode(parent_stat.st_mode)
-        print(f"   Parent directory permissions: {parent_mode}")
+            import stat
+            parent_stat = parent_dir.stat()
+            parent_mode = stat.filemode(parent_stat.st_mode)
+            print(f"   Parent directory permissions: {parent_mode}")
 
-        print(f"   Creating profile directory...")
+            print(f"   Creating profile directory...")
 
-        try:
-            # 소유권 충돌 체크: 다른 사용자가 생성한 프로필 디렉토리 확인
-            if self.profile_dir.exists():
-                import pwd
-                current_uid = os.getuid()
-                profile_stat = self.profile_dir.stat()
-                profile_owner_uid = profile_stat.st_uid
-
-                if current_uid != profile_owner_uid:
-                    # 다른 사용자 소유의 프로필 발견
-                    profile_owner = pwd.getpwuid(profile_owner_uid).pw_name
-                    current_user = pwd.getpwuid(current_uid).pw_name
-
-                    print(f"   ⚠️  소유권 충돌 감지!")
-                    print(f"   현재 사용자: {current_user} (UID: {current_uid})")
-                    print(f"   프로필 소유자: {profile_owner} (UID: {profile_owner_uid})")
-                    print(f"   🗑️  충돌 해결: 기존 프로필 삭제 후 재생성")
-
-                    # 다른 사용자 소유 프로필 삭제 (sudo 필요할 수 있음)
-                    import shutil
-                    try:
-                        shutil.rmtree(self.profile_dir, ignore_errors=True)
-                        print(f"   ✓ 기존 프로필 삭제 완료")
-                    except Exception as rm_error:
-                        print(f"   ❌ 프로필 삭제 실패: {rm_error}")
-                        print(f"   💡 수동 삭제 필요: sudo rm -rf {self.profile_dir}")
-                        raise
-
-            if fresh_profile and self.profile_dir.exists():
-                # 옵션 1: 프로필 완전 삭제 후 재생성
-                import shutil
-                print(f"🗑️  Deleting old profile: {self.profile_dir}")
-                shutil.rmtree(self.profile_dir, ignore_errors=True)
-                self.profile_dir.mkdir(parents=True, exist_ok=True)
-                print(f"✅ Fresh profile created")
-            else:
-                # 옵션 2 (기본): 프로필 유지
-                self.profile_dir.mkdir(parents=True, exist_ok=True)
-
-                # Chrome Lock 파일 제거 (프로필 재사용 시 충돌 방지)
-                lock_files = [
-                    self.profile_dir / "SingletonLock",
-                    self.profile_dir / "lockfile",
-                    self.profile_dir / "SingletonCookie",
-                    self.profile_dir / "SingletonSocket"
-                ]
-                for lock_file in lock_files:
-                    if lock_file.exists():
+            try:
+                # 소유권 충돌 체크: 다른 사용자가 생성한 프로필 디렉토리 확인
+                if self.profile_dir.exists():
+                    import pwd
+                    current_uid = os.getuid()
+                    profile_stat = self.profile_dir.stat()
+                    profile_owner_uid = profile_stat.st_uid
+
+                    if current_uid != profile_owner_uid:
+                        # 다른 사용자 소유의 프로필 발견
+                        profile_owner = pwd.getpwuid(profile_owner_uid).pw_name
+                        current_user = pwd.getpwuid(current_uid).pw_name
+
+                        print(f"   ⚠️  소유권 충돌 감지!")
+                        print(f"   현재 사용자: {current_user} (UID: {current_uid})")
+                        print(f"   프로필 소유자: {profile_owner} (UID: {profile_owner_uid})")
+                        print(f"   🗑️  충돌 해결: 기존 프로필 삭제 후 재생성")
+
+                        # 다른 사용자 소유 프로필 삭제 (sudo 필요할 수 있음)
+                        import shutil
                         try:
-                            lock_file.unlink()
-                            print(f"   🔓 Lock 파일 제거: {lock_file.name}")
-                        except:
-                            pass
-
-                print(f"✅ Profile directory ready")
-        except Exception as e:
-            print(f"   ❌ Failed to create profile directory: {e}")
-            print(f"   Directory: {self.profile_dir}")
-            print(f"   Parent: {parent_dir}")
-            print(f"   Parent exists: {parent_dir.exists()}")
-            print(f"   Parent permissions: {oct(parent_stat.st_mode)[-3:]}")
-            raise
+                            shutil.rmtree(self.profile_dir, ignore_errors=True)
+                            print(f"   ✓ 기존 프로필 삭제 완료")
+                        except Exception as rm_error:
+                            print(f"   ❌ 프로필 삭제 실패: {rm_error}")
+                            print(f"   💡 수동 삭제 필요: sudo rm -rf {self.profile_dir}")
+                            raise
+
+                if fresh_profile and self.profile_dir.exists():
+                    # 옵션 1: 프로필 완전 삭제 후 재생성
+                    import shutil
+                    print(f"🗑️  Deleting old profile: {self.profile_dir}")
+                    shutil.rmtree(self.profile_dir, ignore_errors=True)
+                    self.profile_dir.mkdir(parents=True, exist_ok=True)
+                    print(f"✅ Fresh profile created")
+                else:
+                    # 옵션 2 (기본): 프로필 유지
+                    self.profile_dir.mkdir(parents=True, exist_ok=True)
+
+                    # Chrome Lock 파일 제거 (프로필 재사용 시 충돌 방지)
+                    lock_files = [
+                        self.profile_dir / "SingletonLock",
+                        self.profile_dir / "lockfile",
+                        self.profile_dir / "SingletonCookie",
+                        self.profile_dir / "SingletonSocket"
+                    ]
+                    for lock_file in lock_files:
+                        if lock_file.exists():
+                            try:
+                                lock_file.unlink()
+                                print(f"   🔓 Lock 파일 제거: {lock_file.name}")
+                            except:
+                                pass
+
+                    print(f"✅ Profile directory ready")
+            except Exception as e:
+                print(f"   ❌ Failed to create profile directory: {e}")
+                print(f"   Directory: {self.profile_dir}")
+                print(f"   Parent: {parent_dir}")
+                print(f"   Parent exists: {parent_dir.exists()}")
+                print(f"   Parent permissions: {oct(parent_stat.st_mode)[-3:]}")
+                raise
+
+            # 비어 있는 캐시를 공유 시드로 채움 (새 워커/새 버전도 따뜻한 캐시로 시작)
+            if use_profile and Config.ENABLE_CACHE_SEED:
+                try:
+                    seed_profile_cache(self.profile_dir, version)
+                except Exception as e:
+                    print(f"   ⚠️  캐시 시드 적용 실패: {e}")
 
         print(f"🚀 Launching Chrome {version} with undetected-chromedriver...")
         print(f"   Path: {chrome_path}")
@@ -331,7 +354,9 @@ class BrowserCoreUC:
         print(f"   Debug Port: {9222 + self.instance_id}")
         if use_profile:
             print(f"   Profile: {self.profile_dir}")
-            if fresh_profile:
+            if self.template_run_dir:
+                print(f"   Mode: Template clone (종료 시 즉시 폐기)")
+            elif fresh_profile:
                 print(f"   Mode: Fresh profile (완전 삭제 후 재생성)")
             else:
                 print(f"   Mode: Reuse profile (쿠키/세션/스토리지 삭제됨)")
@@ -350,36 +375,28 @@ class BrowserCoreUC:
         options.binary_location = str(chrome_path)
         print(f"   Chrome binary: {chrome_path}")
 
-        # Major version 추출 (channels의 경우 MAJOR_VERSION 파일에서 읽기)
-        if version.lower() in ['beta', 'dev', 'canary']:
-            channel_dir = Path(Config.PROFILE_DIR_BASE).parent / "chrome-version" / version.lower()
-            major_version_file = channel_dir / "MAJOR_VERSION"
-            if major_version_file.exists():
-                version_main = int(major_version_file.read_text().strip())
-            else:
-                # Fallback: VERSION 파일에서 메이저 버전 추출
-                version_file = channel_dir / "VERSION"
-                full_version = version_file.read_text().strip()
-                version_main = int(full_version.split('.')[0])
-        else:
-            version_main = int(version)
+        # Major version (레지스트리: MAJOR_VERSION → 숫자 레이블 → VERSION 파일 순서로 색인됨)
+        version_main = build.major_version
+        if version_main is None:
+            raise ValueError(f"Chrome {version}: 메이저 버전을 확인할 수 없습니다 (MAJOR_VERSION/VERSION 파일 없음)")
 
         # ChromeDriver 경로 설정 및 워커별 복사본 생성
         # 중요: 멀티 워커 환경에서 같은 ChromeDriver 바이너리를 공유하면
         # undetected-chromedriver의 패치 프로세스가 충돌하여 Chrome이 종료됨
         # 해결: 각 워커마다 독립적인 ChromeDriver 복사본 사용
         chromedriver_path = None
-        if version.lower() in ['beta', 'dev', 'canary']:
-            # 채널 버전
-            channel_dir = Path(Config.PROFILE_DIR_BASE).parent / "chrome-version" / version.lower()
-            chromedriver_bin = channel_dir / "chromedriver-linux64" / "chromedriver"
-        else:
-            # 일반 버전
-            version_dir = Path(Config.PROFILE_DIR_BASE).parent / "chrome-version" / version
-            chromedriver_bin = version_dir / "chromedriver-linux64" / "chromedriver"
-
-        if chromedriver_bin.exists():
-            # 워커별 ChromeDriver 복사본 생성 (멀티 워커 충돌 방지)
+        chromedriver_bin = Path(build.chromedriver_path) if build.chromedriver_path else None
+        if chromedriver_bin and not build.driver_compatible:
+            print(f"   ⚠️  ChromeDriver {build.driver_version} ↔ Chrome {version_main} 버전 불일치")
+
+        if chromedriver_bin and chromedriver_bin.exists():
+            # 공유 캐시: 빌드별로 한 번만 패치된 바이너리를 모든 워커가 읽기 전용으로 재사용
+            chromedriver_path = get_patched_chromedriver(chromedriver_bin, version, version_main)
+            if chromedriver_path:
+                print(f"   📋 ChromeDriver 공유 캐시 사용 (패치 완료)")
+
+        if chromedriver_bin and chromedriver_bin.exists() and not chromedriver_path:
+            # Fallback: 워커별 ChromeDriver 복사본 생성 (멀티 워커 충돌 방지)
             import shutil
             import getpass
             current_user = getpass.getuser()
@@ -442,6 +459,11 @@ class BrowserCoreUC:
 
         print(f"   ✓ ChromeDriver service running on port {driver_port}")
 
+        # WebDriver 명령 집계 (명령/호출 위치별 횟수·시간, N+1 감지 → close_browser()에서 요약)
+        if Config.ENABLE_DRIVER_ACCOUNTING:
+            self.command_accounting = CommandAccounting()
+            self.command_accounting.install(self.driver)
+
         # Viewport 설정 (파라미터 사용) - 내부 콘텐츠 영역
         viewport_width = window_width
         viewport_height = window_height
@@ -520,7 +542,8 @@ class BrowserCoreUC:
                 self.network_error_monitor = NetworkErrorMonitor(
                     self.driver,
                     worker_id=self.worker_id,
-                    interface=self.vpn_interface
+                    interface=self.vpn_interface,
+                    mode=Config.NETWORK_ERROR_MONITOR_MODE
                 )
                 self.network_error_monitor.start(interval=0.5)
                 print(f"   ✓ 네트워크 에러 모니터 시작 (ERR_NETWORK_CHANGED 감지)")
@@ -600,6 +623,7 @@ class BrowserCoreUC:
         except Exception as e:
             print(f"   ⚠️  Local storage clear failed: {e}")
 
+    @traced("browser.clear_storage")
     def clear_all_storage(self, skip_navigation: bool = False):
         """
         쿠키, 세션 스토리지, 로컬 스토리지 모두 삭제 (캐시는 유지)
@@ -692,13 +716,109 @@ class BrowserCoreUC:
 
         주의: 실제 필터는 Chrome 시작 시 --host-rules 플래그로 적용됩니다.
         이 메서드는 호환성을 위해 남겨두었으며, 아무 동작도 하지 않습니다.
+        요청 단위 차단이 필요하면 enable_request_interception()을 명시적으로 호출하세요.
         """
         pass  # Chrome 시작 시 이미 --host-rules로 적용됨
 
+    def enable_request_interception(self):
+        """
+        요청 단위 필터 활성화 (런타임, 명시적 호출 전용)
+
+        직접 CDP 세션에서 Fetch.requestPaused를 가로채 NetworkFilter.should_block()으로
+        요청마다 차단/통과를 결정합니다 (쿠팡/화이트리스트 외 외부 도메인은 모두 차단).
+        페이지 이동 전에 호출해야 합니다.
+        """
+        if self.request_filter_enabled:
+            return
+
+        self.request_filter_enabled = True
+        if self._apply_request_interception():
+            print(f"   🛡️  요청 단위 필터 활성화 (Fetch 요청 가로채기)")
+
+    def set_network_phase(self, phase: Optional[str]):
+        """
+        단계별 리소스 차단 정책 적용 (런타임)
+
+        - "browse":  검색 결과 탐색 중 → 트래커 URL(Network.setBlockedURLs) + 미디어 차단
+                     (Config.NETWORK_PHASE_BLOCK_FONTS/IMAGES가 켜져 있으면 폰트/이미지도 차단)
+        - "capture": 최종 캡처 페이지 → 트래커만 차단, 화면에 보이는 리소스는 모두 허용
+        - None:      차단 해제
+
+        Args:
+            phase: "browse", "capture" 또는 None
+        """
+        if not Config.ENABLE_NETWORK_PHASE_POLICY or phase == self.network_phase:
+            return
+
+        session = self.get_cdp_session()
+        if not session:
+            return
+
+        tracker_patterns = list(Config.NETWORK_TRACKER_URL_PATTERNS) if phase else []
+        try:
+            # setBlockedURLs는 Network 도메인이 활성화된 세션에서만 적용됨
+            session.send_batch([
+                ('Network.enable', None),
+                ('Network.setBlockedURLs', {'urls': tracker_patterns}),
+            ])
+        except Exception as e:
+            print(f"   ⚠️  네트워크 단계 정책 적용 실패 ({phase}): {e}")
+            return
+
+        self.network_phase = phase
+        self._apply_request_interception()
+
+        blocked_types = self._phase_blocked_resource_types()
+        print(f"   🚦 네트워크 단계: {phase or '해제'} "
+              f"(트래커 {len(tracker_patterns)}개, 리소스 타입 차단: {', '.join(blocked_types) or '없음'})")
+
+    def _phase_blocked_resource_types(self) -> list:
+        """현재 단계에서 URL과 무관하게 차단할 리소스 타입"""
+        if self.network_phase != "browse":
+            return []
+
+        blocked_types = ["Media"]
+        if Config.NETWORK_PHASE_BLOCK_FONTS:
+            blocked_types.append("Font")
+        if Config.NETWORK_PHASE_BLOCK_IMAGES:
+            blocked_types.append("Image")
+        return blocked_types
+
+    def _apply_request_interception(self) -> bool:
+        """
+        요청 단위 필터 + 단계 정책을 하나의 RequestInterceptor로 (재)구성
+
+        Fetch.enable 패턴은 세션당 하나만 유지되므로 상태가 바뀔 때마다 다시 만듭니다.
+
+        Returns:
+            가로채기 활성 여부
+        """
+        if self.request_interceptor:
+            self.request_interceptor.stop()
+            self.request_interceptor = None
+
+        blocked_types = self._phase_blocked_resource_types()
+        if not self.request_filter_enabled and not blocked_types:
+            return False
+
+        session = self.get_cdp_session()
+        if not session:
+            print(f"   ⚠️  CDP 세션 없음 - 요청 가로채기 적용 불가")
+            return False
+
+        self.request_interceptor = RequestInterceptor(
+            session,
+            network_filter=self.network_filter if self.request_filter_enabled else None,
+            blocked_resource_types=blocked_types
+        )
+        if not self.request_interceptor.start():
+            self.request_interceptor = None
+            return False
+        return True
+
     def _monitor_network_requests(self, duration: int = 5):
-        """네트워크 요청 모니터링 (디버깅용)"""
+        """네트워크 요청 모니터링 (디버깅용, 직접 CDP 세션 이벤트 구독)"""
         import time
-        import json
         from urllib.parse import urlparse
 
         # requestId → URL 매핑
@@ -706,62 +826,64 @@ class BrowserCoreUC:
         blocked_urls = []
         allowed_external_urls = []
 
-        print(f"      (다음 {duration}초간 네트워크 요청 기록)\n")
+        session = self.get_cdp_session()
+        if not session:
+            print(f"      ⚠️  CDP 세션 없음 - 네트워크 모니터링 건너뜀\n")
+            return
 
-        start_time = time.time()
+        def on_request(params):
+            """요청 시작 시 URL 저장"""
+            request_id = params.get('requestId')
+            request = params.get('request', {})
+            url = request.get('url', '')
+            resource_type = params.get('type', 'Other')
+
+            # 내부 리소스 제외 (chrome://, data:, chrome-extension:)
+            if url and not url.startswith('data:') and not url.startswith('chrome-extension:') and not url.startswith('chrome://'):
+                request_map[request_id] = {
+                    'url': url,
+                    'type': resource_type
+                }
+
+                # 외부 도메인 (쿠팡 아닌 것)
+                parsed = urlparse(url)
+                if parsed.netloc and 'coupang' not in parsed.netloc.lower():
+                    if len(allowed_external_urls) < 30:
+                        allowed_external_urls.append({
+                            'url': url,
+                            'domain': parsed.netloc,
+                            'type': resource_type
+                        })
+
+        def on_failed(params):
+            """차단된 요청"""
+            request_id = params.get('requestId')
+            error = params.get('errorText', '')
+
+            if 'BLOCKED_BY_CLIENT' in error or 'ERR_BLOCKED_BY_CLIENT' in error:
+                if request_id in request_map:
+                    blocked_urls.append(request_map[request_id])
+                else:
+                    blocked_urls.append({'url': f'Unknown (ID: {request_id})', 'type': 'Unknown'})
 
-        while time.time() - start_time < duration:
-            try:
-                # 개발자 도구 로그 가져오기
-                logs = self.driver.get_log('performance')
-
-                for entry in logs:
-                    log = json.loads(entry['message'])
-                    message = log.get('message', {})
-                    method = message.get('method', '')
-
-                    # 요청 시작 시 URL 저장
-                    if method == 'Network.requestWillBeSent':
-                        params = message.get('params', {})
-                        request_id = params.get('requestId')
-                        request = params.get('request', {})
-                        url = request.get('url', '')
-                        resource_type = params.get('type', 'Other')
-
-                        # 내부 리소스 제외 (chrome://, data:, chrome-extension:)
-                        if url and not url.startswith('data:') and not url.startswith('chrome-extension:') and not url.startswith('chrome://'):
-                            request_map[request_id] = {
-                                'url': url,
-                                'type': resource_type
-                            }
-
-                            # 외부 도메인 (쿠팡 아닌 것)
-                            parsed = urlparse(url)
-                            if parsed.netloc and 'coupang' not in parsed.netloc.lower():
-                                if len(allowed_external_urls) < 30:
-                                    allowed_external_urls.append({
-                                        'url': url,
-                                        'domain': parsed.netloc,
-                                        'type': resource_type
-                                    })
-
-                    # 차단된 요청
-                    elif method == 'Network.loadingFailed':
-                        params = message.get('params', {})
-                        request_id = params.get('requestId')
-                        error = params.get('errorText', '')
-
-                        if 'BLOCKED_BY_CLIENT' in error or 'ERR_BLOCKED_BY_CLIENT' in error:
-                            if request_id in request_map:
-                                blocked_urls.append(request_map[request_id])
-                            else:
-                                blocked_urls.append({'url': f'Unknown (ID: {request_id})', 'type': 'Unknown'})
-
-                time.sleep(0.1)
+        print(f"      (다음 {duration}초간 네트워크 요청 기록)\n")
 
-            except Exception as e:
-                # 로그 파싱 실패는 무시
-                pass
+        session.on('Network.requestWillBeSent', on_request)
+        session.on('Network.loadingFailed', on_failed)
+        try:
+            session.send('Network.enable')
+            time.sleep(duration)
+        except Exception as e:
+            print(f"      ⚠️  네트워크 모니터링 실패: {e}")
+        finally:
+            session.off('Network.requestWillBeSent', on_request)
+            session.off('Network.loadingFailed', on_failed)
+            # 단계 정책(setBlockedURLs)이 Network 도메인을 사용 중이면 유지
+            if not self.network_phase:
+                try:
+                    session.send('Network.disable')
+                except Exception:
+                    pass
 
         # 결과 출력
         print(f"\n   📊 네트워크 모니터링 결과 ({duration}초):")
@@ -797,6 +919,26 @@ class BrowserCoreUC:
         """
         pass  # --host-rules는 런타임에 변경 불가
 
+    def disable_request_interception(self):
+        """요청 단위 필터 비활성화 (단계 정책의 리소스 타입 차단은 유지)"""
+        if not self.request_filter_enabled:
+            return
+
+        stats = self.request_interceptor.get_stats() if self.request_interceptor else None
+        self.request_filter_enabled = False
+        self._apply_request_interception()
+        if stats:
+            print(f"   🛡️  요청 단위 필터 해제 (차단 {stats['blocked']}개 / 통과 {stats['allowed']}개)")
+
+    def get_cdp_session(self):
+        """
+        현재 탭에 직접 연결된 CDP 세션 (chromedriver 미경유, 드라이버당 1개 공유)
+
+        Returns:
+            CDPSession (연결 불가 시 None)
+        """
+        return get_cdp_session(self.driver)
+
     def close_browser(self):
         """브라우저 종료 (강화 버전: psutil 기반 강제 종료 및 좀비 회수)"""
         import psutil
@@ -812,11 +954,22 @@ class BrowserCoreUC:
             except Exception as e:
                 print(f"   ⚠️  네트워크 에러 모니터 중지 실패: {e}")
 
-        # 브라우저 종료 전 캐시 정리 (핑거프린팅 보존)
+        # WebDriver 명령 집계 요약 (작업 1건 단위)
+        if self.command_accounting:
+            try:
+                self.command_accounting.report()
+            except Exception as e:
+                print(f"   ⚠️  WebDriver 명령 집계 실패: {e}")
+            self.command_accounting = None
+
+        # 직접 CDP 세션 종료 (브라우저보다 먼저)
+        self.request_interceptor = None
+        self.request_filter_enabled = False
+        self.network_phase = None
         try:
-            self.cleanup_profile_on_exit()
-        except Exception as e:
-            print(f"   ⚠️  프로필 정리 실패: {e}")
+            close_cdp_session(self.driver)
+        except Exception:
+            pass
 
         if self.driver:
             try:
@@ -860,6 +1013,23 @@ class BrowserCoreUC:
 
             self.driver = None
 
+        # 프로필 정리 (Chrome 종료 후 → 종료 시 다시 쓰는 Cookies/Preferences까지 정리)
+        # 템플릿 복제본은 통째로 폐기하므로 항목별 정리 불필요
+        if not self.template_run_dir:
+            try:
+                self.cleanup_profile_on_exit()
+            except Exception as e:
+                print(f"   ⚠️  프로필 정리 실패: {e}")
+
+        # 템플릿 복제본 폐기 (rename 후 백그라운드 삭제)
+        if self.template_run_dir:
+            try:
+                self.template_manager.discard_run_dir(self.template_run_dir)
+                print(f"   ✓ 템플릿 복제 프로필 폐기")
+            except Exception as e:
+                print(f"   ⚠️  템플릿 복제 프로필 폐기 실패: {e}")
+            self.template_run_dir = None
+
         self.stats["active"] = False
         self.stats["instances_closed"] += 1
 
@@ -891,8 +1061,6 @@ class BrowserCoreUC:
         if not self.profile_dir or not self.profile_dir.exists():
             return
 
-        import shutil
-
         print("🧹 프로필 정리 중 (시크릿 모드 + 캐시 보존)...")
 
         default_dir = self.profile_dir / "Default"
@@ -900,6 +1068,22 @@ class BrowserCoreUC:
         deleted_size = 0
         deleted_count = 0
 
+        # 디렉토리는 휴지통으로 rename만 하고 (O(1)) 실제 삭제는 백그라운드에서 진행
+        # 크기 집계(rglob + stat)는 디버그 모드에서만 수행
+        reaper = ProfileReaper(str(self.profile_dir.parent))
+        measure_size = Config.DEBUG_MODE
+
+        def defer_dir(dir_path: Path) -> bool:
+            nonlocal deleted_size
+            if not dir_path.is_dir():
+                return False
+            if measure_size:
+                try:
+                    deleted_size += sum(f.stat().st_size for f in dir_path.rglob('*') if f.is_file())
+                except OSError:
+                    pass
+            return reaper.defer(dir_path) is not None
+
         # Default 디렉토리 내 삭제할 디렉토리 목록
         delete_dirs = [
             # === 캐시는 보존 (트래픽 절감) ===
@@ -948,15 +1132,8 @@ class BrowserCoreUC:
 
         # Default 디렉토리 내 삭제
         for dir_name in delete_dirs:
-            dir_path = default_dir / dir_name
-            if dir_path.exists() and dir_path.is_dir():
-                try:
-                    dir_size = sum(f.stat().st_size for f in dir_path.rglob('*') if f.is_file())
-                    shutil.rmtree(dir_path)
-                    deleted_size += dir_size
-                    deleted_count += 1
-                except Exception:
-                    pass
+            if defer_dir(default_dir / dir_name):
+                deleted_count += 1
 
         # 프로필 루트의 GPU 캐시 삭제 (핑거프린팅!)
         root_dirs = [
@@ -970,15 +1147,8 @@ class BrowserCoreUC:
         ]
 
         for dir_name in root_dirs:
-            dir_path = profile_root / dir_name
-            if dir_path.exists() and dir_path.is_dir():
-                try:
-                    dir_size = sum(f.stat().st_size for f in dir_path.rglob('*') if f.is_file())
-                    shutil.rmtree(dir_path)
-                    deleted_size += dir_size
-                    deleted_count += 1
-                except Exception:
-                    pass
+            if defer_dir(profile_root / dir_name):
+                deleted_count += 1
 
         # 핑거프린팅 관련 파일들 삭제
         fingerprint_files = [
@@ -1002,15 +1172,21 @@ class BrowserCoreUC:
             for file_path in default_dir.glob(pattern):
                 if file_path.is_file():
                     try:
-                        file_size = file_path.stat().st_size
+                        if measure_size:
+                            deleted_size += file_path.stat().st_size
                         file_path.unlink()
-                        deleted_size += file_size
                         deleted_count += 1
                     except Exception:
                         pass
 
+        # 휴지통으로 옮긴 디렉토리는 낮은 우선순위 백그라운드 프로세스가 삭제
+        reaper.reap()
+
         if deleted_count > 0:
-            print(f"   ✅ {deleted_count}개 항목 정리 완료 ({deleted_size / 1024 / 1024:.1f}MB)")
+            if measure_size:
+                print(f"   ✅ {deleted_count}개 항목 정리 완료 ({deleted_size / 1024 / 1024:.1f}MB, 백그라운드 삭제)")
+            else:
+                print(f"   ✅ {deleted_count}개 항목 정리 완료 (백그라운드 삭제)")
             print(f"   ✅ 시크릿 모드 효과: 쿠키, 히스토리, 핑거프린팅 데이터 삭제")
             print(f"   💾 HTTP 캐시 보존: jQuery, Bootstrap 등 재사용 (트래픽 32% 절감)")
         else:
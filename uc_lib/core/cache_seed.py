@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+"""
+HTTP 캐시 시드 모듈
+Chrome 버전별 표준 정적 리소스 캐시(Default/Cache, Default/Code Cache)를 한 번 만들어 두고
+새 프로필/템플릿에 복제해서 워커가 처음부터 따뜻한 캐시로 시작하도록 함
+
+구조:
+    cache-seed/
+        chrome-{version}/
+            Default/Cache/          읽기 전용 (0444/0555)
+            Default/Code Cache/
+            SEED_INFO.json          출처 프로필, 생성 시각, 크기
+        .chrome-{version}.lock      생성 시 flock
+
+- 시드 생성: wg101..wg112 × 버전별 프로필 중 캐시가 가장 큰 것을 골라 복제
+  (Chrome 디스크 캐시는 index 파일 때문에 여러 프로필을 병합할 수 없음)
+- 배포: 프로필의 캐시가 비어 있을 때만 reflink 복제 후 쓰기 권한 부여
+  (Chrome은 캐시를 제자리 수정/축출하므로 시드 자체는 읽기 전용, 프로필에는 쓰기 가능한 복사본)
+
+사용법:
+    python3 uc_lib/core/cache_seed.py build --version 144   # 특정 버전 시드 생성
+    python3 uc_lib/core/cache_seed.py build --all           # 프로필이 있는 모든 버전
+    python3 uc_lib/core/cache_seed.py list
+    python3 uc_lib/core/cache_seed.py remove --version 144
+"""
+
+import os
+import sys
+import json
+import time
+import fcntl
+import shutil
+from pathlib import Path
+from typing import Optional, List, Dict, Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from uc_lib.core.profile_template import PRESERVED_PATHS, TEMPLATES_DIRNAME, clone_tree
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+SEED_DIR = PROJECT_ROOT / "cache-seed"
+SEED_INFO_NAME = "SEED_INFO.json"
+
+# 시드 후보 프로필 위치 (wg 사용자별 + 일반 사용자 홈)
+WG_PROFILES_DIR = PROJECT_ROOT / "uc_browser-profiles"
+
+
+def seed_dir(version: str) -> Path:
+    """버전별 시드 경로"""
+    return SEED_DIR / f"chrome-{version}"
+
+
+def has_seed(version: str) -> bool:
+    """시드 존재 여부 (SEED_INFO.json이 있으면 완성된 시드)"""
+    return (seed_dir(version) / SEED_INFO_NAME).exists()
+
+
+def _dir_size(path: Path) -> int:
+    """디렉토리 전체 크기 (읽을 수 없는 항목은 무시)"""
+    total = 0
+    for root, _, files in os.walk(path, onerror=lambda e: None):
+        for name in files:
+            try:
+                total += os.lstat(os.path.join(root, name)).st_size
+            except OSError:
+                pass
+    return total
+
+
+def _chmod_tree(path: Path, dir_mode: int, file_mode: int):
+    """트리 전체 권한 변경"""
+    for root, dirs, files in os.walk(path):
+        for name in files:
+            try:
+                os.chmod(os.path.join(root, name), file_mode)
+            except OSError:
+                pass
+        for name in dirs:
+            try:
+                os.chmod(os.path.join(root, name), dir_mode)
+            except OSError:
+                pass
+    try:
+        os.chmod(path, dir_mode)
+    except OSError:
+        pass
+
+
+def find_source_profiles(version: str) -> List[Path]:
+    """
+    시드 후보 프로필 목록 (버전별 프로필 + 템플릿)
+
+    Args:
+        version: Chrome 버전
+
+    Returns:
+        Default/Cache가 있는 프로필 디렉토리 리스트
+    """
+    bases = [Path.home() / ".coupang_agent_profiles"]
+    if WG_PROFILES_DIR.exists():
+        bases.extend(p for p in WG_PROFILES_DIR.iterdir() if p.is_dir())
+
+    candidates = []
+    for base in bases:
+        for profile in (base / f"chrome-{version}", base / TEMPLATES_DIRNAME / f"chrome-{version}"):
+            try:
+                if (profile / PRESERVED_PATHS[0]).is_dir():
+                    candidates.append(profile)
+            except PermissionError:
+                continue
+    return candidates
+
+
+def find_seedable_versions() -> List[str]:
+    """프로필이 존재하는 Chrome 버전 목록"""
+    versions = set()
+    bases = [Path.home() / ".coupang_agent_profiles"]
+    if WG_PROFILES_DIR.exists():
+        bases.extend(p for p in WG_PROFILES_DIR.iterdir() if p.is_dir())
+
+    for base in bases:
+        try:
+            for profile in base.glob("chrome-*"):
+                versions.add(profile.name[len("chrome-"):])
+        except PermissionError:
+            continue
+    return sorted(versions)
+
+
+def build_seed(version: str, source_profile: Optional[Path] = None) -> Optional[Path]:
+    """
+    버전별 캐시 시드 (재)생성
+
+    Args:
+        version: Chrome 버전
+        source_profile: 캐시를 가져올 프로필 (None이면 캐시가 가장 큰 프로필 자동 선택)
+
+    Returns:
+        시드 디렉토리 (후보 없음/실패 시 None)
+    """
+    if source_profile is None:
+        candidates = find_source_profiles(version)
+        if not candidates:
+            print(f"   ⚠️  Chrome {version}: 캐시가 있는 프로필 없음")
+            return None
+        sizes = {profile: _dir_size(profile / PRESERVED_PATHS[0]) for profile in candidates}
+        source_profile = max(sizes, key=sizes.get)
+
+    SEED_DIR.mkdir(parents=True, exist_ok=True)
+    try:
+        os.chmod(SEED_DIR, 0o755)
+    except OSError:
+        pass
+
+    target = seed_dir(version)
+    staging = SEED_DIR / f".chrome-{version}.{os.getpid()}.staging"
+    lock_path = SEED_DIR / f".chrome-{version}.lock"
+
+    with open(lock_path, "w") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+
+        shutil.rmtree(staging, ignore_errors=True)
+        (staging / "Default").mkdir(parents=True)
+
+        copied = []
+        for rel_path in PRESERVED_PATHS:
+            src = source_profile / rel_path
+            if src.is_dir():
+                clone_tree(src, staging / rel_path)
+                copied.append(rel_path)
+
+        if not copied:
+            shutil.rmtree(staging, ignore_errors=True)
+            print(f"   ⚠️  Chrome {version}: 복제할 캐시 없음 ({source_profile})")
+            return None
+
+        info = {
+            "version": version,
+            "source": str(source_profile),
+            "paths": copied,
+            "size": _dir_size(staging),
+            "built_at": time.time(),
+        }
+        (staging / SEED_INFO_NAME).write_text(json.dumps(info, ensure_ascii=False, indent=2))
+
+        # 시드는 읽기 전용 (모든 wg 사용자가 읽기만)
+        _chmod_tree(staging, 0o555, 0o444)
+
+        # 기존 시드는 옆으로 치운 뒤 교체 (읽는 중인 워커가 있어도 안전)
+        old = None
+        if target.exists():
+            old = SEED_DIR / f".chrome-{version}.{os.getpid()}.old"
+            os.rename(target, old)
+        os.rename(staging, target)
+        if old:
+            _chmod_tree(old, 0o755, 0o644)
+            shutil.rmtree(old, ignore_errors=True)
+
+    print(f"   🌱 캐시 시드 생성: chrome-{version} ← {source_profile} ({info['size'] / 1024 / 1024:.1f} MB)")
+    return target
+
+
+def seed_profile_cache(profile_dir: Path, version: str) -> int:
+    """
+    프로필의 비어 있는 캐시 디렉토리를 시드로 채움
+
+    이미 캐시가 있는 항목은 건드리지 않으므로 매 실행 호출해도 비용은 stat 몇 번뿐입니다.
+
+    Args:
+        profile_dir: 프로필(또는 템플릿 staging) 디렉토리
+        version: Chrome 버전
+
+    Returns:
+        시드로 채운 항목 수
+    """
+    if not has_seed(version):
+        return 0
+
+    seeded = 0
+    source = seed_dir(version)
+    for rel_path in PRESERVED_PATHS:
+        src = source / rel_path
+        dst = Path(profile_dir) / rel_path
+        if not src.is_dir():
+            continue
+        try:
+            if dst.is_dir() and any(dst.iterdir()):
+                continue
+        except OSError:
+            continue
+
+        try:
+            if dst.exists():
+                shutil.rmtree(dst, ignore_errors=True)
+            clone_tree(src, dst)
+            # 복사본은 Chrome이 갱신/축출할 수 있도록 쓰기 가능
+            _chmod_tree(dst, 0o700, 0o600)
+            seeded += 1
+        except Exception as e:
+            print(f"   ⚠️  캐시 시드 복제 실패 ({rel_path}): {e}")
+
+    if seeded:
+        print(f"   🌱 캐시 시드 적용: {seeded}개 항목 (chrome-{version})")
+    return seeded
+
+
+def list_seeds() -> List[Dict[str, Any]]:
+    """생성된 시드 정보 목록"""
+    seeds = []
+    if not SEED_DIR.exists():
+        return seeds
+
+    for path in sorted(SEED_DIR.glob("chrome-*")):
+        try:
+            seeds.append(json.loads((path / SEED_INFO_NAME).read_text()))
+        except (OSError, ValueError):
+            continue
+    return seeds
+
+
+def remove_seed(version: str) -> bool:
+    """
+    시드 삭제
+
+    Args:
+        version: Chrome 버전
+
+    Returns:
+        삭제 여부
+    """
+    target = seed_dir(version)
+    if not target.exists():
+        return False
+
+    _chmod_tree(target, 0o755, 0o644)
+    shutil.rmtree(target, ignore_errors=True)
+    return True
+
+
+if __name__ == "__main__":
+    import argparse
+    from datetime import datetime
+
+    parser = argparse.ArgumentParser(description="Chrome 버전별 HTTP 캐시 시드 관리")
+    parser.add_argument("command", choices=["build", "list", "remove"], help="작업")
+    parser.add_argument("--version", type=str, default=None, help="Chrome 버전 (예: 144, beta)")
+    parser.add_argument("--all", action="store_true", help="프로필이 있는 모든 버전 (build)")
+    parser.add_argument("--source", type=str, default=None, help="캐시를 가져올 프로필 경로 (build)")
+    args = parser.parse_args()
+
+    if args.command == "build":
+        if args.all:
+            versions = find_seedable_versions()
+        elif args.version:
+            versions = [args.version]
+        else:
+            parser.error("build에는 --version 또는 --all이 필요합니다")
+
+        source = Path(args.source) if args.source else None
+        built = [v for v in versions if build_seed(v, source)]
+        print(f"\n✅ 시드 생성 완료: {len(built)}/{len(versions)}개 버전")
+
+    elif args.command == "list":
+        seeds = list_seeds()
+        if not seeds:
+            print("생성된 캐시 시드 없음")
+        for info in seeds:
+            built_at = datetime.fromtimestamp(info.get("built_at", 0)).strftime("%Y-%m-%d %H:%M")
+            print(f"  chrome-{info['version']:<8} {info.get('size', 0) / 1024 / 1024:7.1f} MB  {built_at}  ← {info.get('source')}")
+
+    elif args.command == "remove":
+        if not args.version:
+            parser.error("remove에는 --version이 필요합니다")
+        print("삭제됨" if remove_seed(args.version) else "시드 없음")
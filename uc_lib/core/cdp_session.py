@@ -0,0 +1,447 @@
+#!/usr/bin/env python3
+"""
+경량 CDP 세션 모듈
+--remote-debugging-port(9222+instance_id)에 직접 WebSocket으로 붙어 chromedriver를 거치지 않고 CDP 명령 실행
+
+chromedriver 경로: Python → HTTP(chromedriver) → CDP → 응답 → HTTP 응답 (호출마다 왕복 2회)
+직접 세션 경로:    Python → WebSocket(CDP) → 응답 (호출 1회, 여러 명령은 파이프라이닝)
+
+- 전용 수신 스레드가 응답(id)과 이벤트(method)를 분배
+- send(): 응답 대기 / send_nowait(): Future 반환 / send_batch(): 여러 명령을 한 번에 전송 후 일괄 대기
+- evaluate()/evaluate_batch(): Runtime.evaluate (returnByValue)
+- on()/off(): 이벤트 구독 (콜백은 수신 스레드에서 실행되므로 send() 대신 send_nowait()만 사용)
+  구독하지 않은 이벤트는 메서드 이름만 보고 JSON 파싱 없이 폐기
+- capture_screenshot(): Page.captureScreenshot
+"""
+
+import json
+import base64
+import threading
+import urllib.request
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Tuple, Callable
+
+try:
+    import websocket  # websocket-client (selenium 의존성)
+    WEBSOCKET_AVAILABLE = True
+except ImportError:
+    WEBSOCKET_AVAILABLE = False
+
+
+# 드라이버별 공유 세션을 보관하는 속성 이름
+_SHARED_SESSION_ATTR = "_rank_cdp_session"
+
+# 이벤트 메시지 접두어 (응답은 {"id": 로 시작)
+_EVENT_PREFIX = '{"method":"'
+
+
+class CDPError(Exception):
+    """CDP 명령 실패 (프로토콜 에러, 연결 종료, 타임아웃)"""
+
+
+class CDPSession:
+    """페이지 타겟 하나에 연결된 CDP WebSocket 세션"""
+
+    def __init__(self, ws_url: str, connect_timeout: float = 10.0):
+        """
+        Args:
+            ws_url: ws://host:port/devtools/page/<targetId>
+            connect_timeout: 연결 타임아웃(초)
+        """
+        if not WEBSOCKET_AVAILABLE:
+            raise CDPError("websocket-client 미설치")
+
+        self.ws_url = ws_url
+
+        # Origin 헤더 생략: Chrome 111+ --remote-allow-origins 정책 회피
+        self._ws = websocket.create_connection(ws_url, suppress_origin=True, timeout=connect_timeout)
+        self._ws.settimeout(1.0)
+
+        self._send_lock = threading.Lock()
+        self._next_id = 0
+        self._pending: Dict[int, Future] = {}
+        self._listeners: Dict[str, List[Callable[[Dict[str, Any]], None]]] = {}
+        self._listeners_lock = threading.Lock()
+
+        self._closed = False
+        self._reader_thread = threading.Thread(target=self._read_loop, daemon=True)
+        self._reader_thread.start()
+
+    # ------------------------------------------------------------------
+    # 생성
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_driver(cls, driver, connect_timeout: float = 10.0) -> "CDPSession":
+        """
+        WebDriver의 현재 탭에 연결
+
+        debuggerAddress는 capabilities에서, targetId는 Target.getTargetInfo로 확인합니다
+        (chromedriver 호출은 이 1회뿐).
+
+        Args:
+            driver: Selenium WebDriver (UCDriverAdapter도 가능)
+            connect_timeout: 연결 타임아웃(초)
+
+        Returns:
+            CDPSession
+        """
+        driver = getattr(driver, "_driver", driver)
+
+        caps = getattr(driver, "capabilities", None) or {}
+        address = caps.get("goog:chromeOptions", {}).get("debuggerAddress")
+        if not address:
+            raise CDPError("DevTools 주소(debuggerAddress)를 찾을 수 없습니다")
+
+        target_info = driver.execute_cdp_cmd("Target.getTargetInfo", {})
+        target_id = target_info.get("targetInfo", {}).get("targetId")
+        if not target_id:
+            raise CDPError("현재 탭의 targetId를 찾을 수 없습니다")
+
+        return cls(f"ws://{address}/devtools/page/{target_id}", connect_timeout=connect_timeout)
+
+    @classmethod
+    def from_debug_port(cls, port: int, host: str = "127.0.0.1", connect_timeout: float = 10.0) -> "CDPSession":
+        """
+        디버깅 포트의 첫 번째 page 타겟에 연결 (드라이버 없이)
+
+        Args:
+            port: --remote-debugging-port 값 (9222 + instance_id)
+            host: 호스트
+            connect_timeout: 연결 타임아웃(초)
+
+        Returns:
+            CDPSession
+        """
+        with urllib.request.urlopen(f"http://{host}:{port}/json/list", timeout=connect_timeout) as resp:
+            targets = json.loads(resp.read().decode("utf-8"))
+
+        for target in targets:
+            if target.get("type") == "page" and target.get("webSocketDebuggerUrl"):
+                return cls(target["webSocketDebuggerUrl"], connect_timeout=connect_timeout)
+
+        raise CDPError(f"page 타겟 없음 (port {port})")
+
+    # ------------------------------------------------------------------
+    # 명령
+    # ------------------------------------------------------------------
+
+    @property
+    def connected(self) -> bool:
+        """연결 유지 여부"""
+        return not self._closed and self._reader_thread.is_alive()
+
+    def send_nowait(self, method: str, params: Optional[Dict[str, Any]] = None) -> Future:
+        """
+        CDP 명령 전송 (응답을 기다리지 않음)
+
+        Args:
+            method: CDP 메서드 (예: "Runtime.evaluate")
+            params: 파라미터
+
+        Returns:
+            응답 result를 담을 Future (에러 시 CDPError)
+        """
+        future = Future()
+        if self._closed:
+            future.set_exception(CDPError("CDP 세션이 닫혔습니다"))
+            return future
+
+        with self._send_lock:
+            self._next_id += 1
+            message_id = self._next_id
+            self._pending[message_id] = future
+            try:
+                self._ws.send(json.dumps({"id": message_id, "method": method, "params": params or {}}))
+            except Exception as e:
+                self._pending.pop(message_id, None)
+                future.set_exception(CDPError(f"{method} 전송 실패: {e}"))
+
+        return future
+
+    def send(self, method: str, params: Optional[Dict[str, Any]] = None, timeout: float = 10.0) -> Dict[str, Any]:
+        """
+        CDP 명령 전송 후 응답 대기
+
+        Args:
+            method: CDP 메서드
+            params: 파라미터
+            timeout: 응답 대기 시간(초)
+
+        Returns:
+            응답 result
+
+        Raises:
+            CDPError: 프로토콜 에러, 연결 종료, 타임아웃
+        """
+        return self._wait(method, self.send_nowait(method, params), timeout)
+
+    def send_batch(
+        self,
+        commands: List[Tuple[str, Optional[Dict[str, Any]]]],
+        timeout: float = 10.0
+    ) -> List[Dict[str, Any]]:
+        """
+        여러 명령을 연속 전송(파이프라이닝) 후 일괄 대기
+
+        Args:
+            commands: [(method, params), ...]
+            timeout: 전체 대기 시간(초)
+
+        Returns:
+            명령 순서대로의 result 리스트
+        """
+        futures = [(method, self.send_nowait(method, params)) for method, params in commands]
+        return [self._wait(method, future, timeout) for method, future in futures]
+
+    def evaluate(self, expression: str, await_promise: bool = False, timeout: float = 10.0) -> Any:
+        """
+        Runtime.evaluate 실행 후 값 반환
+
+        execute_script와 달리 함수 본문이 아닌 "식"을 받습니다 (return 문 사용 불가).
+
+        Args:
+            expression: JavaScript 식
+            await_promise: Promise 결과를 기다릴지 여부
+            timeout: 응답 대기 시간(초)
+
+        Returns:
+            평가 결과 값 (JSON 직렬화 가능한 값)
+        """
+        return self._unwrap(self.send("Runtime.evaluate", self._evaluate_params(expression, await_promise), timeout))
+
+    def evaluate_batch(self, expressions: List[str], await_promise: bool = False, timeout: float = 10.0) -> List[Any]:
+        """
+        여러 식을 파이프라이닝으로 평가
+
+        Args:
+            expressions: JavaScript 식 리스트
+            await_promise: Promise 결과를 기다릴지 여부
+            timeout: 전체 대기 시간(초)
+
+        Returns:
+            식 순서대로의 값 리스트
+        """
+        results = self.send_batch(
+            [("Runtime.evaluate", self._evaluate_params(expr, await_promise)) for expr in expressions],
+            timeout=timeout
+        )
+        return [self._unwrap(result) for result in results]
+
+    def capture_screenshot(self, filepath: Optional[str] = None, image_format: str = "png", timeout: float = 15.0) -> bytes:
+        """
+        현재 viewport 캡처 (Page.captureScreenshot)
+
+        Args:
+            filepath: 저장 경로 (None이면 저장하지 않음)
+            image_format: "png" 또는 "jpeg"
+            timeout: 응답 대기 시간(초)
+
+        Returns:
+            이미지 바이트
+        """
+        result = self.send("Page.captureScreenshot", {"format": image_format}, timeout=timeout)
+        data = base64.b64decode(result.get("data", ""))
+        if not data:
+            raise CDPError("Page.captureScreenshot 결과가 비어 있습니다")
+
+        if filepath:
+            Path(filepath).write_bytes(data)
+        return data
+
+    # ------------------------------------------------------------------
+    # 이벤트
+    # ------------------------------------------------------------------
+
+    def on(self, method: str, callback: Callable[[Dict[str, Any]], None]):
+        """
+        CDP 이벤트 구독 (도메인 enable은 호출자가 직접)
+
+        Args:
+            method: 이벤트 이름 (예: "Network.loadingFailed")
+            callback: params를 받는 콜백 (수신 스레드에서 실행)
+        """
+        with self._listeners_lock:
+            self._listeners.setdefault(method, []).append(callback)
+
+    def off(self, method: str, callback: Optional[Callable[[Dict[str, Any]], None]] = None):
+        """
+        이벤트 구독 해제
+
+        Args:
+            method: 이벤트 이름
+            callback: 해제할 콜백 (None이면 해당 이벤트 전체)
+        """
+        with self._listeners_lock:
+            if callback is None:
+                self._listeners.pop(method, None)
+            elif callback in self._listeners.get(method, []):
+                self._listeners[method].remove(callback)
+
+    # ------------------------------------------------------------------
+    # 종료
+    # ------------------------------------------------------------------
+
+    def close(self):
+        """연결 종료 (대기 중인 명령은 CDPError로 종료)"""
+        if self._closed:
+            return
+        self._closed = True
+
+        try:
+            self._ws.close()
+        except Exception:
+            pass
+
+        if self._reader_thread is not threading.current_thread():
+            self._reader_thread.join(timeout=3)
+
+        self._fail_pending("CDP 세션이 닫혔습니다")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+    # ------------------------------------------------------------------
+    # 내부
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _evaluate_params(expression: str, await_promise: bool) -> Dict[str, Any]:
+        """Runtime.evaluate 파라미터"""
+        return {
+            "expression": expression,
+            "returnByValue": True,
+            "awaitPromise": await_promise,
+        }
+
+    @staticmethod
+    def _unwrap(result: Dict[str, Any]) -> Any:
+        """Runtime.evaluate 결과에서 값 추출 (JS 예외는 CDPError)"""
+        if "exceptionDetails" in result:
+            details = result["exceptionDetails"]
+            text = details.get("exception", {}).get("description") or details.get("text", "")
+            raise CDPError(f"JavaScript 예외: {text}")
+        return result.get("result", {}).get("value")
+
+    def _wait(self, method: str, future: Future, timeout: float) -> Dict[str, Any]:
+        """Future 결과 대기"""
+        try:
+            return future.result(timeout=timeout)
+        except FutureTimeoutError:
+            raise CDPError(f"{method} 응답 시간 초과 ({timeout}초)")
+
+    def _read_loop(self):
+        """수신 스레드: 응답은 Future로, 이벤트는 구독 콜백으로 분배"""
+        while not self._closed:
+            try:
+                raw = self._ws.recv()
+            except websocket.WebSocketTimeoutException:
+                continue
+            except Exception:
+                break
+
+            # 구독하지 않은 이벤트는 JSON 파싱 전에 폐기 (Chrome은 이벤트를 {"method":"..." 로 시작)
+            if isinstance(raw, str) and raw.startswith(_EVENT_PREFIX):
+                end = raw.find('"', len(_EVENT_PREFIX))
+                if end > 0 and raw[len(_EVENT_PREFIX):end] not in self._listeners:
+                    continue
+
+            try:
+                message = json.loads(raw)
+            except (TypeError, ValueError):
+                continue
+
+            message_id = message.get("id")
+            if message_id is not None:
+                future = self._pending.pop(message_id, None)
+                if future is None:
+                    continue
+                if "error" in message:
+                    error = message["error"]
+                    future.set_exception(CDPError(f"{error.get('message', '')} ({error.get('code', '')})"))
+                else:
+                    future.set_result(message.get("result", {}))
+                continue
+
+            method = message.get("method")
+            if not method:
+                continue
+
+            with self._listeners_lock:
+                callbacks = list(self._listeners.get(method, []))
+            for callback in callbacks:
+                try:
+                    callback(message.get("params", {}))
+                except Exception:
+                    pass
+
+        # 브라우저 종료 등으로 연결이 끊기면 대기 중인 명령 해제
+        self._closed = True
+        self._fail_pending("CDP 연결이 끊어졌습니다")
+
+    def _fail_pending(self, reason: str):
+        """대기 중인 모든 Future를 에러로 종료"""
+        with self._send_lock:
+            pending = list(self._pending.values())
+            self._pending.clear()
+        for future in pending:
+            if not future.done():
+                future.set_exception(CDPError(reason))
+
+
+def get_cdp_session(driver) -> Optional[CDPSession]:
+    """
+    드라이버별 공유 CDP 세션 반환 (없거나 끊어졌으면 새로 연결)
+
+    Args:
+        driver: Selenium WebDriver (UCDriverAdapter도 가능)
+
+    Returns:
+        CDPSession (연결 불가 시 None → 호출자는 chromedriver 경로로 fallback)
+    """
+    if not WEBSOCKET_AVAILABLE or driver is None:
+        return None
+
+    driver = getattr(driver, "_driver", driver)
+    session = getattr(driver, _SHARED_SESSION_ATTR, None)
+    if session is False:
+        return None  # 이전 연결 실패 → 재시도하지 않음
+    if session is not None and session.connected:
+        return session
+
+    try:
+        session = CDPSession.from_driver(driver)
+    except Exception as e:
+        print(f"   ⚠️  CDP 직접 연결 실패 (chromedriver 경로 사용): {e}")
+        session = False
+
+    try:
+        setattr(driver, _SHARED_SESSION_ATTR, session)
+    except AttributeError:
+        pass
+    return session or None
+
+
+def close_cdp_session(driver):
+    """
+    드라이버의 공유 CDP 세션 종료
+
+    Args:
+        driver: Selenium WebDriver (UCDriverAdapter도 가능)
+    """
+    if driver is None:
+        return
+
+    driver = getattr(driver, "_driver", driver)
+    session = getattr(driver, _SHARED_SESSION_ATTR, None)
+    if session:
+        session.close()
+        try:
+            setattr(driver, _SHARED_SESSION_ATTR, None)
+        except AttributeError:
+            pass
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+패치된 ChromeDriver 공유 캐시 모듈
+Chrome 빌드별로 undetected-chromedriver 패치를 한 번만 수행하고 모든 워커가 읽기 전용으로 재사용
+
+구조:
+    chromedriver-cache/
+        {빌드 버전}-{원본 지문}/
+            chromedriver          패치 완료 바이너리 (0555)
+            chromedriver.sha256   체크섬 (실행 전 검증)
+        .{키}.lock                생성 시 flock
+
+- 캐시된 바이너리는 이미 패치되어 있으므로 uc.Chrome은 is_binary_patched() 확인 후 그대로 사용
+  (Patcher가 파일을 다시 쓰지 않음 → wg101..wg112 간 패치 경합 없음)
+- 원본 chromedriver가 교체되면(크기/수정시간 변경) 새 키로 다시 생성
+- 체크섬 불일치 시 재생성, 권한 문제 등으로 실패하면 None 반환 (호출자가 기존 방식으로 fallback)
+"""
+
+import os
+import fcntl
+import shutil
+import hashlib
+from pathlib import Path
+from typing import Optional
+
+
+CACHE_DIR = Path(__file__).resolve().parents[2] / "chromedriver-cache"
+BINARY_NAME = "chromedriver"
+CHECKSUM_NAME = "chromedriver.sha256"
+
+
+def _sha256_file(path: Path) -> str:
+    """파일 SHA-256"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _cache_key(source_bin: Path, version_label: str) -> str:
+    """
+    캐시 키 생성: 빌드 버전 + 원본 바이너리 지문(크기/수정시간)
+
+    Args:
+        source_bin: 원본 chromedriver 경로
+        version_label: Chrome 버전 레이블 (VERSION 파일이 없을 때 사용)
+
+    Returns:
+        캐시 디렉토리 이름
+    """
+    build = version_label
+    version_file = source_bin.parent.parent / "VERSION"
+    try:
+        build = version_file.read_text().strip() or version_label
+    except OSError:
+        pass
+
+    st = source_bin.stat()
+    fingerprint = hashlib.sha1(f"{source_bin.resolve()}:{st.st_size}:{st.st_mtime_ns}".encode()).hexdigest()[:12]
+    return f"{build}-{fingerprint}"
+
+
+def _is_valid(entry_dir: Path) -> bool:
+    """캐시 항목 체크섬 검증"""
+    binary = entry_dir / BINARY_NAME
+    checksum_file = entry_dir / CHECKSUM_NAME
+    try:
+        expected = checksum_file.read_text().strip()
+        return bool(expected) and _sha256_file(binary) == expected
+    except OSError:
+        return False
+
+
+def _build_entry(source_bin: Path, entry_dir: Path, version_main: int):
+    """
+    원본 복사 → 패치 → 체크섬 기록 (모두 임시 파일에서 수행 후 rename)
+
+    Args:
+        source_bin: 원본 chromedriver
+        entry_dir: 캐시 항목 디렉토리
+        version_main: Chrome 메이저 버전
+    """
+    import undetected_chromedriver as uc
+
+    entry_dir.mkdir(parents=True, exist_ok=True)
+    try:
+        os.chmod(entry_dir, 0o755)
+    except OSError:
+        pass
+
+    tmp_binary = entry_dir / f".{BINARY_NAME}.{os.getpid()}.tmp"
+    shutil.copy2(source_bin, tmp_binary)
+    os.chmod(tmp_binary, 0o755)
+
+    patcher = uc.Patcher(executable_path=str(tmp_binary), version_main=version_main)
+    patcher.patch_exe()
+    if not patcher.is_binary_patched(str(tmp_binary)):
+        tmp_binary.unlink()
+        raise RuntimeError("ChromeDriver 패치 실패 (injection 코드 블록 없음)")
+
+    checksum = _sha256_file(tmp_binary)
+    os.chmod(tmp_binary, 0o555)  # 읽기 전용 재사용
+
+    tmp_checksum = entry_dir / f".{CHECKSUM_NAME}.{os.getpid()}.tmp"
+    tmp_checksum.write_text(checksum + "\n")
+    os.chmod(tmp_checksum, 0o444)
+
+    # 바이너리 먼저 교체, 체크섬은 마지막 (체크섬이 있으면 항상 완성된 항목)
+    os.replace(tmp_binary, entry_dir / BINARY_NAME)
+    os.replace(tmp_checksum, entry_dir / CHECKSUM_NAME)
+
+
+def get_patched_chromedriver(source_bin: Path, version_label: str, version_main: int) -> Optional[str]:
+    """
+    Chrome 빌드에 맞는 패치된 ChromeDriver 경로 반환 (없으면 생성)
+
+    Args:
+        source_bin: chrome-version/{ver}/chromedriver-linux64/chromedriver
+        version_label: Chrome 버전 레이블 (예: "144", "beta")
+        version_main: Chrome 메이저 버전
+
+    Returns:
+        캐시된 chromedriver 경로 (실패 시 None)
+    """
+    try:
+        source_bin = Path(source_bin)
+        entry_dir = CACHE_DIR / _cache_key(source_bin, version_label)
+
+        # 빠른 경로: 잠금 없이 검증
+        if _is_valid(entry_dir):
+            return str(entry_dir / BINARY_NAME)
+
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        try:
+            os.chmod(CACHE_DIR, 0o777)  # 모든 wg 사용자가 항목 생성 가능
+        except OSError:
+            pass
+
+        lock_path = CACHE_DIR / f".{entry_dir.name}.lock"
+        try:
+            fd = os.open(str(lock_path), os.O_RDWR | os.O_CREAT, 0o666)
+            try:
+                os.fchmod(fd, 0o666)
+            except OSError:
+                pass
+        except PermissionError:
+            fd = os.open(str(lock_path), os.O_RDONLY)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+
+            # 대기 중 다른 워커가 생성했을 수 있음
+            if not _is_valid(entry_dir):
+                print(f"   🔧 ChromeDriver 패치 캐시 생성: {entry_dir.name}")
+                _build_entry(source_bin, entry_dir, version_main)
+        finally:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+            os.close(fd)
+
+        if _is_valid(entry_dir):
+            return str(entry_dir / BINARY_NAME)
+
+    except Exception as e:
+        print(f"   ⚠️  ChromeDriver 캐시 사용 실패: {e}")
+
+    return None
@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+"""
+WebDriver 명령 집계 (명령/호출 위치별 횟수·시간 + N+1 패턴 감지)
+
+BrowserCoreUC가 common/profiling.instrument_driver()의 driver.execute 래퍼에 관찰자로 등록해 모든 WebDriver 명령을 기록
+(Config.ENABLE_DRIVER_ACCOUNTING, uc_agent --driver-accounting, 기본 비활성)
+- WebElement 메서드(find_element, get_attribute, text 등)도 driver.execute를 거치므로 함께 집계
+- 호출 위치: selenium/undetected_chromedriver 내부를 건너뛴 첫 프로젝트 코드 (파일:줄 함수)
+- N+1 감지: 같은 호출 위치에서 같은 명령이 짧은 간격(burst_gap)으로 threshold회 이상 연속되면 표시
+  서로 다른 요소 대상이면(형제 요소 루프) execute_script 한 번으로 묶을 후보
+
+작업 종료 시(BrowserCoreUC.close_browser) 요약을 출력하고
+Config.TRACE_DIR/driver_commands_{사용자}_{YYYYMMDD}.jsonl에 한 줄로 기록합니다 (TRACE_RETENTION_DAYS 보관).
+
+조회:
+    python3 uc_lib/core/driver_accounting.py --since 1d    # 작업 전체 호출 위치/N+1 상위
+"""
+
+import os
+import sys
+import json
+import time
+import threading
+from pathlib import Path
+from typing import Optional, Dict, List, Any, Tuple
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+from common.constants import Config
+from common.tracing import current_job_id, append_record
+from common.profiling import instrument_driver
+
+
+# 호출 위치 탐색 시 건너뛸 경로 (라이브러리 내부 / 계측 코드)
+_SKIP_PATH_PARTS = (
+    os.sep + "selenium" + os.sep,
+    os.sep + "undetected_chromedriver" + os.sep,
+)
+_SKIP_FILES = {
+    os.path.abspath(__file__),
+    str(PROJECT_ROOT / "common" / "profiling.py"),
+}
+_SKIP_QUALNAME_PREFIX = "UCDriverAdapter."  # 어댑터의 위임 메서드
+MAX_TRACKED_ELEMENTS = 64  # burst당 구분할 요소 ID 수 상한
+
+# 요소 대상이 아니어도 반복 자체가 N+1인 명령 (get_log 폴링 등 주기 호출은 제외)
+FIND_COMMANDS = frozenset({"findElement", "findElements"})
+
+
+def _call_site(depth: int = 2) -> str:
+    """selenium/계측 코드를 건너뛴 첫 호출 위치 ("uc_lib/modules/product_finder.py:97 find_all")"""
+    frame = sys._getframe(depth)
+    while frame is not None:
+        code = frame.f_code
+        filename = code.co_filename
+        if filename not in _SKIP_FILES and not any(part in filename for part in _SKIP_PATH_PARTS) \
+                and not getattr(code, "co_qualname", "").startswith(_SKIP_QUALNAME_PREFIX):
+            try:
+                relative = os.path.relpath(filename, PROJECT_ROOT)
+            except ValueError:
+                relative = filename
+            return f"{relative}:{frame.f_lineno} {code.co_name}"
+        frame = frame.f_back
+    return "?"
+
+
+def _element_ids(params: Optional[Dict]) -> List[str]:
+    """명령 대상 요소 ID (findChildElement 등의 id, execute_script 인자의 WebElement)"""
+    if not params:
+        return []
+    ids = []
+    if isinstance(params.get("id"), str):
+        ids.append(params["id"])
+    for arg in params.get("args") or ():
+        element_id = getattr(arg, "id", None)
+        if isinstance(element_id, str):
+            ids.append(element_id)
+    return ids
+
+
+class _SiteStats:
+    """호출 위치 + 명령 1개 통계"""
+
+    __slots__ = ("count", "seconds", "burst", "burst_elements", "last", "max_burst", "max_burst_elements")
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+        self.burst = 0
+        self.burst_elements = set()
+        self.last = 0.0
+        self.max_burst = 0
+        self.max_burst_elements = 0
+
+    def close_burst(self):
+        """진행 중인 연속 호출 구간 마감"""
+        if self.burst > self.max_burst:
+            self.max_burst = self.burst
+            self.max_burst_elements = len(self.burst_elements)
+        self.burst = 0
+        self.burst_elements = set()
+
+
+class CommandAccounting:
+    """작업 1건의 WebDriver 명령 집계"""
+
+    def __init__(self, threshold: int = None, burst_gap: float = None):
+        """
+        Args:
+            threshold: N+1로 표시할 연속 호출 수 (기본: Config.DRIVER_N_PLUS_ONE_THRESHOLD)
+            burst_gap: 연속 호출로 볼 최대 간격(초) (기본: Config.DRIVER_BURST_GAP)
+        """
+        self.threshold = threshold or Config.DRIVER_N_PLUS_ONE_THRESHOLD
+        self.burst_gap = burst_gap or Config.DRIVER_BURST_GAP
+        self.commands: Dict[str, List[float]] = {}             # 명령 → [횟수, 누적 초]
+        self.sites: Dict[Tuple[str, str], _SiteStats] = {}     # (호출 위치, 명령) → 통계
+        self.started = time.time()
+        self._lock = threading.Lock()
+
+    def install(self, driver) -> bool:
+        """
+        driver.execute 래퍼(common/profiling.instrument_driver)에 관찰자로 등록
+
+        Args:
+            driver: Selenium WebDriver (uc.Chrome)
+
+        Returns:
+            등록 여부
+        """
+        return instrument_driver(driver, self.observe)
+
+    def observe(self, command: str, params: Optional[Dict], seconds: float):
+        """driver.execute 래퍼에서 명령마다 호출 (호출 위치 탐색 후 기록)"""
+        self.record(command, params, seconds, _call_site())
+
+    def record(self, command: str, params: Optional[Dict], seconds: float, call_site: str):
+        """
+        명령 1건 기록
+
+        Args:
+            command: WebDriver 명령 이름 (findChildElement, executeCdpCommand:Network.enable 등)
+            params: 명령 파라미터
+            seconds: 소요 시간
+            call_site: 호출 위치
+        """
+        now = time.monotonic()
+        element_ids = _element_ids(params)
+
+        with self._lock:
+            entry = self.commands.get(command)
+            if entry is None:
+                entry = self.commands[command] = [0, 0.0]
+            entry[0] += 1
+            entry[1] += seconds
+
+            key = (call_site, command)
+            site = self.sites.get(key)
+            if site is None:
+                site = self.sites[key] = _SiteStats()
+            site.count += 1
+            site.seconds += seconds
+            if site.burst and now - site.last > self.burst_gap:
+                site.close_burst()
+            site.burst += 1
+            for element_id in element_ids:
+                if len(site.burst_elements) < MAX_TRACKED_ELEMENTS:
+                    site.burst_elements.add(element_id)
+            site.last = now
+
+    def n_plus_one(self) -> List[Dict[str, Any]]:
+        """
+        N+1 의심 호출 위치
+
+        연속 threshold회 이상이면서 서로 다른 요소 2개 이상 대상(형제 요소 루프)이거나
+        driver.find_element(s) 반복인 경우만 표시합니다.
+
+        Returns:
+            [{site, command, max_burst, elements, count, seconds}] (max_burst 내림차순)
+        """
+        flagged = []
+        with self._lock:
+            for (call_site, command), site in self.sites.items():
+                burst, elements = site.max_burst, site.max_burst_elements
+                if site.burst > burst:
+                    burst, elements = site.burst, len(site.burst_elements)
+                if burst >= self.threshold and (elements > 1 or command in FIND_COMMANDS):
+                    flagged.append({
+                        "site": call_site,
+                        "command": command,
+                        "max_burst": burst,
+                        "elements": elements,
+                        "count": site.count,
+                        "seconds": round(site.seconds, 4),
+                    })
+        return sorted(flagged, key=lambda item: -item["max_burst"])
+
+    def summary(self, top: int = 15) -> Dict[str, Any]:
+        """작업 요약 (JSONL 기록용)"""
+        with self._lock:
+            commands = sorted(self.commands.items(), key=lambda item: -item[1][1])
+            sites = sorted(self.sites.items(), key=lambda item: -item[1].seconds)[:top]
+            total_count = sum(int(c) for c, _ in self.commands.values())
+            total_seconds = sum(s for _, s in self.commands.values())
+        return {
+            "job_id": current_job_id(),
+            "ts": round(self.started, 3),
+            "pid": os.getpid(),
+            "commands_total": total_count,
+            "seconds_total": round(total_seconds, 4),
+            "commands": {cmd: {"count": int(c), "seconds": round(s, 4)} for cmd, (c, s) in commands},
+            "top_sites": [
+                {"site": call_site, "command": command, "count": site.count, "seconds": round(site.seconds, 4)}
+                for (call_site, command), site in sites
+            ],
+            "n_plus_one": self.n_plus_one(),
+        }
+
+    def report(self, top: int = 5) -> Optional[Dict[str, Any]]:
+        """
+        작업 요약 출력 + JSONL 기록
+
+        Args:
+            top: 출력할 호출 위치 수
+
+        Returns:
+            요약 dict (명령이 없으면 None)
+        """
+        summary = self.summary()
+        if not summary["commands_total"]:
+            return None
+
+        print(f"   📊 WebDriver 명령 {summary['commands_total']}회 / {summary['seconds_total']:.2f}s")
+        for item in summary["top_sites"][:top]:
+            print(f"      {item['seconds']:6.2f}s {item['count']:>5}회  {item['command']:<24} {item['site']}")
+        for item in summary["n_plus_one"][:top]:
+            target = f", 요소 {item['elements']}개" if item["elements"] > 1 else ""
+            print(f"   ⚠️  N+1 의심: {item['site']} {item['command']} 연속 {item['max_burst']}회{target}")
+
+        _append_summary(summary)
+        return summary
+
+
+def _append_summary(summary: Dict[str, Any]):
+    """요약 한 줄 기록 (날짜별 파일, 실패 무시)"""
+    append_record("driver_commands", summary)
+
+
+if __name__ == "__main__":
+    import argparse
+    import re
+
+    parser = argparse.ArgumentParser(description="작업별 WebDriver 명령 집계 조회")
+    parser.add_argument("--dir", default=Config.TRACE_DIR, help="요약 파일 디렉토리")
+    parser.add_argument("--since", default="1d", help="조회 기간 (30m, 1h, 1d)")
+    parser.add_argument("--top", type=int, default=20, help="출력할 항목 수")
+    args = parser.parse_args()
+
+    match = re.fullmatch(r"(\d+)([mhd])", args.since)
+    if not match:
+        parser.error("--since 형식: 30m, 1h, 1d")
+    since = time.time() - int(match.group(1)) * {"m": 60, "h": 3600, "d": 86400}[match.group(2)]
+
+    jobs = 0
+    commands: Dict[str, List[float]] = {}
+    sites: Dict[Tuple[str, str], List[float]] = {}
+    flagged: Dict[Tuple[str, str], List[int]] = {}   # → [작업 수, 최대 연속, 최대 요소 수]
+    for path in sorted(Path(args.dir).glob("driver_commands_*.jsonl")):
+        try:
+            with open(path, "r", encoding="utf-8", errors="replace") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue
+                    if record.get("ts", 0) < since:
+                        continue
+                    jobs += 1
+                    for cmd, value in record.get("commands", {}).items():
+                        entry = commands.setdefault(cmd, [0, 0.0])
+                        entry[0] += value["count"]
+                        entry[1] += value["seconds"]
+                    for item in record.get("top_sites", []):
+                        entry = sites.setdefault((item["site"], item["command"]), [0, 0.0])
+                        entry[0] += item["count"]
+                        entry[1] += item["seconds"]
+                    for item in record.get("n_plus_one", []):
+                        entry = flagged.setdefault((item["site"], item["command"]), [0, 0, 0])
+                        entry[0] += 1
+                        entry[1] = max(entry[1], item["max_burst"])
+                        entry[2] = max(entry[2], item["elements"])
+        except OSError:
+            continue
+
+    if not jobs:
+        print("기록된 작업 없음")
+        sys.exit(1)
+
+    print(f"📂 작업 {jobs}건\n")
+    print(f"{'명령':<40} {'작업당':>8} {'누적(s)':>9} {'평균(ms)':>9}")
+    for cmd, (count, seconds) in sorted(commands.items(), key=lambda item: -item[1][1])[:args.top]:
+        print(f"{cmd[:40]:<40} {count / jobs:>8.1f} {seconds:>9.2f} {seconds / count * 1000:>9.1f}")
+
+    print(f"\n{'호출 위치':<60} {'명령':<22} {'작업당':>7} {'누적(s)':>9}")
+    for (call_site, cmd), (count, seconds) in sorted(sites.items(), key=lambda item: -item[1][1])[:args.top]:
+        print(f"{call_site[:60]:<60} {cmd[:22]:<22} {count / jobs:>7.1f} {seconds:>9.2f}")
+
+    if flagged:
+        print(f"\n⚠️  N+1 의심 (execute_script 한 번으로 묶을 후보)")
+        print(f"{'호출 위치':<60} {'명령':<22} {'작업':>5} {'최대연속':>8} {'요소':>5}")
+        for (call_site, cmd), (count, burst, elements) in sorted(flagged.items(), key=lambda item: -item[1][0])[:args.top]:
+            print(f"{call_site[:60]:<60} {cmd[:22]:<22} {count:>5} {burst:>8} {elements:>5}")
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+프로필 지연 삭제 모듈
+삭제할 디렉토리를 휴지통으로 원자적 rename 후, 낮은 우선순위 백그라운드 프로세스로 삭제
+
+close_browser()가 GPU 캐시, IndexedDB, Service Worker 등의 rmtree를 기다리지 않도록
+rename(O(1))만 동기 처리하고 실제 삭제는 다음 작업과 겹쳐서 진행합니다.
+
+- 휴지통은 프로필과 같은 파일시스템(프로필 베이스/_trash)에 두어 rename이 항상 원자적
+- 삭제 프로세스: ionice -c3 (idle I/O) + nice 19, 에이전트 종료 후에도 계속 실행
+- 휴지통마다 삭제 프로세스는 하나만 동작 (_trash/.reaper.lock flock)
+  실행 중인 프로세스가 휴지통이 빌 때까지 항목을 하나씩 순서대로 삭제하고,
+  그 사이 추가된 항목도 이어서 처리 (실행 중이면 새로 시작하지 않음)
+- 시작한 프로세스 핸들은 보관했다가 다음 reap()에서 회수하고 실패 종료 코드를 출력
+
+단독 실행 (reap()이 시작하는 삭제 프로세스):
+    python3 uc_lib/core/profile_reaper.py <휴지통 경로>
+"""
+
+import os
+import sys
+import time
+import fcntl
+import shutil
+import subprocess
+from pathlib import Path
+from typing import Dict, List, Optional
+
+
+TRASH_DIRNAME = "_trash"
+LOCK_NAME = ".reaper.lock"
+
+# 이 프로세스가 시작한 삭제 프로세스 (휴지통 경로 → Popen, 종료 코드 회수용)
+_children: Dict[str, subprocess.Popen] = {}
+
+
+def _collect_children():
+    """종료된 삭제 프로세스 회수 (실패 종료 코드 출력)"""
+    for trash, proc in list(_children.items()):
+        code = proc.poll()
+        if code is None:
+            continue
+        del _children[trash]
+        if code != 0:
+            print(f"   ⚠️  백그라운드 삭제 프로세스 실패 (종료 코드 {code}, 남은 항목은 다음 정리 때 재시도)")
+
+
+def _reaper_running(lock_path: Path) -> bool:
+    """다른 삭제 프로세스가 휴지통을 처리 중인지 (lock 점유 여부)"""
+    try:
+        fd = os.open(str(lock_path), os.O_RDWR | os.O_CREAT, 0o666)
+    except OSError:
+        return False
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        return True
+    finally:
+        os.close(fd)  # 잠금 성공 시 바로 해제
+    return False
+
+
+def drain_trash(trash_dir: Path) -> int:
+    """
+    휴지통이 빌 때까지 항목을 하나씩 삭제 (삭제 프로세스 본체)
+
+    lock을 얻지 못하면 다른 프로세스가 처리 중이므로 바로 반환합니다.
+    lock 해제 직후 추가된 항목이 있으면 다시 lock을 얻어 이어서 처리합니다.
+
+    Args:
+        trash_dir: 휴지통 경로
+
+    Returns:
+        삭제에 실패한 항목 수
+    """
+    lock_path = trash_dir / LOCK_NAME
+    failed = set()
+    while True:
+        try:
+            fd = os.open(str(lock_path), os.O_RDWR | os.O_CREAT, 0o666)
+        except OSError:
+            return 1
+        try:
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                return len(failed)  # 다른 삭제 프로세스가 처리 중
+
+            while True:
+                targets = [p for p in trash_dir.iterdir() if p.name != LOCK_NAME and p.name not in failed]
+                if not targets:
+                    break
+                for target in targets:
+                    try:
+                        if target.is_dir() and not target.is_symlink():
+                            shutil.rmtree(target)
+                        else:
+                            target.unlink()
+                    except FileNotFoundError:
+                        pass
+                    except OSError as e:
+                        failed.add(target.name)
+                        print(f"삭제 실패: {target}: {e}", file=sys.stderr)
+        finally:
+            os.close(fd)  # flock 해제
+
+        # 해제 직전에 추가된 항목 확인 (그 사이 시작된 프로세스는 lock을 못 얻고 종료했을 수 있음)
+        try:
+            if not any(p.name != LOCK_NAME and p.name not in failed for p in trash_dir.iterdir()):
+                return len(failed)
+        except OSError:
+            return len(failed)
+
+
+class ProfileReaper:
+    """휴지통 rename + 백그라운드 삭제"""
+
+    def __init__(self, profile_base: str):
+        """
+        Args:
+            profile_base: 사용자별 프로필 베이스 디렉토리 (휴지통 위치 기준)
+        """
+        self.trash_dir = Path(profile_base) / TRASH_DIRNAME
+        self.pending: List[Path] = []
+
+    def defer(self, path: Path) -> Optional[Path]:
+        """
+        삭제 대상을 휴지통으로 이동 (실제 삭제는 reap()에서)
+
+        Args:
+            path: 삭제할 파일 또는 디렉토리
+
+        Returns:
+            휴지통 내 경로 (실패 시 None)
+        """
+        self.trash_dir.mkdir(parents=True, exist_ok=True)
+        target = self.trash_dir / f"{path.name}.{os.getpid()}.{time.time_ns()}"
+        try:
+            os.rename(path, target)
+        except OSError as e:
+            print(f"   ⚠️  휴지통 이동 실패 ({path}): {e}")
+            return None
+
+        self.pending.append(target)
+        return target
+
+    def reap(self):
+        """
+        휴지통 비우기 (낮은 우선순위 분리 프로세스, 기다리지 않음)
+
+        이번에 이동한 항목뿐 아니라 이전 실행에서 남은 항목도 함께 삭제합니다.
+        이미 삭제 프로세스가 실행 중이면 그 프로세스가 새 항목까지 처리하므로 새로 시작하지 않습니다.
+        (실행 중인 프로세스가 막 끝나는 순간 추가된 항목은 다음 reap()에서 처리)
+        """
+        _collect_children()
+        self.pending = []
+        if not self.trash_dir.exists():
+            return
+
+        try:
+            has_targets = any(p.name != LOCK_NAME for p in self.trash_dir.iterdir())
+        except OSError:
+            return
+        # 직접 시작한 프로세스가 아직 실행 중이거나 (lock 획득 전일 수 있음) 다른 프로세스가 처리 중이면 생략
+        if not has_targets or str(self.trash_dir) in _children or _reaper_running(self.trash_dir / LOCK_NAME):
+            return
+
+        cmd = [sys.executable, os.path.abspath(__file__), str(self.trash_dir)]
+        if shutil.which("nice"):
+            cmd = ["nice", "-n", "19"] + cmd
+        if shutil.which("ionice"):
+            cmd = ["ionice", "-c", "3"] + cmd
+
+        try:
+            proc = subprocess.Popen(
+                cmd,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                start_new_session=True  # 에이전트 종료 후에도 계속 실행
+            )
+            _children[str(self.trash_dir)] = proc
+        except OSError as e:
+            print(f"   ⚠️  백그라운드 삭제 시작 실패: {e}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        print("사용법: python3 profile_reaper.py <휴지통 경로>", file=sys.stderr)
+        sys.exit(2)
+    sys.exit(1 if drain_trash(Path(sys.argv[1])) else 0)
@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+"""
+템플릿 프로필 관리 모듈
+Chrome 버전별 "골든" 프로필(보존 캐시만 포함)을 실행마다 복제해서 사용
+
+구조 (프로필 베이스 디렉토리 기준):
+    _templates/chrome-{version}/          골든 프로필 (Default/Cache, Default/Code Cache만)
+    _runs/chrome-{version}-{pid}-{ts}/    실행용 복제본 (브라우저가 쓰는 디렉토리)
+    _trash/                               폐기 대기 (rename 후 백그라운드 삭제)
+
+- 복제: reflink를 지원하는 파일시스템(btrfs/xfs)에서만 템플릿 전체를 cp --reflink로 복제 (메타데이터만 복사)
+  ext4 등 reflink 미지원이면 캐시를 복제하지 않고 빈 프로필로 시작 (복제 비용이 캐시 크기에 비례하지 않도록)
+  → Config.PROFILE_TEMPLATE_COPY_CACHE=True면 미지원 파일시스템에서도 일반 복사
+  하드링크는 Chrome이 캐시 파일을 제자리 수정하므로 템플릿 오염 위험이 있어 사용하지 않음
+- 갱신: 템플릿이 Config.PROFILE_TEMPLATE_MAX_AGE_HOURS보다 오래됐거나 캐시 시드가 더 새로우면 재생성
+- 종료: 실행 디렉토리를 _trash로 rename (O(1)) 후 ProfileReaper가 백그라운드 삭제
+- 매 실행의 시작 상태가 항상 동일 (쿠키/스토리지/핑거프린트 데이터 없음)
+"""
+
+import os
+import time
+import fcntl
+import shutil
+import subprocess
+from pathlib import Path
+from typing import Optional, Dict
+
+from common.constants import Config
+from uc_lib.core.profile_reaper import ProfileReaper
+
+
+# 템플릿에 보존하는 항목 (프로필 루트 기준 상대 경로)
+PRESERVED_PATHS = [
+    "Default/Cache",
+    "Default/Code Cache",
+]
+
+TEMPLATES_DIRNAME = "_templates"
+RUNS_DIRNAME = "_runs"
+TEMPLATE_STAMP = ".template_built"  # 템플릿 생성 시각 기록 파일
+
+_reflink_support: Dict[int, bool] = {}  # st_dev → reflink 지원 여부
+
+
+def clone_tree(src: Path, dst: Path):
+    """
+    디렉토리 트리 복제 (가능하면 reflink)
+
+    Args:
+        src: 원본 디렉토리
+        dst: 대상 디렉토리 (존재하지 않아야 함)
+    """
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        subprocess.run(
+            ["cp", "-a", "--reflink=auto", str(src), str(dst)],
+            check=True,
+            capture_output=True,
+            timeout=120
+        )
+    except (OSError, subprocess.SubprocessError):
+        # GNU cp 없음/실패 → 일반 복사
+        shutil.rmtree(dst, ignore_errors=True)
+        shutil.copytree(src, dst, symlinks=True)
+
+
+def supports_reflink(directory: Path) -> bool:
+    """
+    디렉토리가 있는 파일시스템의 reflink 지원 여부 (장치별로 한 번만 확인)
+
+    Args:
+        directory: 확인할 디렉토리 (존재해야 함)
+
+    Returns:
+        cp --reflink=always 성공 여부
+    """
+    try:
+        dev = os.stat(directory).st_dev
+    except OSError:
+        return False
+    if dev in _reflink_support:
+        return _reflink_support[dev]
+
+    probe = Path(directory) / f".reflink-probe.{os.getpid()}"
+    probe_copy = probe.with_name(probe.name + ".copy")
+    supported = False
+    try:
+        probe.write_bytes(b"reflink")
+        result = subprocess.run(
+            ["cp", "--reflink=always", str(probe), str(probe_copy)],
+            capture_output=True,
+            timeout=10
+        )
+        supported = result.returncode == 0
+    except (OSError, subprocess.SubprocessError):
+        supported = False
+    finally:
+        for path in (probe, probe_copy):
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+    _reflink_support[dev] = supported
+    return supported
+
+
+class ProfileTemplateManager:
+    """Chrome 버전별 템플릿 프로필 생성/복제/폐기 관리"""
+
+    def __init__(self, profile_base: str):
+        """
+        Args:
+            profile_base: 사용자별 프로필 베이스 디렉토리 (Config.get_profile_dir_base())
+        """
+        self.profile_base = Path(profile_base)
+        self.templates_dir = self.profile_base / TEMPLATES_DIRNAME
+        self.runs_dir = self.profile_base / RUNS_DIRNAME
+        self.reaper = ProfileReaper(profile_base)
+
+    def template_dir(self, version: str) -> Path:
+        """버전별 템플릿 경로"""
+        return self.templates_dir / f"chrome-{version}"
+
+    def ensure_template(self, version: str) -> Path:
+        """
+        템플릿이 없거나 오래됐으면 생성
+
+        기존 버전별 프로필(chrome-{version})의 보존 캐시가 있으면 그것으로 시작하고,
+        없으면 캐시 시드(또는 빈 템플릿)로 만듭니다.
+
+        Args:
+            version: Chrome 버전
+
+        Returns:
+            템플릿 디렉토리 경로
+        """
+        template = self.template_dir(version)
+        if template.exists() and not self.is_stale(version):
+            return template
+
+        self.templates_dir.mkdir(parents=True, exist_ok=True)
+        lock_path = self.templates_dir / f".chrome-{version}.lock"
+
+        with open(lock_path, "w") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+
+            # 다른 프로세스가 먼저 만들었거나 갱신했을 수 있음
+            if template.exists() and not self.is_stale(version):
+                return template
+
+            self.rebuild_template(version, self.profile_base / f"chrome-{version}")
+
+        return template
+
+    def is_stale(self, version: str) -> bool:
+        """
+        템플릿 갱신 필요 여부 (최대 보존 시간 초과 또는 캐시 시드가 템플릿보다 새로움)
+
+        Args:
+            version: Chrome 버전
+
+        Returns:
+            재생성이 필요하면 True
+        """
+        template = self.template_dir(version)
+        try:
+            built_at = (template / TEMPLATE_STAMP).stat().st_mtime
+        except OSError:
+            return True  # 생성 시각 기록 없음 (이전 형식 템플릿)
+
+        max_age = Config.PROFILE_TEMPLATE_MAX_AGE_HOURS
+        if max_age and time.time() - built_at > max_age * 3600:
+            return True
+
+        from uc_lib.core.cache_seed import seed_dir, SEED_INFO_NAME
+        try:
+            return (seed_dir(version) / SEED_INFO_NAME).stat().st_mtime > built_at
+        except OSError:
+            return False
+
+    def rebuild_template(self, version: str, source_profile: Optional[Path] = None) -> Path:
+        """
+        템플릿 (재)생성
+
+        Args:
+            version: Chrome 버전
+            source_profile: 보존 캐시를 가져올 프로필 (None이면 빈 템플릿)
+
+        Returns:
+            템플릿 디렉토리 경로
+        """
+        template = self.template_dir(version)
+        staging = self.templates_dir / f".chrome-{version}.{os.getpid()}.staging"
+        shutil.rmtree(staging, ignore_errors=True)
+        (staging / "Default").mkdir(parents=True)
+
+        copied = 0
+        if source_profile and source_profile.exists():
+            for rel_path in PRESERVED_PATHS:
+                src = source_profile / rel_path
+                if src.is_dir():
+                    clone_tree(src, staging / rel_path)
+                    copied += 1
+
+        # 보존 캐시가 없으면 공유 캐시 시드로 채움
+        if copied < len(PRESERVED_PATHS):
+            from uc_lib.core.cache_seed import seed_profile_cache
+            copied += seed_profile_cache(staging, version)
+
+        (staging / TEMPLATE_STAMP).write_text(str(time.time()))
+
+        # 기존 템플릿은 폐기 후 원자적으로 교체
+        if template.exists():
+            self.reaper.defer(template)
+        os.rename(staging, template)
+        self.reaper.reap()
+
+        print(f"   🧬 템플릿 프로필 생성: {template} (보존 캐시 {copied}개)")
+        return template
+
+    def create_run_dir(self, version: str) -> Path:
+        """
+        템플릿을 복제해 이번 실행용 프로필 디렉토리 생성
+
+        reflink 미지원 파일시스템에서는 캐시를 복제하지 않고 빈 프로필을 만듭니다
+        (Config.PROFILE_TEMPLATE_COPY_CACHE=True면 일반 복사).
+
+        Args:
+            version: Chrome 버전
+
+        Returns:
+            실행용 프로필 디렉토리
+        """
+        template = self.ensure_template(version)
+        self.sweep_stale_runs()
+
+        run_dir = self.runs_dir / f"chrome-{version}-{os.getpid()}-{int(time.time() * 1000)}"
+        if supports_reflink(self.templates_dir) or Config.PROFILE_TEMPLATE_COPY_CACHE:
+            clone_tree(template, run_dir)
+        else:
+            (run_dir / "Default").mkdir(parents=True)
+            print(f"   ⚠️  reflink 미지원 파일시스템 - 캐시 복제 생략 (빈 프로필로 시작)")
+        return run_dir
+
+    def discard_run_dir(self, run_dir: Path):
+        """
+        실행용 프로필 폐기 (rename은 즉시, 실제 삭제는 백그라운드)
+
+        Args:
+            run_dir: create_run_dir()이 반환한 디렉토리
+        """
+        if not run_dir or not run_dir.exists():
+            return
+
+        if self.reaper.defer(run_dir):
+            self.reaper.reap()
+
+    def sweep_stale_runs(self):
+        """비정상 종료로 남은 실행 디렉토리 정리 (소유 프로세스가 없는 것만)"""
+        if not self.runs_dir.exists():
+            return
+
+        for run_dir in self.runs_dir.iterdir():
+            try:
+                pid = int(run_dir.name.rsplit("-", 2)[1])
+            except (IndexError, ValueError):
+                continue
+
+            if pid == os.getpid() or _pid_alive(pid):
+                continue
+
+            self.discard_run_dir(run_dir)
+
+
+def _pid_alive(pid: int) -> bool:
+    """프로세스 생존 여부"""
+    try:
+        os.kill(pid, 0)
+        return True
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
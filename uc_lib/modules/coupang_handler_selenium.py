@@ -14,6 +14,7 @@ from selenium.webdriver.common.keys import Keys
 
 from common.constants import ExecutionStatus, ActionStatus
 from common.utils.human_behavior_selenium import natural_typing, before_search
+from common.tracing import traced
 
 # 통합 이벤트 로거
 try:
@@ -44,6 +45,7 @@ class CoupangHandlerSelenium:
         self.worker_id = worker_id or "Unknown"
         self.vpn_interface = vpn_interface
 
+    @traced("coupang.navigate_home")
     def navigate_to_home(self, video_recorder=None) -> bool:
         """
         쿠팡 홈페이지로 이동 (20초 타임아웃)
@@ -100,6 +102,7 @@ class CoupangHandlerSelenium:
             self.action_status = ActionStatus.ERROR_NAVIGATION
             return False
 
+    @traced("coupang.search")
     def search_product(self, keyword: str, video_recorder=None) -> bool:
         """
         상품 검색 (JavaScript 스크립트 방식)
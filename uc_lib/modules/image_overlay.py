@@ -4,10 +4,114 @@
 스크린샷에 텍스트, 배지, 워터마크 등을 추가하는 기능 제공
 """
 
+import threading
+from functools import lru_cache
 from PIL import Image, ImageDraw, ImageFont
 from pathlib import Path
 from typing import Optional, Tuple
 
+# 프로세스 전역 폰트 캐시: (폰트 경로 목록, 크기) → 폰트 객체
+# CJK .ttc 로드는 수십 ms가 걸리므로 ImageOverlay 인스턴스마다 다시 읽지 않음
+_FONT_CACHE = {}
+_FONT_CACHE_LOCK = threading.Lock()
+
+# 사전 렌더링된 배지 LRU 크기
+BADGE_CACHE_SIZE = 128
+
+
+def _get_font(font_paths: Tuple[str, ...], font_size: int) -> ImageFont.FreeTypeFont:
+    """
+    캐시된 폰트 반환 (없으면 로드 후 캐시)
+
+    Args:
+        font_paths: 우선순위 순 폰트 경로 튜플
+        font_size: 폰트 크기
+
+    Returns:
+        로드된 폰트 객체
+    """
+    key = (font_paths, font_size)
+    font = _FONT_CACHE.get(key)
+    if font is not None:
+        return font
+
+    with _FONT_CACHE_LOCK:
+        font = _FONT_CACHE.get(key)
+        if font is None:
+            for font_path in font_paths:
+                try:
+                    font = ImageFont.truetype(font_path, font_size)
+                    break
+                except Exception:
+                    continue
+            else:
+                # Fallback: 기본 폰트
+                font = ImageFont.load_default()
+            _FONT_CACHE[key] = font
+
+    return font
+
+
+@lru_cache(maxsize=BADGE_CACHE_SIZE)
+def _render_badge(
+    font_paths: Tuple[str, ...],
+    font_size: int,
+    text: str,
+    text_color: Tuple[int, ...],
+    bg_color: Tuple[int, ...],
+    padding: int,
+    mode: str
+) -> Tuple[Image.Image, Image.Image, int, int, int, int]:
+    """
+    텍스트 배지(배경 박스 + 텍스트)를 대상 이미지 모드로 사전 렌더링
+
+    원본 이미지에 직접 그리던 것과 같은 그리기 연산을 같은 모드의 작은 캔버스에 수행하므로
+    붙여넣은 결과도 같습니다 (RGB 스크린샷에서는 배경 박스가 불투명).
+    반환된 이미지는 캐시에 공유되므로 읽기 전용으로만 사용해야 합니다.
+
+    Returns:
+        (배지 이미지, 붙여넣기 마스크, 텍스트 원점 기준 x 오프셋, y 오프셋, 텍스트 너비, 텍스트 높이)
+    """
+    font = _get_font(font_paths, font_size)
+    bbox = font.getbbox(text)
+    text_width = bbox[2] - bbox[0]
+    text_height = bbox[3] - bbox[1]
+
+    # 텍스트 원점 (0, 0) 기준으로 배경 박스와 실제 글리프 영역을 모두 포함하는 범위
+    left = min(-padding, bbox[0])
+    top = min(-padding, bbox[1])
+    right = max(text_width + padding, bbox[2])
+    bottom = max(text_height + padding, bbox[3])
+
+    size = (right - left + 1, bottom - top + 1)
+    box = [(-padding - left, -padding - top), (text_width + padding - left, text_height + padding - top)]
+
+    badge = Image.new(mode, size)
+    draw = ImageDraw.Draw(badge)
+    draw.rectangle(box, fill=bg_color)
+    draw.text((-left, -top), text, fill=text_color, font=font)
+
+    # 배경 박스 + 박스 밖으로 나온 글리프만 원본에 반영
+    mask = Image.new("L", size, 0)
+    mask_draw = ImageDraw.Draw(mask)
+    mask_draw.rectangle(box, fill=255)
+    mask_draw.text((-left, -top), text, fill=255, font=font)
+
+    return badge, mask, left, top, text_width, text_height
+
+
+def _composite_badge(img: Image.Image, badge: Image.Image, mask: Image.Image, x: int, y: int):
+    """
+    배지를 마스크 영역만 원본에 붙임 (배지 영역만 수정, 경계 밖은 자동 클리핑)
+
+    Args:
+        img: 대상 이미지 (in-place 수정)
+        badge: 대상 이미지와 같은 모드의 배지
+        mask: 붙여넣기 마스크
+        x, y: 배지 좌상단 좌표
+    """
+    img.paste(badge, (x, y), mask)
+
 
 class ImageOverlay:
     """스크린샷에 텍스트 오버레이를 추가하는 클래스"""
@@ -28,19 +132,78 @@ class ImageOverlay:
 
     def _load_font(self) -> ImageFont.FreeTypeFont:
         """
-        한글 지원 폰트 로드 (fallback 포함)
+        한글 지원 폰트 로드 (fallback 포함, 프로세스 전역 캐시 사용)
 
         Returns:
             로드된 폰트 객체
         """
-        for font_path in self.FONT_PATHS:
-            try:
-                return ImageFont.truetype(font_path, self.font_size)
-            except Exception:
-                continue
+        return _get_font(tuple(self.FONT_PATHS), self.font_size)
+
+    def _get_badge(
+        self,
+        text: str,
+        text_color: Tuple[int, ...],
+        bg_color: Tuple[int, ...],
+        padding: int,
+        mode: str
+    ) -> Tuple[Image.Image, Image.Image, int, int, int, int]:
+        """(text, 스타일, 이미지 모드) 키로 캐시된 배지 반환"""
+        return _render_badge(
+            tuple(self.FONT_PATHS), self.font_size, text,
+            tuple(text_color), tuple(bg_color), padding, mode
+        )
+
+    @staticmethod
+    def _calc_position(
+        position: str,
+        img_size: Tuple[int, int],
+        text_width: int,
+        text_height: int,
+        padding: int,
+        y_offset: int
+    ) -> Tuple[int, int]:
+        """
+        텍스트 원점 좌표 계산
 
-        # Fallback: 기본 폰트
-        return ImageFont.load_default()
+        Returns:
+            (x, y) 텍스트 좌표
+
+        Raises:
+            ValueError: 알 수 없는 위치
+        """
+        img_width, img_height = img_size
+
+        if position == "top-center":
+            return (img_width - text_width) // 2, y_offset
+        elif position == "top-left":
+            return padding, y_offset
+        elif position == "top-right":
+            return img_width - text_width - padding, y_offset
+        elif position == "bottom-center":
+            return (img_width - text_width) // 2, img_height - text_height - y_offset
+        elif position == "bottom-left":
+            return padding, img_height - text_height - y_offset
+        elif position == "bottom-right":
+            return img_width - text_width - padding, img_height - text_height - y_offset
+
+        raise ValueError(f"Unknown position: {position}")
+
+    def _apply_overlay(
+        self,
+        img: Image.Image,
+        text: str,
+        position: str,
+        text_color: Tuple[int, ...],
+        bg_color: Tuple[int, ...],
+        padding: int,
+        y_offset: int
+    ):
+        """캐시된 배지를 계산된 위치에 합성 (배지 영역만 수정)"""
+        badge, mask, left, top, text_width, text_height = self._get_badge(
+            text, text_color, bg_color, padding, img.mode
+        )
+        x, y = self._calc_position(position, img.size, text_width, text_height, padding, y_offset)
+        _composite_badge(img, badge, mask, x + left, y + top)
 
     def add_text_overlay(
         self,
@@ -70,47 +233,9 @@ class ImageOverlay:
         try:
             # 이미지 열기
             img = Image.open(image_path)
-            draw = ImageDraw.Draw(img)
-
-            # 텍스트 크기 계산
-            bbox = draw.textbbox((0, 0), text, font=self.font)
-            text_width = bbox[2] - bbox[0]
-            text_height = bbox[3] - bbox[1]
-
-            # 이미지 크기
-            img_width, img_height = img.size
-
-            # 위치 계산
-            if position == "top-center":
-                x = (img_width - text_width) // 2
-                y = y_offset
-            elif position == "top-left":
-                x = padding
-                y = y_offset
-            elif position == "top-right":
-                x = img_width - text_width - padding
-                y = y_offset
-            elif position == "bottom-center":
-                x = (img_width - text_width) // 2
-                y = img_height - text_height - y_offset
-            elif position == "bottom-left":
-                x = padding
-                y = img_height - text_height - y_offset
-            elif position == "bottom-right":
-                x = img_width - text_width - padding
-                y = img_height - text_height - y_offset
-            else:
-                raise ValueError(f"Unknown position: {position}")
-
-            # 배경 박스 그리기
-            box_coords = [
-                (x - padding, y - padding),
-                (x + text_width + padding, y + text_height + padding)
-            ]
-            draw.rectangle(box_coords, fill=bg_color)
+            img.load()
 
-            # 텍스트 그리기
-            draw.text((x, y), text, fill=text_color, font=self.font)
+            self._apply_overlay(img, text, position, text_color, bg_color, padding, y_offset)
 
             # 이미지 저장 (덮어쓰기)
             img.save(image_path)
@@ -147,43 +272,22 @@ class ImageOverlay:
         """
         try:
             img = Image.open(image_path)
-            draw = ImageDraw.Draw(img)
+            img.load()
 
             for overlay in overlays:
-                text = overlay.get("text", "")
                 position = overlay.get("position", "top-center")
-                text_color = overlay.get("text_color", (255, 255, 0))
-                bg_color = overlay.get("bg_color", (0, 0, 0, 180))
-                padding = overlay.get("padding", 10)
-                y_offset = overlay.get("y_offset", 20)
-
-                # 텍스트 크기 계산
-                bbox = draw.textbbox((0, 0), text, font=self.font)
-                text_width = bbox[2] - bbox[0]
-                text_height = bbox[3] - bbox[1]
-
-                # 이미지 크기
-                img_width, img_height = img.size
-
-                # 위치 계산
-                if position == "top-center":
-                    x = (img_width - text_width) // 2
-                    y = y_offset
-                elif position == "bottom-center":
-                    x = (img_width - text_width) // 2
-                    y = img_height - text_height - y_offset
-                else:
+                if position not in ("top-center", "bottom-center"):
                     continue  # 지원하지 않는 위치는 스킵
 
-                # 배경 박스
-                box_coords = [
-                    (x - padding, y - padding),
-                    (x + text_width + padding, y + text_height + padding)
-                ]
-                draw.rectangle(box_coords, fill=bg_color)
-
-                # 텍스트
-                draw.text((x, y), text, fill=text_color, font=self.font)
+                self._apply_overlay(
+                    img,
+                    overlay.get("text", ""),
+                    position,
+                    overlay.get("text_color", (255, 255, 0)),
+                    overlay.get("bg_color", (0, 0, 0, 180)),
+                    overlay.get("padding", 10),
+                    overlay.get("y_offset", 20)
+                )
 
             # 저장
             img.save(image_path)
@@ -12,6 +12,8 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webelement import WebElement
 
 from common.constants import Config
+from common.tracing import traced
+from uc_lib.core.cdp_session import get_cdp_session
 
 
 class ProductFinder:
@@ -1070,6 +1072,7 @@ class ProductFinder:
             print(f"   ⚠️  페이지네이션 고정 실패: {e}")
             return False
 
+    @traced("finder.lazy_scroll")
     def scroll_full_page_for_lazy_loading(self, rounds: int = 2, scroll_pause: float = 0.5) -> None:
         """
         검색 결과 페이지 전체를 위아래로 스크롤하여 모든 lazy 이미지 트리거
@@ -1083,9 +1086,19 @@ class ProductFinder:
         try:
             print(f"   🔄 페이지 전체 스크롤 시작 ({rounds}회 왕복)...")
 
-            # 현재 페이지의 전체 높이 확인
-            total_height = self.driver.execute_script("return document.body.scrollHeight")
-            viewport_height = self.driver.execute_script("return window.innerHeight")
+            # 현재 페이지의 전체 높이 확인 (직접 CDP 세션이 있으면 한 번에 조회)
+            session = get_cdp_session(self.driver)
+            if session:
+                total_height, viewport_height = session.evaluate_batch([
+                    "document.body.scrollHeight",
+                    "window.innerHeight",
+                ])
+            else:
+                total_height = self.driver.execute_script("return document.body.scrollHeight")
+                viewport_height = self.driver.execute_script("return window.innerHeight")
+
+            # 스크롤 명령 실행 경로 (식 그대로 전달하므로 두 경로 모두 동일하게 동작)
+            run_js = session.evaluate if session else self.driver.execute_script
 
             print(f"   📏 페이지 높이: {total_height}px, 뷰포트: {viewport_height}px")
 
@@ -1097,30 +1110,28 @@ class ProductFinder:
                 step_size = total_height // scroll_steps
 
                 # 맨 위로 이동
-                self.driver.execute_script("window.scrollTo(0, 0);")
+                run_js("window.scrollTo(0, 0);")
                 time.sleep(scroll_pause)
 
                 # 아래로 단계별 스크롤
                 for step in range(1, scroll_steps + 1):
                     scroll_to = min(step * step_size, total_height)
-                    self.driver.execute_script(f"window.scrollTo(0, {scroll_to});")
+                    run_js(f"window.scrollTo(0, {scroll_to});")
                     time.sleep(scroll_pause)
 
                 # 맨 아래 확실히 도달
-                self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+                run_js("window.scrollTo(0, document.body.scrollHeight);")
                 time.sleep(scroll_pause)
 
                 # 2. 맨 아래에서 맨 위로 천천히 스크롤
-                current_height = self.driver.execute_script("return window.pageYOffset + window.innerHeight")
-
                 # 위로 단계별 스크롤
                 for step in range(scroll_steps - 1, -1, -1):
                     scroll_to = step * step_size
-                    self.driver.execute_script(f"window.scrollTo(0, {scroll_to});")
+                    run_js(f"window.scrollTo(0, {scroll_to});")
                     time.sleep(scroll_pause)
 
                 # 맨 위 확실히 도달
-                self.driver.execute_script("window.scrollTo(0, 0);")
+                run_js("window.scrollTo(0, 0);")
                 time.sleep(scroll_pause)
 
             print(f"   ✅ 전체 페이지 스크롤 완료 ({rounds}회 왕복)")
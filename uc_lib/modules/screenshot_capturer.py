@@ -11,6 +11,10 @@ from pathlib import Path
 from typing import Optional, Dict
 from datetime import datetime
 
+from common.tracing import traced
+from common.profiling import note_artifact
+from uc_lib.core.cdp_session import get_cdp_session
+
 
 class ScreenshotCapturer:
     """스크린샷 캡처 및 저장을 담당하는 클래스"""
@@ -24,6 +28,7 @@ class ScreenshotCapturer:
         self.driver = driver
         self.base_dir = Path(base_dir)
 
+    @traced("screenshot.capture")
     def capture(
         self,
         keyword: str = "",
@@ -71,6 +76,9 @@ class ScreenshotCapturer:
             print(f"   Path: {filepath}")
             print(f"   Size: {file_size:.2f} KB")
 
+            # --profile: 프로파일 파일을 스크린샷 옆에 저장
+            note_artifact(str(filepath))
+
             # 오래된 스크린샷 자동 정리 (최신 50개만 유지)
             from common.utils.file_cleanup import cleanup_screenshots
             try:
@@ -148,9 +156,20 @@ class ScreenshotCapturer:
         """
         현재 Viewport만 캡처
 
+        직접 CDP 세션이 있으면 Page.captureScreenshot을 바로 호출하고,
+        없거나 실패하면 chromedriver의 save_screenshot으로 fallback합니다.
+
         Args:
             filepath: 저장할 파일 경로
         """
+        session = get_cdp_session(self.driver)
+        if session:
+            try:
+                session.capture_screenshot(str(filepath))
+                return
+            except Exception as e:
+                print(f"   ⚠️  CDP 캡처 실패, save_screenshot 사용: {e}")
+
         self.driver.save_screenshot(str(filepath))
 
     def _capture_full_page(self, filepath: Path):
@@ -218,46 +237,130 @@ class ScreenshotCapturer:
             print(f"   ⚠️  no_img 체크 실패: {e}")
             return {'viewport': 0, 'total': 0}
 
-    def _resolve_no_img_in_viewport(self, max_retries: int = 2) -> bool:
+    def wait_for_viewport_images(self, timeout: float = 3.0) -> Dict[str, int]:
         """
-        Viewport 내 no_img 이미지 해결 시도
+        Viewport 내 이미지가 실제로 디코딩될 때까지 대기 (단일 execute_async_script)
+
+        고정 sleep 대신 브라우저 안에서 직접 대기합니다:
+        - 로딩 중인 이미지: load/error 이벤트 대기
+        - no_img 플레이스홀더: lazy loader가 실제 src로 교체할 때까지 폴링
+        - 모두 로드되면 img.decode() 프로미스로 디코딩 완료까지 대기
+        이미 깨끗한 페이지는 즉시 반환됩니다.
+
+        Args:
+            timeout: 최대 대기 시간(초) (기본: 3.0)
+
+        Returns:
+            {'viewport': viewport 내 이미지 수, 'pending': 미완료 수,
+             'no_img': 남은 no_img 수, 'elapsed_ms': 대기 시간, 'timed_out': 0/1}
+        """
+        try:
+            result = self.driver.execute_async_script("""
+                const done = arguments[arguments.length - 1];
+                const deadline = performance.now() + arguments[0];
+                const started = performance.now();
+                const PLACEHOLDER = 'no_img_1000_1000.png';
+
+                const inViewport = (img) => {
+                    const rect = img.getBoundingClientRect();
+                    return rect.width > 0 && rect.height > 0 &&
+                           rect.bottom > 0 && rect.top < window.innerHeight &&
+                           rect.right > 0 && rect.left < window.innerWidth;
+                };
+                const collect = () => Array.from(document.images).filter(inViewport);
+                const isPlaceholder = (img) => (img.currentSrc || img.src).includes(PLACEHOLDER);
+                const isPending = (img) => !img.complete || isPlaceholder(img);
+
+                const finish = (images, timedOut) => done({
+                    viewport: images.length,
+                    pending: images.filter(img => !img.complete).length,
+                    no_img: images.filter(isPlaceholder).length,
+                    elapsed_ms: Math.round(performance.now() - started),
+                    timed_out: timedOut ? 1 : 0
+                });
+
+                const withDeadline = (promise) => Promise.race([
+                    promise,
+                    new Promise(resolve => setTimeout(resolve, Math.max(0, deadline - performance.now())))
+                ]);
+
+                const poll = () => {
+                    const images = collect();
+                    const pending = images.filter(isPending);
+
+                    if (pending.length === 0) {
+                        // 로드 완료 → 디코딩(페인트 가능 상태)까지 대기
+                        const decodes = images.map(img => img.decode ? img.decode().catch(() => null) : null);
+                        withDeadline(Promise.all(decodes)).then(() => {
+                            finish(collect(), performance.now() >= deadline);
+                        });
+                        return;
+                    }
+
+                    if (performance.now() >= deadline) {
+                        finish(images, true);
+                        return;
+                    }
+
+                    // 로딩 중 이미지는 이벤트로, 플레이스홀더 교체는 짧은 폴링으로 감지
+                    const waits = pending.filter(img => !img.complete).map(img => new Promise(resolve => {
+                        img.addEventListener('load', resolve, {once: true});
+                        img.addEventListener('error', resolve, {once: true});
+                    }));
+                    waits.push(new Promise(resolve => setTimeout(resolve, 50)));
+                    withDeadline(Promise.race(waits)).then(poll);
+                };
+
+                poll();
+            """, int(timeout * 1000))
+
+            return result
+
+        except Exception as e:
+            print(f"   ⚠️  이미지 로딩 대기 실패: {e}")
+            return {'viewport': 0, 'pending': 0, 'no_img': 0, 'elapsed_ms': 0, 'timed_out': 1}
+
+    def _resolve_no_img_in_viewport(self, max_retries: int = 2, timeout: float = 3.0) -> bool:
+        """
+        Viewport 내 이미지 로딩/디코딩 대기 및 no_img 해결 시도
+
+        이미지가 모두 그려지는 즉시 반환하고, 데드라인까지 no_img가 남아 있을 때만
+        미세 스크롤로 lazy loading을 재트리거합니다.
 
         Args:
             max_retries: 최대 재시도 횟수 (기본: 2)
+            timeout: 시도당 최대 대기 시간(초) (기본: 3.0)
 
         Returns:
             성공 여부 (viewport에 no_img 없으면 True)
         """
         for attempt in range(1, max_retries + 1):
-            # no_img 체크
-            result = self.check_no_img_in_viewport()
-            viewport_count = result['viewport']
+            result = self.wait_for_viewport_images(timeout=timeout)
 
-            # viewport에 no_img 없으면 성공
-            if viewport_count == 0:
+            # viewport 이미지가 모두 디코딩되었으면 성공
+            if result['no_img'] == 0 and result['pending'] == 0:
                 if attempt > 1:
-                    print(f"   ✅ no_img 해결 완료 (시도 {attempt}회)")
+                    print(f"   ✅ viewport 이미지 준비 완료 ({result['viewport']}개, {result['elapsed_ms']}ms)")
                 return True
 
-            # no_img가 있으면 해결 시도
-            if attempt < max_retries:
-                print(f"   🔄 no_img 해결 시도 중... ({attempt}/{max_retries})")
-
-                # 1. 추가 대기 (네트워크 완료 대기)
-                time.sleep(2)
+            print(f"   🖼️  미완료 이미지: 로딩 {result['pending']}개 / no_img {result['no_img']}개 "
+                  f"({result['elapsed_ms']}ms)")
 
-                # 2. 미세 스크롤로 lazy loading 재트리거
+            # no_img가 남아 있으면 미세 스크롤로 lazy loading 재트리거
+            if attempt < max_retries and result['no_img'] > 0:
+                print(f"   🔄 no_img 해결 시도 중... ({attempt}/{max_retries})")
                 try:
-                    self.driver.execute_script("""
+                    # 렌더링 2프레임 뒤 원위치 (IntersectionObserver가 변화를 관측하도록)
+                    self.driver.execute_async_script("""
+                        const done = arguments[arguments.length - 1];
                         const currentScroll = window.scrollY;
-                        // 아래로 100px 스크롤
                         window.scrollBy(0, 100);
-                        setTimeout(() => {
-                            // 원래 위치로 복귀
+                        requestAnimationFrame(() => requestAnimationFrame(() => {
                             window.scrollTo(0, currentScroll);
-                        }, 500);
+                            done(true);
+                        }));
+                        setTimeout(() => { window.scrollTo(0, currentScroll); done(false); }, 300);
                     """)
-                    time.sleep(0.8)
                 except Exception as e:
                     print(f"   ⚠️  스크롤 재트리거 실패: {e}")
 
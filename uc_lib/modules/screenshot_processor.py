@@ -43,7 +43,8 @@ class ScreenshotProcessor:
                 upload_url=upload_url,
                 max_retries=3,
                 retry_delay=1.0,
-                timeout=30
+                timeout=30,
+                enable_dedupe=Config.ENABLE_UPLOAD_DEDUPE
             )
         else:
             self.uploader = None
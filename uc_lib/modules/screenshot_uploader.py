@@ -10,6 +10,10 @@ from pathlib import Path
 from typing import Optional, Dict, Any
 import time
 
+from common.tracing import traced
+
+from .upload_dedupe_index import UploadDedupeIndex, compute_sha256, compute_dhash
+
 
 class ScreenshotUploader:
     """스크린샷을 서버에 업로드하는 클래스"""
@@ -19,7 +23,10 @@ class ScreenshotUploader:
         upload_url: str,
         max_retries: int = 3,
         retry_delay: float = 1.0,
-        timeout: int = 30
+        timeout: int = 30,
+        enable_dedupe: bool = False,
+        perceptual_dedupe: bool = False,
+        dedupe_index_path: Optional[str] = None
     ):
         """
         Args:
@@ -27,12 +34,18 @@ class ScreenshotUploader:
             max_retries: 최대 재시도 횟수 (기본: 3)
             retry_delay: 재시도 간 대기 시간(초) (기본: 1.0)
             timeout: 요청 타임아웃(초) (기본: 30)
+            enable_dedupe: 이미 업로드한 동일 이미지 재전송 생략 (기본: False)
+            perceptual_dedupe: 바이트가 달라도 perceptual 해시가 거의 같으면 중복 처리 (기본: False)
+            dedupe_index_path: 해시 인덱스 파일 경로 (기본: screenshots/.upload_index.json)
         """
         self.upload_url = upload_url
         self.max_retries = max_retries
         self.retry_delay = retry_delay
         self.timeout = timeout
+        self.perceptual_dedupe = perceptual_dedupe
+        self.dedupe_index = UploadDedupeIndex(dedupe_index_path) if enable_dedupe else None
 
+    @traced("screenshot.upload")
     def upload(
         self,
         filepath: str,
@@ -90,6 +103,19 @@ class ScreenshotUploader:
         # 메타데이터 준비
         metadata = metadata or {}
 
+        # 중복 업로드 확인 (같은 screenshot_id/순위로 이미 올린 이미지면 재전송 생략)
+        dedupe_key = self._check_duplicate(filepath, metadata)
+        if dedupe_key and dedupe_key.get("cached"):
+            cached = dedupe_key["cached"]
+            print(f"\n♻️  동일 이미지 업로드 이력 있음 - 전송 생략")
+            print(f"   서버 path: {cached['path']}")
+            return {
+                "success": True,
+                "uploaded_path": str(filepath),
+                "server_response": {"path": cached["path"], "deduplicated": True},
+                "error": None
+            }
+
         # 재시도 로직
         last_error = None
         for attempt in range(1, self.max_retries + 1):
@@ -146,6 +172,8 @@ class ScreenshotUploader:
                         print(f"\n✅ 업로드 성공!")
                         print(f"   서버 응답: {json.dumps(server_response, ensure_ascii=False, indent=2)}")
 
+                        self._record_upload(dedupe_key, server_response)
+
                         return {
                             "success": True,
                             "uploaded_path": str(filepath),
@@ -188,6 +216,50 @@ class ScreenshotUploader:
             "error": last_error
         }
 
+    def _check_duplicate(self, filepath: Path, metadata: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        해시 계산 및 인덱스 조회
+
+        Args:
+            filepath: 업로드할 파일 경로
+            metadata: 업로드 메타데이터
+
+        Returns:
+            {"scope", "sha256", "phash", "cached"} (중복 제거 비활성/불가 시 None)
+        """
+        if not self.dedupe_index:
+            return None
+
+        scope = self.dedupe_index.make_scope(metadata)
+        if not scope:
+            return None
+
+        try:
+            sha256 = compute_sha256(str(filepath))
+            phash = compute_dhash(str(filepath)) if self.perceptual_dedupe else None
+            cached = self.dedupe_index.lookup(scope, sha256, phash)
+        except Exception as e:
+            print(f"   ⚠️  업로드 인덱스 조회 실패 (업로드 계속): {e}")
+            return None
+
+        return {"scope": scope, "sha256": sha256, "phash": phash, "cached": cached}
+
+    def _record_upload(self, dedupe_key: Optional[Dict[str, Any]], server_response: Dict[str, Any]):
+        """업로드 성공 시 해시 → 서버 path 기록"""
+        if not dedupe_key or not isinstance(server_response, dict):
+            return
+
+        server_path = server_response.get("path")
+        if not server_path:
+            return
+
+        try:
+            self.dedupe_index.record(
+                dedupe_key["scope"], dedupe_key["sha256"], server_path, dedupe_key["phash"]
+            )
+        except Exception as e:
+            print(f"   ⚠️  업로드 인덱스 기록 실패: {e}")
+
     def upload_multiple(
         self,
         filepaths: list,
@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+업로드 중복 제거 인덱스 모듈
+이미 업로드한 스크린샷의 해시 → 서버 path 매핑을 로컬에 보관
+
+같은 screenshot_id/순위로 재시도·재실행할 때 바이트 동일(또는 거의 동일)한 이미지를
+VPN 터널로 다시 전송하지 않고 캐시된 서버 path를 재사용하기 위함
+"""
+
+import os
+import json
+import time
+import fcntl
+import hashlib
+from pathlib import Path
+from typing import Optional, Dict, Any
+
+try:
+    from PIL import Image
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
+
+# 기본 인덱스 위치 (cleanup_screenshots는 *.png만 정리하므로 함께 보존됨)
+DEFAULT_INDEX_PATH = Path(__file__).resolve().parents[2] / "screenshots" / ".upload_index.json"
+
+
+# 중복 판정 범위에 포함하는 메타데이터 필드 (ScreenshotUploader가 POST하는 필드 전부, 기본값 동일)
+SCOPE_FIELDS = (
+    ('screenshot_id', ''),
+    ('keyword', ''),
+    ('product_id', ''),
+    ('item_id', ''),
+    ('vendor_item_id', ''),
+    ('rank', ''),
+    ('match_product_id', False),
+    ('match_item_id', False),
+    ('match_vendor_item_id', False),
+)
+
+
+def compute_sha256(filepath: str) -> str:
+    """
+    파일 내용의 SHA-256 해시
+
+    Args:
+        filepath: 파일 경로
+
+    Returns:
+        16진수 해시 문자열
+    """
+    digest = hashlib.sha256()
+    with open(filepath, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def compute_dhash(filepath: str, hash_size: int = 8) -> Optional[str]:
+    """
+    Perceptual difference hash (dHash, 64bit)
+
+    Args:
+        filepath: 이미지 경로
+        hash_size: 해시 한 변 크기 (기본: 8 → 64bit)
+
+    Returns:
+        16진수 해시 문자열 (PIL 미설치/실패 시 None)
+    """
+    if not PIL_AVAILABLE:
+        return None
+
+    try:
+        with Image.open(filepath) as img:
+            gray = img.convert("L").resize((hash_size + 1, hash_size), Image.LANCZOS)
+            pixels = list(gray.getdata())
+    except Exception:
+        return None
+
+    bits = 0
+    for row in range(hash_size):
+        offset = row * (hash_size + 1)
+        for col in range(hash_size):
+            bits = (bits << 1) | (pixels[offset + col] > pixels[offset + col + 1])
+
+    return f"{bits:0{hash_size * hash_size // 4}x}"
+
+
+def hamming_distance(hash_a: str, hash_b: str) -> int:
+    """두 16진수 해시의 해밍 거리"""
+    return bin(int(hash_a, 16) ^ int(hash_b, 16)).count("1")
+
+
+class UploadDedupeIndex:
+    """업로드 해시 인덱스 (JSON 파일 + flock, 여러 워커 프로세스가 공유)"""
+
+    def __init__(
+        self,
+        index_path: Optional[str] = None,
+        max_entries: int = 2000,
+        phash_threshold: int = 4
+    ):
+        """
+        Args:
+            index_path: 인덱스 파일 경로 (기본: screenshots/.upload_index.json)
+            max_entries: 보관할 최대 항목 수 (오래된 것부터 제거)
+            phash_threshold: perceptual 해시 일치로 볼 최대 해밍 거리 (기본: 4bit)
+        """
+        self.index_path = Path(index_path) if index_path else DEFAULT_INDEX_PATH
+        self.lock_path = self.index_path.with_name(self.index_path.name + ".lock")
+        self.max_entries = max_entries
+        self.phash_threshold = phash_threshold
+
+    @staticmethod
+    def make_scope(metadata: Dict[str, Any]) -> Optional[str]:
+        """
+        중복 판정 범위 키 생성
+
+        업로드 요청에 실리는 메타데이터 필드(키워드, 순위, 상품 ID, match_* 플래그)가
+        모두 같을 때만 재사용합니다. 하나라도 바뀌면 서버에 새 값이 전달되도록 다시 업로드.
+        screenshot_id가 없으면 안전하게 판정할 수 없으므로 None.
+
+        Args:
+            metadata: 업로드 메타데이터
+
+        Returns:
+            범위 키 문자열 또는 None
+        """
+        screenshot_id = metadata.get('screenshot_id')
+        if not screenshot_id:
+            return None
+
+        return "|".join(str(metadata.get(key, default)) for key, default in SCOPE_FIELDS)
+
+    def lookup(self, scope: str, sha256: str, phash: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        이미 업로드된 동일/유사 이미지 조회
+
+        Args:
+            scope: make_scope() 결과
+            sha256: 콘텐츠 해시
+            phash: perceptual 해시 (선택)
+
+        Returns:
+            인덱스 항목 (없으면 None)
+        """
+        with self._locked(exclusive=False):
+            entries = self._load()
+
+        exact = entries.get(sha256)
+        if exact and exact.get('scope') == scope and exact.get('path'):
+            return exact
+
+        if phash:
+            for entry in entries.values():
+                if entry.get('scope') != scope or not entry.get('phash') or not entry.get('path'):
+                    continue
+                if hamming_distance(phash, entry['phash']) <= self.phash_threshold:
+                    return entry
+
+        return None
+
+    def record(self, scope: str, sha256: str, server_path: str, phash: Optional[str] = None):
+        """
+        업로드 성공 기록
+
+        Args:
+            scope: make_scope() 결과
+            sha256: 콘텐츠 해시
+            server_path: 서버 응답의 path
+            phash: perceptual 해시 (선택)
+        """
+        with self._locked(exclusive=True):
+            entries = self._load()
+            entries[sha256] = {
+                'scope': scope,
+                'phash': phash,
+                'path': server_path,
+                'uploaded_at': time.time()
+            }
+
+            # 오래된 항목 정리
+            if len(entries) > self.max_entries:
+                ordered = sorted(entries.items(), key=lambda item: item[1].get('uploaded_at', 0))
+                entries = dict(ordered[-self.max_entries:])
+
+            self._save(entries)
+
+    def _load(self) -> Dict[str, Any]:
+        """인덱스 파일 로드 (없거나 손상 시 빈 dict)"""
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def _save(self, entries: Dict[str, Any]):
+        """임시 파일에 기록 후 rename (원자적 교체)"""
+        tmp_path = self.index_path.with_name(f"{self.index_path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(entries, f, ensure_ascii=False)
+        try:
+            os.chmod(tmp_path, 0o666)
+        except OSError:
+            pass
+        os.replace(tmp_path, self.index_path)
+
+    def _locked(self, exclusive: bool):
+        """인덱스 파일 잠금 컨텍스트"""
+        return _FileLock(self.lock_path, exclusive)
+
+
+class _FileLock:
+    """fcntl.flock 기반 간단한 파일 잠금"""
+
+    def __init__(self, path: Path, exclusive: bool):
+        self.path = path
+        self.exclusive = exclusive
+        self.fd = None
+
+    def __enter__(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            self.fd = os.open(str(self.path), os.O_RDWR | os.O_CREAT, 0o666)
+            try:
+                os.fchmod(self.fd, 0o666)  # 다른 wg 사용자도 잠금 가능하도록
+            except OSError:
+                pass
+        except PermissionError:
+            # 다른 사용자가 만든 잠금 파일: 읽기 전용으로도 flock 가능
+            self.fd = os.open(str(self.path), os.O_RDONLY)
+        fcntl.flock(self.fd, fcntl.LOCK_EX if self.exclusive else fcntl.LOCK_SH)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            fcntl.flock(self.fd, fcntl.LOCK_UN)
+        finally:
+            os.close(self.fd)
+        return False
@@ -2,28 +2,41 @@
 """
 영상 녹화 모듈
 브라우저 자동화 과정을 영상으로 녹화하는 기능 제공
+
+CDP Page.startScreencast 기반 스트리밍 녹화:
+- Chrome이 화면이 바뀔 때마다 JPEG 프레임을 직접 푸시 (get_screenshot_as_png 왕복 없음)
+- 전용 CDPSession(수신 스레드) → 고정 크기 큐 → 인코딩 스레드 구조로 자동화 스레드는 절대 블로킹되지 않음
+- 큐가 가득 차면 가장 오래된 프레임을 버리므로 메모리 사용량이 일정함
 """
 
 import os
+import queue
+import base64
+import threading
 import cv2
 import numpy as np
 from pathlib import Path
 from typing import Optional
 from datetime import datetime
 import time
-from PIL import Image
-import io
+
+from uc_lib.core.cdp_session import CDPSession, WEBSOCKET_AVAILABLE
 
 
 class VideoRecorder:
-    """브라우저 자동화 과정을 영상으로 녹화하는 클래스"""
+    """브라우저 자동화 과정을 영상으로 녹화하는 클래스 (CDP screencast 스트리밍)"""
+
+    # 인코딩 스레드 종료 신호
+    _STOP = object()
 
     def __init__(
         self,
         driver,
         base_dir: str = "videos",
         fps: int = 15,
-        codec: str = "mp4v"
+        codec: str = "mp4v",
+        jpeg_quality: int = 70,
+        max_queue_size: int = 30
     ):
         """
         Args:
@@ -31,26 +44,39 @@ class VideoRecorder:
             base_dir: 영상 저장 기본 디렉토리 (기본: "videos")
             fps: 초당 프레임 수 (기본: 15)
             codec: 비디오 코덱 (기본: "mp4v")
+            jpeg_quality: screencast JPEG 품질 0-100 (기본: 70)
+            max_queue_size: 인코딩 대기 프레임 최대 개수 (기본: 30, 초과 시 오래된 프레임 폐기)
         """
         self.driver = driver
         self.base_dir = Path(base_dir)
         self.fps = fps
         self.codec = codec
+        self.jpeg_quality = jpeg_quality
 
         # 녹화 상태
         self.is_recording = False
         self.video_writer = None
-        self.frames = []
         self.start_time = None
         self.output_path = None
 
+        # 스트리밍 파이프라인
+        self._frame_queue = queue.Queue(maxsize=max_queue_size)
+        self._session = None
+        self._encoder_thread = None
+        self._frame_size = None
+
+        # 통계 (프레임 자체는 보관하지 않음)
+        self.frame_count = 0      # 수신한 screencast 프레임
+        self.written_count = 0    # 영상에 기록된 프레임 (fps 보정 포함)
+        self.dropped_count = 0    # 큐 포화로 버린 프레임
+
     def start_recording(
         self,
         keyword: str = "",
         version: str = ""
     ) -> bool:
         """
-        녹화 시작 (브라우저 화면 크기를 자동 감지)
+        녹화 시작 (해상도는 첫 screencast 프레임에서 자동 감지)
 
         Args:
             keyword: 검색 키워드 (파일명에 포함)
@@ -63,36 +89,40 @@ class VideoRecorder:
             print("   ⚠️  이미 녹화 중입니다")
             return False
 
+        if not WEBSOCKET_AVAILABLE:
+            print("   ❌ websocket-client 미설치 - screencast 녹화 불가")
+            return False
+
         try:
-            # 첫 번째 스크린샷으로 실제 브라우저 크기 감지
-            screenshot_png = self.driver.get_screenshot_as_png()
-            image = Image.open(io.BytesIO(screenshot_png))
-            width, height = image.size
+            # 드라이버 세션과 별도의 전용 CDP 연결 (프레임 이벤트가 다른 세션에 섞이지 않음)
+            self._session = CDPSession.from_driver(self.driver)
 
-            # 저장 경로 생성
+            # 저장 경로 생성 (VideoWriter는 첫 프레임 크기를 알게 되면 인코딩 스레드에서 생성)
             self.output_path = self._generate_filepath(keyword, version)
 
-            # VideoWriter 초기화
-            fourcc = cv2.VideoWriter_fourcc(*self.codec)
-            self.video_writer = cv2.VideoWriter(
-                str(self.output_path),
-                fourcc,
-                self.fps,
-                (width, height)
-            )
+            self.frame_count = 0
+            self.written_count = 0
+            self.dropped_count = 0
+            self._frame_size = None
+            self.start_time = time.time()
+            self.is_recording = True
 
-            if not self.video_writer.isOpened():
-                print("   ❌ VideoWriter 초기화 실패")
-                return False
+            self._encoder_thread = threading.Thread(target=self._encode_loop, daemon=True)
+            self._encoder_thread.start()
+            self._session.on("Page.screencastFrame", self._on_screencast_frame)
 
-            self.is_recording = True
-            self.start_time = time.time()
-            self.frames = []
+            self._session.send_batch([
+                ("Page.enable", None),
+                ("Page.startScreencast", {
+                    "format": "jpeg",
+                    "quality": self.jpeg_quality,
+                    "everyNthFrame": 1
+                }),
+            ])
 
             print(f"🎥 녹화 시작!")
             print(f"   파일: {self.output_path.name}")
-            print(f"   해상도: {width}x{height}")
-            print(f"   FPS: {self.fps}")
+            print(f"   FPS: {self.fps} (CDP screencast, JPEG q={self.jpeg_quality})")
 
             return True
 
@@ -100,33 +130,17 @@ class VideoRecorder:
             print(f"   ❌ 녹화 시작 실패: {e}")
             import traceback
             traceback.print_exc()
+            self._shutdown_pipeline()
             return False
 
     def capture_frame(self):
-        """현재 브라우저 화면을 프레임으로 캡처"""
-        if not self.is_recording:
-            return
-
-        try:
-            # 브라우저 스크린샷 캡처 (PNG bytes)
-            screenshot_png = self.driver.get_screenshot_as_png()
-
-            # PIL Image로 변환
-            image = Image.open(io.BytesIO(screenshot_png))
-
-            # NumPy array로 변환 (OpenCV 형식)
-            frame = np.array(image)
-
-            # RGB -> BGR 변환 (OpenCV는 BGR 사용)
-            frame = cv2.cvtColor(frame, cv2.COLOR_RGB2BGR)
-
-            # 프레임 쓰기 (크기는 start_recording에서 설정한 크기와 동일해야 함)
-            if self.video_writer:
-                self.video_writer.write(frame)
-                self.frames.append(frame)
+        """
+        호환용 메서드 (no-op)
 
-        except Exception as e:
-            print(f"   ⚠️  프레임 캡처 실패: {e}")
+        screencast 방식에서는 Chrome이 화면 변경 시 프레임을 푸시하므로
+        호출자가 직접 프레임을 캡처할 필요가 없습니다.
+        """
+        return
 
     def stop_recording(self) -> Optional[str]:
         """
@@ -140,27 +154,31 @@ class VideoRecorder:
             return None
 
         try:
-            # VideoWriter 해제
-            if self.video_writer:
-                self.video_writer.release()
+            try:
+                self._session.send("Page.stopScreencast", timeout=2)
+            except Exception:
+                pass
+
+            self._shutdown_pipeline()
 
             # 통계 계산
             duration = time.time() - self.start_time
-            frame_count = len(self.frames)
+
+            if not self.output_path.exists():
+                print("   ⚠️  수신된 프레임이 없어 영상이 생성되지 않았습니다")
+                return None
+
             file_size = self.output_path.stat().st_size / (1024 * 1024)  # MB
 
             print(f"\n🎬 녹화 완료!")
             print(f"   파일: {self.output_path}")
             print(f"   길이: {duration:.1f}초")
-            print(f"   프레임: {frame_count}개")
+            if self._frame_size:
+                print(f"   해상도: {self._frame_size[0]}x{self._frame_size[1]}")
+            print(f"   프레임: {self.written_count}개 (수신 {self.frame_count}, 폐기 {self.dropped_count})")
             print(f"   크기: {file_size:.2f} MB")
 
-            # 상태 초기화
-            self.is_recording = False
-            self.video_writer = None
-            self.frames = []
             self.start_time = None
-
             return str(self.output_path)
 
         except Exception as e:
@@ -171,15 +189,142 @@ class VideoRecorder:
 
     def record_with_interval(self, interval: float = 0.1):
         """
-        일정 간격으로 프레임 캡처 (녹화 중일 때만)
+        일정 시간 대기 (녹화 중일 때만)
+
+        프레임은 screencast로 자동 수집되므로 단순히 interval만큼 대기합니다.
 
         Args:
-            interval: 프레임 캡처 간격(초) (기본: 0.1초 = 100ms)
+            interval: 대기 시간(초) (기본: 0.1초 = 100ms)
         """
         if self.is_recording:
-            self.capture_frame()
             time.sleep(interval)
 
+    def _on_screencast_frame(self, params: dict):
+        """
+        screencast 프레임 이벤트 콜백 (CDP 수신 스레드): ack 후 큐에 넣기만 함 (디코딩 없음)
+
+        Args:
+            params: Page.screencastFrame 이벤트 파라미터
+        """
+        if not self.is_recording:
+            return
+
+        # 다음 프레임을 받으려면 즉시 ack 필요 (수신 스레드이므로 응답은 기다리지 않음)
+        self._session.send_nowait("Page.screencastFrameAck", {"sessionId": params.get("sessionId")})
+
+        timestamp = params.get("metadata", {}).get("timestamp") or time.time()
+        item = (timestamp, params.get("data", ""))
+        self.frame_count += 1
+
+        try:
+            self._frame_queue.put_nowait(item)
+        except queue.Full:
+            # 가장 오래된 프레임 폐기 후 재시도 (메모리 일정 유지)
+            try:
+                self._frame_queue.get_nowait()
+                self.dropped_count += 1
+            except queue.Empty:
+                pass
+            try:
+                self._frame_queue.put_nowait(item)
+            except queue.Full:
+                self.dropped_count += 1
+
+    def _encode_loop(self):
+        """
+        인코딩 스레드: JPEG 디코딩 → VideoWriter 기록
+
+        screencast는 화면이 바뀔 때만 프레임을 보내므로,
+        프레임 타임스탬프 기준으로 직전 프레임을 반복 기록해 fps를 맞춥니다.
+        메모리에는 직전 프레임 1장만 유지합니다.
+        """
+        frame_interval = 1.0 / self.fps
+        last_frame = None
+        next_ts = None
+
+        while True:
+            item = self._frame_queue.get()
+            if item is self._STOP:
+                break
+
+            timestamp, data = item
+            try:
+                buffer = np.frombuffer(base64.b64decode(data), dtype=np.uint8)
+                frame = cv2.imdecode(buffer, cv2.IMREAD_COLOR)  # BGR
+            except Exception:
+                continue
+            if frame is None:
+                continue
+
+            if self.video_writer is None and not self._open_writer(frame):
+                break
+
+            # 크기가 바뀌면 (창 리사이즈 등) 최초 해상도로 맞춤
+            height, width = frame.shape[:2]
+            if (width, height) != self._frame_size:
+                frame = cv2.resize(frame, self._frame_size)
+
+            if last_frame is None:
+                next_ts = timestamp
+            else:
+                # 직전 프레임이 유지된 시간만큼 반복 기록
+                while next_ts < timestamp:
+                    self.video_writer.write(last_frame)
+                    self.written_count += 1
+                    next_ts += frame_interval
+
+            last_frame = frame
+
+        # 마지막 프레임 기록
+        if last_frame is not None and self.video_writer is not None:
+            self.video_writer.write(last_frame)
+            self.written_count += 1
+
+    def _open_writer(self, frame) -> bool:
+        """첫 프레임 크기로 VideoWriter 초기화"""
+        height, width = frame.shape[:2]
+        fourcc = cv2.VideoWriter_fourcc(*self.codec)
+        writer = cv2.VideoWriter(str(self.output_path), fourcc, self.fps, (width, height))
+
+        if not writer.isOpened():
+            print("   ❌ VideoWriter 초기화 실패")
+            return False
+
+        self.video_writer = writer
+        self._frame_size = (width, height)
+        return True
+
+    def _shutdown_pipeline(self):
+        """수신/인코딩 스레드 종료 및 자원 해제"""
+        self.is_recording = False
+
+        if self._session:
+            self._session.close()
+            self._session = None
+
+        if self._encoder_thread:
+            # 큐가 가득 차 있어도 종료 신호는 반드시 전달
+            while True:
+                try:
+                    self._frame_queue.put(self._STOP, timeout=0.5)
+                    break
+                except queue.Full:
+                    if not self._encoder_thread.is_alive():
+                        break
+            self._encoder_thread.join()
+            self._encoder_thread = None
+
+        if self.video_writer:
+            self.video_writer.release()
+            self.video_writer = None
+
+        # 남은 항목 정리 (재시작 대비)
+        while True:
+            try:
+                self._frame_queue.get_nowait()
+            except queue.Empty:
+                break
+
     def _generate_filepath(self, keyword: str, version: str) -> Path:
         """
         영상 파일 경로 생성
@@ -216,6 +361,6 @@ class VideoRecorder:
         return target_dir / filename
 
     def __del__(self):
-        """소멸자: VideoWriter 자원 해제"""
-        if self.video_writer:
-            self.video_writer.release()
+        """소멸자: 녹화 파이프라인 자원 해제"""
+        if self.is_recording or self.video_writer:
+            self._shutdown_pipeline()
@@ -9,6 +9,7 @@ import time
 import os
 from typing import Optional, Dict, Any
 from common.constants import Config
+from common.tracing import traced
 
 
 class WorkAPIClient:
@@ -36,6 +37,7 @@ class WorkAPIClient:
         if self.is_vpn_env:
             print(f"🌐 VPN 환경 감지 - API 요청은 로컬 네트워크로 자동 라우팅")
 
+    @traced("api.allocate_work")
     def allocate_work(self, screenshot_id: int = None) -> Optional[Dict[str, Any]]:
         """
         스크린샷 작업 할당 요청
@@ -115,6 +117,7 @@ class WorkAPIClient:
             print(f"❌ 작업 할당 중 오류: {e}")
             return None
 
+    @traced("api.submit_result")
     def submit_result(
         self,
         screenshot_id: int,
@@ -26,6 +26,8 @@ from common.utils.highlight_preset import HighlightStyle, generate_highlight_js
 from uc_lib.modules.product_page_visitor import ProductPageVisitor
 from uc_lib.modules.pagination_handler import PaginationHandler
 from common.constants import Config
+from common.tracing import traced, span
+from common.profiling import profiled
 
 
 class SearchWorkflowResult:
@@ -111,6 +113,8 @@ class SearchWorkflow:
         self.current_items_info = None  # items_info 리스트
         self.current_all_items = None   # WebElement 리스트
 
+    @traced("workflow.execute")
+    @profiled("workflow.execute")
     def execute(
         self,
         keyword: str,
@@ -182,6 +186,10 @@ class SearchWorkflow:
             if self.core and self.enable_main_filter:
                 self.core.disable_network_filter()
 
+            # 검색 결과 탐색 단계: 트래커/미디어 차단 (VPN 대역폭 절감)
+            if self.core:
+                self.core.set_network_phase("browse")
+
             print("\n" + "=" * 60)
             print("🔍 상품 검색 실행")
             print("=" * 60)
@@ -253,7 +261,14 @@ class SearchWorkflow:
             # 페이지별 정보 저장 (Adjust 모드용)
             page_history = []  # [{page: 1, url: "...", product_count: 27, rank_range: (1, 27)}, ...]
 
+            # 페이지별 지연 추적 (페이지 이동/스크롤 포함, 다음 페이지 시작 시 종료)
+            page_span = None
+
             while current_page <= max_pages:
+                if page_span:
+                    page_span.end()
+                page_span = span("search.page", page=current_page)
+
                 # 현재 페이지에서 상품 검색
                 print(f"📄 페이지 {current_page}/{max_pages} 탐색 중... (누적 오프셋: {cumulative_rank_offset})")
 
@@ -350,10 +365,15 @@ class SearchWorkflow:
                 # http2 protocol error 체크 (네트워크 오류 → 차단으로 처리)
                 if self._check_http2_error():
                     result.error_message = "검색 결과 차단됨 (네트워크 오류 - http2 protocol error)"
+                    page_span.end("fail", "http2 protocol error")
                     return result
 
                 # 새 페이지는 while 루프 시작 시 자동으로 분석됨 (Line 240-242)
 
+            if page_span:
+                page_span.set(found=found_product is not None)
+                page_span.end()
+
             # 상품을 찾지 못한 경우
             if not found_product:
                 result.error_message = "상품 매칭 실패 (모든 페이지 탐색 완료)"
@@ -390,6 +410,10 @@ class SearchWorkflow:
                 "review_count": ""
             }
 
+            # 캡처 단계: 화면에 보이는 리소스 차단 해제 (트래커만 유지)
+            if self.core:
+                self.core.set_network_phase("capture")
+
             # 7. 상품 스크롤 및 하이라이트
             self.finder.scroll_to_center(product_info)
 
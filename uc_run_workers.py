@@ -12,6 +12,8 @@ import random
 import json
 import os
 import sys
+import fcntl
+import atexit
 from datetime import datetime, timedelta
 from pathlib import Path
 
@@ -21,6 +23,21 @@ sys.path.insert(0, str(Path(__file__).parent))
 # VPN API 클라이언트 (VPN 키 풀 동적 할당/반납)
 # common/ 폴더에서 import (공통 모듈)
 from common.vpn_api_client import VPNAPIClient, VPNConnection
+from common.chrome_registry import get_registry
+from common.run_history import get_store, parse_since, OUTCOME_SUCCESS, OUTCOME_FAILED, OUTCOME_TIMEOUT, OUTCOME_BLOCKED
+
+# VPN 서버 × Chrome 버전 선택기 (--selector bandit)
+from common.combo_selector import ComboSelector, LOCAL_SERVER
+
+# 단계별 지연 추적 (job_id를 uc_agent 자식 프로세스로 전파)
+from common.tracing import span, new_job_id, set_job_id, child_env
+
+# 메트릭 레지스트리 (/metrics 엔드포인트)
+from common.constants import Config
+from common.metrics import REGISTRY, JsonlTail, start_http_server
+
+# 사전 포크 zygote (--zygote 옵션)
+from uc_zygote import zygote_socket_path, start_zygote, run_in_zygote, ZygoteUnavailable
 
 # 작업 할당 API 클라이언트 (작업 할당/결과 제출)
 from uc_lib.modules.work_api_client import WorkAPIClient
@@ -34,6 +51,89 @@ LOGS_DIR = SCRIPT_DIR / "logs"
 LOGS_DIR.mkdir(exist_ok=True)
 
 
+# ============================================================
+# 러너 메트릭 (--metrics-port, Prometheus 텍스트 형식)
+# ============================================================
+JOBS_TOTAL = REGISTRY.counter("rank_jobs_total", "완료된 작업 수", ["outcome", "chrome_version"])
+JOB_DURATION = REGISTRY.histogram("rank_job_duration_seconds", "작업 전체 소요 시간(초)", ["outcome"])
+STAGE_DURATION = REGISTRY.histogram("rank_stage_duration_seconds", "단계별 소요 시간(초, span 기준)", ["stage", "status"])
+BLOCKS_TOTAL = REGISTRY.counter("rank_blocks_total", "차단 감지 수", ["vpn_server", "chrome_version", "reason"])
+ALLOCATE_LATENCY = REGISTRY.histogram(
+    "rank_allocate_latency_seconds", "작업 할당 API 응답 시간(초)", ["result"],
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+)
+UPLOAD_LATENCY = REGISTRY.histogram("rank_upload_latency_seconds", "스크린샷 업로드 시간(초, span 기준)", ["status"])
+NETWORK_CHANGED_TOTAL = REGISTRY.counter("rank_err_network_changed_total", "ERR_NETWORK_CHANGED 발생 수", ["wg_user"])
+WORKERS = REGISTRY.gauge("rank_workers", "상태별 워커 수 (active: 실행 중인 워커 스레드, running: uc_agent 실행 중)", ["state"])
+QUEUE_DEPTH = REGISTRY.gauge("rank_queue_depth", "작업 할당을 기다리는 워커 수 (요청 중 + 작업 없음 대기)")
+
+
+def _observe_span(record: dict):
+    """span 파일 레코드 → 단계별 지연 히스토그램"""
+    seconds = record.get("duration_ms", 0) / 1000
+    STAGE_DURATION.observe(seconds, stage=record.get("name"), status=record.get("status"))
+    if record.get("name") == "screenshot.upload":
+        UPLOAD_LATENCY.observe(seconds, status=record.get("status"))
+
+
+def _observe_event(record: dict):
+    """워커 이벤트 로그 레코드 → ERR_NETWORK_CHANGED 카운터"""
+    if record.get("event_type") == "ERR_NETWORK_CHANGED":
+        NETWORK_CHANGED_TOTAL.inc(wg_user=record.get("wg_user"))
+
+
+def start_metrics_server(port: int, blocked_manager=None):
+    """
+    /metrics 엔드포인트 시작
+
+    uc_agent 프로세스(다른 사용자)의 단계별 지연과 ERR_NETWORK_CHANGED는
+    span/이벤트 파일을 조회 시점에 증분으로 읽어 반영합니다.
+
+    Args:
+        port: HTTP 포트 (127.0.0.1에만 바인드)
+        blocked_manager: 차단 조합 관리자 (현재 차단 중인 조합 수 게이지)
+    """
+    REGISTRY.add_collector(JsonlTail(f"{Config.TRACE_DIR}/spans_*.jsonl", _observe_span).poll)
+    REGISTRY.add_collector(JsonlTail("/tmp/vpn_events_*.log", _observe_event).poll)
+
+    if blocked_manager:
+        blocked_gauge = REGISTRY.gauge("rank_blocked_combinations", "현재 차단 중인 VPN + Chrome 버전 조합 수")
+        blocked_gauge.set_function(lambda: {(): len(blocked_manager.get_stats()['active'])})
+
+    start_http_server(port)
+
+
+# ============================================================
+# 사전 포크 zygote 관리 (--zygote)
+# ============================================================
+_zygote_lock = threading.Lock()
+_zygote_processes = {}  # 사용자 → Popen (러너가 기동한 zygote)
+
+
+def ensure_zygote(user: str, launch_prefix: list = None):
+    """
+    사용자별 zygote가 실행 중인지 확인하고 없으면 기동
+
+    Args:
+        user: 실행 사용자 (wg101 등, Local은 현재 사용자)
+        launch_prefix: zygote 실행 접두 명령 (sudo -u wgN env ...)
+
+    Returns:
+        zygote 소켓 경로 (기동 실패 시 None → subprocess 실행으로 fallback)
+    """
+    socket_path = zygote_socket_path(user)
+    with _zygote_lock:
+        try:
+            process = start_zygote(socket_path, launch_prefix)
+            if process:
+                _zygote_processes[user] = process
+                print(f"🧬 zygote 기동: {user} ({socket_path})")
+            return socket_path
+        except ZygoteUnavailable as e:
+            print(f"⚠️  zygote 사용 불가 ({user}): {e} - 일반 실행으로 진행")
+            return None
+
+
 # ============================================================
 # VPN 동시 할당 관리
 # ============================================================
@@ -93,9 +193,10 @@ class VPNAllocationManager:
             return [vpn for vpn in all_vpns if vpn not in self.allocated_vpns]
 
 
-def log_result(worker_id: int, vpn: str, chrome_version: str, success: bool, error_msg: str = None, screenshot_id: int = None):
+def log_result(worker_id: int, vpn: str, chrome_version: str, success: bool, error_msg: str = None, screenshot_id: int = None,
+               keyword: str = None, vpn_server: str = None, rank: int = None, elapsed: float = None, outcome: str = None):
     """
-    VPN별 성공/실패 로그를 일자별 TXT 파일에 기록
+    VPN별 성공/실패 로그를 일자별 TXT 파일과 실행 이력 DB(common/run_history.py)에 기록
 
     Args:
         worker_id: 워커 ID
@@ -104,7 +205,27 @@ def log_result(worker_id: int, vpn: str, chrome_version: str, success: bool, err
         success: 성공 여부
         error_msg: 에러 메시지 (실패 시)
         screenshot_id: 작업 ID (성공 시)
+        keyword: 검색 키워드
+        vpn_server: VPN 서버 IP (키 풀 사용 시)
+        rank: 발견 순위
+        elapsed: 소요 시간(초)
+        outcome: 결과 분류 (None이면 success 여부로 결정)
     """
+    store = get_store()
+    if store:
+        store.record_run(
+            worker_id=worker_id,
+            outcome=outcome or (OUTCOME_SUCCESS if success else OUTCOME_FAILED),
+            vpn=vpn,
+            vpn_server=vpn_server,
+            chrome_version=chrome_version,
+            keyword=keyword,
+            screenshot_id=screenshot_id,
+            error=error_msg,
+            rank=rank,
+            elapsed=elapsed
+        )
+
     try:
         # 오늘 날짜로 파일명 생성
         today = datetime.now().strftime("%Y-%m-%d")
@@ -140,24 +261,12 @@ def log_result(worker_id: int, vpn: str, chrome_version: str, success: bool, err
 
 def scan_chrome_versions() -> list:
     """
-    chrome-version/ 폴더를 스캔하여 설치된 버전 목록 반환
+    설치된 Chrome 버전 목록 반환 (공용 레지스트리, 디렉토리 서명이 바뀔 때만 재색인)
 
     Returns:
         설치된 Chrome 버전 리스트 (예: ['130', '144', 'beta'])
     """
-    chrome_dir = SCRIPT_DIR / "chrome-version"
-    versions = []
-
-    if not chrome_dir.exists():
-        return versions
-
-    for version_dir in chrome_dir.iterdir():
-        if version_dir.is_dir():
-            chrome_bin = version_dir / "chrome-linux64" / "chrome"
-            if chrome_bin.exists():
-                versions.append(version_dir.name)
-
-    return sorted(versions)
+    return get_registry().labels()
 
 
 def cleanup_all_chrome_processes():
@@ -435,35 +544,185 @@ class BlockedCombinationsManager:
 
     차단된 조합은 JSON 파일에 저장하고, 10분간 재시도하지 않음.
     10분 후 재시도해서 성공하면 차단 목록에서 제거.
+
+    - 차단 시각은 로드할 때 한 번만 파싱해서 epoch로 보관 (is_blocked()는 비교만 수행)
+    - 변경은 SAVE_DELAY초 동안 모아서 한 번에 기록 (임시 파일 → fsync → rename, 기록 중 종료돼도 파일 유지)
+    - 기록은 .lock 파일 flock 아래에서 디스크 내용을 다시 읽고 이 프로세스의 변경분만 반영
+      → 러너 프로세스 여러 개가 같은 파일을 공유해도 서로의 기록을 덮어쓰지 않음
+    - 파일 기록(flock 대기, 병합, fsync)은 self.lock 밖에서 수행 → 기록 중에도 is_blocked()가 막히지 않음
+    - 다른 프로세스의 기록은 파일 상태(inode/mtime/size)가 바뀌면 RELOAD_INTERVAL초 이내에 반영
+    - 쿨다운 만료 후 PURGE_AFTER초가 지난 항목은 기록 시 삭제
     """
 
+    SAVE_DELAY = 1.0        # 초
+    RELOAD_INTERVAL = 2.0   # 초
+    PURGE_AFTER = 3600      # 초
+
     def __init__(self, json_path: str = None):
         if json_path is None:
             json_path = SCRIPT_DIR / "blocked_combinations.json"
         self.json_path = Path(json_path)
+        self.lock_path = self.json_path.with_name(self.json_path.name + ".lock")
         self.lock = threading.Lock()
+        self._flush_lock = threading.Lock()  # 이 프로세스 안의 기록 직렬화 (self.lock과 별개)
         self.cooldown_minutes = 10
-        self.data = self.load()
+        self._blocked_at = {}    # 키 → 차단 시각 (epoch)
+        self._pending = {}       # 키 → 저장할 항목 (None이면 삭제)
+        self._inflight = {}      # 기록 중인 변경분 (기록 중 다시 로드해도 반영되도록 보관)
+        self._file_state = None  # 마지막으로 읽거나 쓴 파일 상태
+        self._last_check = time.time()
+        self._save_timer = None
+        self._set_data(self.load())
+        atexit.register(self.flush)
+
+    @staticmethod
+    def _parse_blocked_at(info):
+        """항목의 차단 시각 → epoch (파싱 실패 시 None)"""
+        try:
+            return datetime.fromisoformat(info['blocked_at']).timestamp()
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def _stat_file(self):
+        """파일 상태 (inode, mtime, size) - 없으면 None"""
+        try:
+            st = os.stat(self.json_path)
+            return (st.st_ino, st.st_mtime_ns, st.st_size)
+        except OSError:
+            return None
+
+    def _set_data(self, data):
+        """메모리 목록 + 차단 시각 색인 교체"""
+        self.data = data
+        self._blocked_at = {}
+        for key, info in data.items():
+            blocked_at = self._parse_blocked_at(info)
+            if blocked_at is not None:
+                self._blocked_at[key] = blocked_at
+
+    def _apply_pending(self, data, changes=None):
+        """
+        아직 기록하지 않은 변경분을 목록에 반영
+
+        Args:
+            data: 차단 목록
+            changes: 반영할 변경분 (None이면 기록 중인 변경분 + 대기 중인 변경분, lock 보유 상태에서 호출)
+        """
+        for pending in ((self._inflight, self._pending) if changes is None else (changes,)):
+            for key, info in pending.items():
+                if info is None:
+                    data.pop(key, None)
+                else:
+                    data[key] = info
+        return data
 
     def load(self):
-        """JSON 파일에서 차단 목록 로드"""
-        if not self.json_path.exists():
-            return {}
+        """JSON 파일에서 차단 목록 로드 (파일 상태도 갱신)"""
+        data, self._file_state = self._read_file()
+        return data
+
+    def _read_file(self):
+        """
+        JSON 파일 읽기 (손상된 파일은 .corrupt로 옮기고 빈 목록으로 시작)
+
+        Returns:
+            (차단 목록, 읽은 파일 상태)
+        """
+        file_state = self._stat_file()
+        if file_state is None:
+            return {}, None
 
         try:
             with open(self.json_path, 'r') as f:
-                return json.load(f)
-        except Exception as e:
+                data = json.load(f)
+            if not isinstance(data, dict):
+                raise ValueError("dict 형식이 아님")
+            return data, file_state
+        except ValueError as e:
+            corrupt_path = self.json_path.with_name(f"{self.json_path.name}.corrupt-{int(time.time())}")
+            try:
+                os.replace(self.json_path, corrupt_path)
+            except OSError:
+                pass
+            print(f"⚠️  차단 목록 손상 - {corrupt_path.name}로 이동 후 빈 목록으로 시작: {e}")
+            return {}, None
+        except OSError as e:
             print(f"⚠️  차단 목록 로드 실패: {e}")
-            return {}
+            return {}, file_state
+
+    def _maybe_reload(self, now):
+        """다른 프로세스가 파일을 바꿨으면 다시 로드 (lock 보유 상태에서 호출)"""
+        if now - self._last_check < self.RELOAD_INTERVAL:
+            return
+        self._last_check = now
+        if self._stat_file() != self._file_state:
+            self._set_data(self._apply_pending(self.load()))
+
+    def _schedule_save(self):
+        """SAVE_DELAY초 뒤 기록 예약 (이미 예약돼 있으면 합쳐짐, lock 보유 상태에서 호출)"""
+        if self._save_timer is None:
+            self._save_timer = threading.Timer(self.SAVE_DELAY, self.flush)
+            self._save_timer.daemon = True
+            self._save_timer.start()
 
     def save(self):
-        """JSON 파일에 차단 목록 저장"""
-        try:
-            with open(self.json_path, 'w') as f:
-                json.dump(self.data, f, indent=2)
-        except Exception as e:
-            print(f"⚠️  차단 목록 저장 실패: {e}")
+        """JSON 파일에 차단 목록 즉시 저장"""
+        self.flush()
+
+    def flush(self):
+        """
+        대기 중인 변경을 파일에 기록 (flock 아래에서 디스크 내용과 병합 → 임시 파일 → rename)
+
+        self.lock은 변경분을 꺼낼 때와 결과를 반영할 때만 잡고, 파일 I/O는 lock 밖에서 수행합니다.
+        기록에 실패하면 꺼낸 변경분을 다시 대기열에 넣어 다음 기록(변경 또는 종료 시)에 함께 저장합니다.
+        """
+        with self._flush_lock:
+            with self.lock:
+                if self._save_timer is not None:
+                    self._save_timer.cancel()
+                    self._save_timer = None
+                if not self._pending:
+                    return
+                changes = self._inflight = self._pending
+                self._pending = {}
+
+            tmp_path = self.json_path.with_name(f".{self.json_path.name}.{os.getpid()}.tmp")
+            lock_fd = None
+            try:
+                lock_fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o666)
+                fcntl.flock(lock_fd, fcntl.LOCK_EX)
+
+                data = self._apply_pending(self._read_file()[0], changes)
+                expire_before = time.time() - self.cooldown_minutes * 60 - self.PURGE_AFTER
+                for key in [k for k, info in data.items()
+                            if (self._parse_blocked_at(info) or 0) < expire_before]:
+                    del data[key]
+
+                with open(tmp_path, 'w') as f:
+                    json.dump(data, f, indent=2)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, self.json_path)
+                file_state = self._stat_file()
+            except Exception as e:
+                print(f"⚠️  차단 목록 저장 실패: {e}")
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+                with self.lock:
+                    # 기록 중 새로 들어온 변경이 우선
+                    self._pending = {**changes, **self._pending}
+                    self._inflight = {}
+                return
+            finally:
+                if lock_fd is not None:
+                    os.close(lock_fd)  # flock 해제
+
+            with self.lock:
+                self._inflight = {}
+                self._file_state = file_state
+                self._set_data(self._apply_pending(data))  # 기록 중 들어온 변경분 유지
 
     def _get_key(self, vpn, version):
         """VPN + 버전 조합 키 생성"""
@@ -477,80 +736,77 @@ class BlockedCombinationsManager:
         Returns:
             tuple: (is_blocked: bool, remaining_seconds: int)
         """
+        now = time.time()
         with self.lock:
-            key = self._get_key(vpn, version)
+            self._maybe_reload(now)
+            blocked_at = self._blocked_at.get(self._get_key(vpn, version))
 
-            if key not in self.data:
-                return False, 0
+        if blocked_at is None:
+            return False, 0
 
-            blocked_at_str = self.data[key].get('blocked_at')
-            if not blocked_at_str:
-                return False, 0
-
-            try:
-                blocked_at = datetime.fromisoformat(blocked_at_str)
-                now = datetime.now()
-                elapsed = (now - blocked_at).total_seconds()
-                cooldown_seconds = self.cooldown_minutes * 60
-
-                if elapsed < cooldown_seconds:
-                    remaining = int(cooldown_seconds - elapsed)
-                    return True, remaining
-                else:
-                    # 쿨다운 시간이 지났으므로 재시도 가능
-                    return False, 0
-            except Exception as e:
-                print(f"⚠️  차단 시간 파싱 실패: {e}")
-                return False, 0
+        remaining = blocked_at + self.cooldown_minutes * 60 - now
+        if remaining > 0:
+            return True, int(remaining)
+        # 쿨다운 시간이 지났으므로 재시도 가능
+        return False, 0
 
     def mark_blocked(self, vpn, version, reason=""):
         """조합을 차단 목록에 추가/업데이트"""
+        now = datetime.now()
+        key = self._get_key(vpn, version)
+        info = {
+            'blocked_at': now.isoformat(),
+            'vpn': vpn,
+            'version': version,
+            'reason': reason
+        }
         with self.lock:
-            key = self._get_key(vpn, version)
-            self.data[key] = {
-                'blocked_at': datetime.now().isoformat(),
-                'vpn': vpn,
-                'version': version,
-                'reason': reason
-            }
-            self.save()
+            self.data[key] = info
+            self._blocked_at[key] = now.timestamp()
+            self._pending[key] = info
+            self._schedule_save()
+
+        store = get_store()
+        if store:
+            store.record_block(vpn, version, "blocked", reason)
 
-            vpn_str = "local" if vpn == 'L' or vpn is None else f"VPN {vpn}"
-            print(f"   🚫 차단 조합 기록: {vpn_str} + Chrome {version}")
-            print(f"   ⏰ {self.cooldown_minutes}분 후 재시도 가능")
+        vpn_str = "local" if vpn == 'L' or vpn is None else f"VPN {vpn}"
+        print(f"   🚫 차단 조합 기록: {vpn_str} + Chrome {version}")
+        print(f"   ⏰ {self.cooldown_minutes}분 후 재시도 가능")
 
     def mark_success(self, vpn, version):
         """성공 시 차단 목록에서 제거"""
+        key = self._get_key(vpn, version)
         with self.lock:
-            key = self._get_key(vpn, version)
+            if key not in self.data:
+                return
+            del self.data[key]
+            self._blocked_at.pop(key, None)
+            self._pending[key] = None
+            self._schedule_save()
 
-            if key in self.data:
-                del self.data[key]
-                self.save()
+        store = get_store()
+        if store:
+            store.record_block(vpn, version, "cleared")
 
-                vpn_str = "local" if vpn == 'L' or vpn is None else f"VPN {vpn}"
-                print(f"   ✅ 차단 해제: {vpn_str} + Chrome {version}")
+        vpn_str = "local" if vpn == 'L' or vpn is None else f"VPN {vpn}"
+        print(f"   ✅ 차단 해제: {vpn_str} + Chrome {version}")
 
     def get_stats(self):
         """차단 목록 통계"""
+        now = time.time()
+        cooldown_seconds = self.cooldown_minutes * 60
         with self.lock:
+            self._maybe_reload(now)
             active_blocks = []
             expired_blocks = []
 
-            now = datetime.now()
-            cooldown_seconds = self.cooldown_minutes * 60
-
-            for key, info in self.data.items():
-                try:
-                    blocked_at = datetime.fromisoformat(info['blocked_at'])
-                    elapsed = (now - blocked_at).total_seconds()
-
-                    if elapsed < cooldown_seconds:
-                        remaining = int(cooldown_seconds - elapsed)
-                        active_blocks.append((key, remaining))
-                    else:
-                        expired_blocks.append(key)
-                except Exception:
+            for key in self.data:
+                blocked_at = self._blocked_at.get(key)
+                remaining = blocked_at + cooldown_seconds - now if blocked_at is not None else 0
+                if remaining > 0:
+                    active_blocks.append((key, int(remaining)))
+                else:
                     expired_blocks.append(key)
 
             return {
@@ -620,7 +876,7 @@ def calculate_window_position(worker_id: int, window_width: int = None, window_h
     }
 
 
-def run_worker(worker_id: int, iterations: int, stats: WorkerStats, adjust_mode: str = None, vpn_list: list = None, window_config: dict = None, blocked_manager: BlockedCombinationsManager = None, vpn_allocation_manager: VPNAllocationManager = None, enable_fingerprint_spoof: bool = False, fingerprint_preset: str = 'full'):
+def run_worker(worker_id: int, iterations: int, stats: WorkerStats, adjust_mode: str = None, vpn_list: list = None, window_config: dict = None, blocked_manager: BlockedCombinationsManager = None, vpn_allocation_manager: VPNAllocationManager = None, enable_fingerprint_spoof: bool = False, fingerprint_preset: str = 'full', profile_template: bool = False, zygote: bool = False, profile_mode: str = None, combo_selector: ComboSelector = None, network_phase_policy: bool = False, driver_accounting: bool = False):
     """
     개별 워커 실행 (VPN 키 풀 지원)
 
@@ -635,6 +891,12 @@ def run_worker(worker_id: int, iterations: int, stats: WorkerStats, adjust_mode:
         vpn_allocation_manager: DEPRECATED - VPN 키 풀 API가 자동 관리
         enable_fingerprint_spoof: 핑거프린트 스푸핑 활성화 여부
         fingerprint_preset: 스푸핑 프리셋 (minimal, light, medium, full)
+        profile_template: 템플릿 프로필 복제 모드 사용 여부
+        zygote: 사전 포크 zygote에서 uc_agent 실행 (모듈 import 생략)
+        profile_mode: uc_agent 작업 프로파일 모드 (None / "cprofile" / "sample")
+        combo_selector: VPN 서버 × Chrome 버전 선택기 (None이면 무작위 선택)
+        network_phase_policy: 검색 결과 탐색 중 트래커/미디어 차단 (uc_agent --network-phase-policy)
+        driver_accounting: WebDriver 명령 집계 (uc_agent --driver-accounting)
 
     VPN 키 풀 사용법:
         - vpn_list=None: VPN 사용 안 함 (Local)
@@ -651,6 +913,7 @@ def run_worker(worker_id: int, iterations: int, stats: WorkerStats, adjust_mode:
     i = 0
     vpn_client = VPNAPIClient() if vpn_list and vpn_list != ['L'] else None
     vpn_conn = None  # VPN 연결 객체 (작업마다 새로 생성)
+    WORKERS.inc(state="active")
 
     while True:
         i += 1
@@ -658,6 +921,11 @@ def run_worker(worker_id: int, iterations: int, stats: WorkerStats, adjust_mode:
         # 무한 루프가 아니고 반복 횟수를 초과하면 종료
         if not is_infinite and i > iterations:
             break
+
+        # 작업 단위 추적 시작 (이 스레드의 span은 모두 같은 job_id)
+        set_job_id(new_job_id(f"w{worker_id}"))
+        job_span = span("runner.job", worker=worker_id)
+
         try:
             start_time = time.time()
 
@@ -698,11 +966,24 @@ def run_worker(worker_id: int, iterations: int, stats: WorkerStats, adjust_mode:
             print("=" * 60)
 
             # 작업 할당 요청
-            work_data = work_api_client.allocate_work()
+            QUEUE_DEPTH.inc()
+            allocate_start = time.time()
+            try:
+                work_data = work_api_client.allocate_work()
+            finally:
+                QUEUE_DEPTH.dec()
+            ALLOCATE_LATENCY.observe(
+                time.time() - allocate_start,
+                result="assigned" if work_data and work_data.get("success") else "empty"
+            )
 
             if not work_data or not work_data.get("success"):
                 print(f"\n[Worker-{worker_id}] ⏸️  할당 가능한 작업 없음 - 1분 후 재시도...")
-                time.sleep(60)
+                QUEUE_DEPTH.inc()
+                try:
+                    time.sleep(60)
+                finally:
+                    QUEUE_DEPTH.dec()
                 if not is_infinite:
                     i -= 1  # 반복 횟수에서 제외
                 continue  # VPN 연결 건너뛰고 다음 반복
@@ -710,6 +991,7 @@ def run_worker(worker_id: int, iterations: int, stats: WorkerStats, adjust_mode:
             # 작업 정보 추출
             screenshot_id = work_data.get("id")
             keyword = work_data.get("keyword")
+            job_span.set(screenshot_id=screenshot_id, keyword=keyword)
             product_id = work_data.get("product_id")
             item_id = work_data.get("item_id")
             vendor_item_id = work_data.get("vendor_item_id")
@@ -764,8 +1046,22 @@ def run_worker(worker_id: int, iterations: int, stats: WorkerStats, adjust_mode:
                     except Exception as e:
                         print(f"   ⚠️ 로그 파일 초기화 실패: {e}")
 
+                # 선택기: 차단되지 않은 버전 기준으로 성공 가능성이 높은 서버 지정 (None이면 API 자동 선택)
+                server_ip = None
+                if combo_selector:
+                    candidate_versions = [
+                        ver for ver in check_versions
+                        if not (blocked_manager and blocked_manager.is_blocked(selected_vpn, ver)[0])
+                    ]
+                    server_ip = combo_selector.choose_server(candidate_versions)
+
                 vpn_conn = VPNConnection(worker_id=worker_id, vpn_client=vpn_client)
-                if not vpn_conn.connect():
+                connected = vpn_conn.connect(server_ip=server_ip)
+                if not connected and server_ip and not vpn_conn.vpn_key_data:
+                    # 지정 서버에 남은 키가 없음 → 자동 선택으로 한 번 더
+                    print(f"   🔄 {server_ip} 키 할당 실패 - 자동 선택으로 재시도")
+                    connected = vpn_conn.connect()
+                if not connected:
                     print(f"   ❌ VPN 연결 실패 - 1분 후 재시도...")
                     time.sleep(60)
                     if not is_infinite:
@@ -773,6 +1069,7 @@ def run_worker(worker_id: int, iterations: int, stats: WorkerStats, adjust_mode:
                     continue
                 # VPN 연결 성공 후 selected_vpn을 VPN 내부 IP로 업데이트 (로깅용)
                 vpn_internal_ip = vpn_conn.get_internal_ip()
+                vpn_server = (vpn_conn.vpn_key_data or {}).get('server_ip')
 
                 # X11 권한 부여 (wgN 사용자가 GUI 실행 가능하도록)
                 try:
@@ -790,6 +1087,7 @@ def run_worker(worker_id: int, iterations: int, stats: WorkerStats, adjust_mode:
                     pass  # 실패해도 계속 진행
             else:
                 vpn_internal_ip = None
+                vpn_server = None
 
             # 선택된 VPN에서 차단되지 않은 Chrome 버전 필터링
             selected_version = "random"  # 기본값
@@ -804,9 +1102,12 @@ def run_worker(worker_id: int, iterations: int, stats: WorkerStats, adjust_mode:
                     else:
                         available_versions.append(ver)
 
-                # 차단되지 않은 버전 중 랜덤 선택
+                # 차단되지 않은 버전 중 선택 (선택기: 서버별 성공/차단 학습, 없으면 랜덤)
                 if available_versions:
-                    selected_version = random.choice(available_versions)
+                    if combo_selector:
+                        selected_version = combo_selector.choose_version(vpn_server or LOCAL_SERVER, available_versions)
+                    else:
+                        selected_version = random.choice(available_versions)
                 else:
                     # 모든 Chrome 버전이 차단됨 - 1분 후 재시도
                     vpn_display = "Local" if selected_vpn == 'L' else ("VPN 키 풀" if selected_vpn == 'VPN' else f"VPN {selected_vpn}")
@@ -851,6 +1152,10 @@ def run_worker(worker_id: int, iterations: int, stats: WorkerStats, adjust_mode:
                     print(f"      - Chrome {ver}: {remaining // 60}분 {remaining % 60}초 남음")
                 print(f"   ✓ Chrome {selected_version} 선택")
 
+            # uc_agent 실행 구간 span (자식 프로세스 span의 부모)
+            agent_span = span("runner.agent", version=selected_version, zygote=zygote)
+            trace_env = child_env()
+
             # uc_agent.py 실행 명령어 구성 (차단되지 않은 버전으로 실행)
             # ⚠️ WireGuard 키 풀 사용 시:
             #    1. sudo -u wgN으로 직접 실행 (프로세스 격리)
@@ -868,14 +1173,19 @@ def run_worker(worker_id: int, iterations: int, stats: WorkerStats, adjust_mode:
                 wg_home = f"/home/{wg_user}"
                 vpn_interface = vpn_conn.interface_name if vpn_conn.interface_name else f"wg{user_id}"
                 agent_path = str(SCRIPT_DIR / "uc_agent.py")  # 절대 경로 사용 (Permission denied 방지)
+                user_env = {
+                    "HOME": wg_home,
+                    "DISPLAY": display,
+                    "XDG_CACHE_HOME": f"{current_user_home}/.cache",
+                    "XDG_DATA_HOME": f"{current_user_home}/.local/share",
+                }
+                agent_env = dict(user_env, VPN_INTERFACE=vpn_interface, **trace_env)  # VPN 인터페이스 정보 전달
+                zygote_user = wg_user
+                zygote_prefix = ["sudo", "-u", wg_user, "env"] + [f"{k}={v}" for k, v in user_env.items()]
                 cmd = [
                     "sudo", "-u", wg_user,
                     "env",
-                    f"HOME={wg_home}",
-                    f"DISPLAY={display}",
-                    f"XDG_CACHE_HOME={current_user_home}/.cache",
-                    f"XDG_DATA_HOME={current_user_home}/.local/share",
-                    f"VPN_INTERFACE={vpn_interface}",  # VPN 인터페이스 정보 전달
+                    *[f"{k}={v}" for k, v in agent_env.items()],
                     "python3", agent_path,  # 절대 경로 사용
                     "--work-api",
                     "--screenshot-id", str(screenshot_id),
@@ -886,6 +1196,9 @@ def run_worker(worker_id: int, iterations: int, stats: WorkerStats, adjust_mode:
             else:
                 # Local: python3 /absolute/path/uc_agent.py ...
                 agent_path = str(SCRIPT_DIR / "uc_agent.py")  # 절대 경로 사용 (일관성 유지)
+                agent_env = dict(trace_env)
+                zygote_user = f"local{os.getuid()}"
+                zygote_prefix = None
                 cmd = [
                     "python3", agent_path,  # 절대 경로 사용
                     "--work-api",
@@ -922,22 +1235,62 @@ def run_worker(worker_id: int, iterations: int, stats: WorkerStats, adjust_mode:
                 cmd.append("--fingerprint-preset")
                 cmd.append(fingerprint_preset)
 
+            # 템플릿 프로필 모드
+            if profile_template:
+                cmd.append("--profile-template")
+
+            # 단계별 리소스 차단 정책 (기본 비활성)
+            if network_phase_policy:
+                cmd.append("--network-phase-policy")
+
+            # 작업 프로파일 (스크린샷 옆에 *.profile.* 기록)
+            if profile_mode:
+                cmd.extend(["--profile", profile_mode])
+
+            # WebDriver 명령 집계 (기본 비활성)
+            if driver_accounting:
+                cmd.append("--driver-accounting")
+
             # uc_agent.py 실행 (출력 캡처, timeout 600초 = 10분)
+            # --zygote: 모듈을 미리 import한 zygote에서 fork 실행 (연결 실패 시 일반 실행)
+            WORKERS.inc(state="running")
             try:
-                result = subprocess.run(
-                    cmd,
-                    cwd=SCRIPT_DIR,
-                    capture_output=True,  # 출력 캡처 (차단 감지용)
-                    text=True,
-                    timeout=600  # 10분 timeout
-                )
+                result = None
+                socket_path = ensure_zygote(zygote_user, zygote_prefix) if zygote else None
+                if socket_path:
+                    try:
+                        result = run_in_zygote(
+                            socket_path,
+                            cmd[cmd.index(agent_path) + 1:],  # uc_agent.py 인자만
+                            env=agent_env,
+                            cwd=SCRIPT_DIR,
+                            timeout=600
+                        )
+                    except ZygoteUnavailable as e:
+                        print(f"[Worker-{worker_id}] ⚠️  zygote 실행 실패: {e} - 일반 실행으로 진행")
+
+                if result is None:
+                    result = subprocess.run(
+                        cmd,
+                        cwd=SCRIPT_DIR,
+                        env={**os.environ, **agent_env},  # Local 실행 시 추적 ID 전달 (sudo는 cmd의 env 사용)
+                        capture_output=True,  # 출력 캡처 (차단 감지용)
+                        text=True,
+                        timeout=600  # 10분 timeout
+                    )
 
                 elapsed = time.time() - start_time
                 success = (result.returncode == 0)
+                agent_span.end("ok" if success else "fail")
 
             except subprocess.TimeoutExpired as e:
                 elapsed = time.time() - start_time
                 success = False
+                agent_span.end("error", "timeout")
+                job_span.set(outcome=OUTCOME_TIMEOUT)
+                JOBS_TOTAL.inc(outcome=OUTCOME_TIMEOUT, chrome_version=selected_version)
+                JOB_DURATION.observe(elapsed, outcome=OUTCOME_TIMEOUT)
+                BLOCKS_TOTAL.inc(vpn_server=vpn_server or selected_vpn, chrome_version=selected_version, reason="timeout")
 
                 print(f"\n[Worker-{worker_id}] ⏰ Timeout 발생! (10분 초과)")
                 print(f"   🔪 Chrome 프로세스 강제 정리 중...")
@@ -958,13 +1311,28 @@ def run_worker(worker_id: int, iterations: int, stats: WorkerStats, adjust_mode:
                 if blocked_manager:
                     blocked_manager.mark_blocked(selected_vpn, selected_version, reason="timeout")
                     print(f"   ⚠️  차단 목록 추가: {selected_vpn or 'Local'} + Chrome {selected_version} (10분)")
+                if combo_selector:
+                    combo_selector.record(vpn_server, selected_version, success=False)
 
                 # 다음 반복으로 진행 (작업 실패 처리)
                 stats.add_result(False)  # Timeout도 실패로 기록
-                if screenshot_id:
-                    log_result(worker_id, screenshot_id, selected_vpn, chrome_version, False, elapsed, api_client)
+                log_result(
+                    worker_id=worker_id,
+                    vpn=selected_vpn,
+                    chrome_version=selected_version,
+                    success=False,
+                    error_msg="timeout",
+                    screenshot_id=screenshot_id,
+                    keyword=keyword,
+                    vpn_server=vpn_server,
+                    elapsed=elapsed,
+                    outcome=OUTCOME_TIMEOUT
+                )
                 continue
 
+            finally:
+                WORKERS.dec(state="running")
+
             # 출력 표시
             if result.stdout:
                 print(result.stdout, end='')
@@ -981,9 +1349,10 @@ def run_worker(worker_id: int, iterations: int, stats: WorkerStats, adjust_mode:
                     i -= 1  # 다음 루프에서 i += 1 되므로 상쇄
                 continue
 
-            # 출력에서 Chrome 버전 및 작업 ID 파싱
+            # 출력에서 Chrome 버전, 작업 ID, 발견 순위 파싱
             chrome_version = None
             screenshot_id = None
+            found_rank = None
             for line in result.stdout.split('\n'):
                 if 'Chrome Version:' in line:
                     # "Chrome Version: 144" -> "144" 추출
@@ -1000,6 +1369,13 @@ def run_worker(worker_id: int, iterations: int, stats: WorkerStats, adjust_mode:
                         except:
                             pass
 
+                # 발견 순위 파싱: "발견 위치: 페이지 1 (전체 7등)"
+                if '발견 위치:' in line and '(전체 ' in line:
+                    try:
+                        found_rank = int(line.split('(전체 ')[1].split('등')[0])
+                    except (IndexError, ValueError):
+                        pass
+
             # 차단 감지 및 처리
             if blocked_manager and selected_vpn is not None and chrome_version:
                 # 차단 키워드 검색 (full_output은 이미 Line 396에서 선언됨)
@@ -1014,33 +1390,50 @@ def run_worker(worker_id: int, iterations: int, stats: WorkerStats, adjust_mode:
                 if is_blocked_error:
                     # 차단 발생: 차단 목록에 추가
                     blocked_manager.mark_blocked(selected_vpn, chrome_version, reason="http2/rate limit error")
+                    BLOCKS_TOTAL.inc(vpn_server=vpn_server or selected_vpn, chrome_version=chrome_version, reason="http2/rate limit")
                 elif success:
                     # 성공: 차단 목록에서 제거 (이전에 차단되었다면)
                     blocked_manager.mark_success(selected_vpn, chrome_version)
 
+                # 선택기 학습 (차단이 아닌 실패는 서버/버전과 무관하므로 제외)
+                if combo_selector and (is_blocked_error or success):
+                    combo_selector.record(vpn_server, chrome_version, success=not is_blocked_error)
+
             # 통계 업데이트
             stats.add_result(success)
 
-            # 로그 기록 (일자별 TXT 파일)
+            # 로그 기록 (일자별 TXT 파일 + 실행 이력 DB)
             error_msg = None
+            outcome = OUTCOME_SUCCESS if success else OUTCOME_FAILED
             if not success:
                 # 실패 시 에러 메시지 추출
                 if 'http2_protocol_error' in full_output or 'ERR_HTTP2_PROTOCOL_ERROR' in full_output:
                     error_msg = "http2_protocol_error"
+                    outcome = OUTCOME_BLOCKED
                 elif '차단' in full_output or 'blocked' in full_output:
                     error_msg = "blocked/rate limit"
+                    outcome = OUTCOME_BLOCKED
                 elif '작업 할당 실패' in full_output:
                     error_msg = "no work assigned"
                 else:
                     error_msg = f"exit code {result.returncode}"
 
+            job_span.set(outcome=outcome)
+            JOBS_TOTAL.inc(outcome=outcome, chrome_version=chrome_version or selected_version)
+            JOB_DURATION.observe(elapsed, outcome=outcome)
+
             log_result(
                 worker_id=worker_id,
                 vpn=selected_vpn,
                 chrome_version=chrome_version if chrome_version else "unknown",
                 success=success,
                 error_msg=error_msg,
-                screenshot_id=screenshot_id
+                screenshot_id=screenshot_id,
+                keyword=keyword,
+                vpn_server=vpn_server,
+                rank=found_rank,
+                elapsed=elapsed,
+                outcome=outcome
             )
 
             if success:
@@ -1051,6 +1444,7 @@ def run_worker(worker_id: int, iterations: int, stats: WorkerStats, adjust_mode:
         except Exception as e:
             print(f"\n[Worker-{worker_id}] ❌ 오류 발생: {e}")
             stats.add_result(False)
+            job_span.end("error", str(e))
 
             # 예외 발생 시에도 로그 기록
             log_result(
@@ -1058,7 +1452,8 @@ def run_worker(worker_id: int, iterations: int, stats: WorkerStats, adjust_mode:
                 vpn=selected_vpn if 'selected_vpn' in locals() else None,
                 chrome_version="unknown",
                 success=False,
-                error_msg=f"Exception: {str(e)}"
+                error_msg=f"Exception: {str(e)}",
+                keyword=keyword if 'keyword' in locals() else None
             )
 
         finally:
@@ -1075,6 +1470,11 @@ def run_worker(worker_id: int, iterations: int, stats: WorkerStats, adjust_mode:
             if vpn_allocation_manager and 'selected_vpn' in locals() and selected_vpn:
                 vpn_allocation_manager.release(selected_vpn)
 
+            # 작업 단위 추적 종료 (VPN 해제 시간 포함)
+            job_span.end()
+            set_job_id(None)
+
+    WORKERS.dec(state="active")
     print(f"\n[Worker-{worker_id}] 모든 작업 완료")
 
 
@@ -1117,6 +1517,11 @@ def main():
   - 차단된 조합은 10분간 재시도하지 않음
   - 10분 후 재시도해서 성공하면 차단 목록에서 자동 제거
   - 차단 목록: blocked_combinations.json
+
+조합 선택 (--selector bandit, 기본):
+  - VPN 서버 × Chrome 버전 × 시간대별 성공/차단을 학습해서 차단이 적은 조합을 우선 선택
+  - 관측은 반감기(Config.SELECTOR_HALF_LIFE_HOURS)로 감쇠, 차단 목록에 걸린 조합은 선택 후보에서 제외
+  - 상태 파일: combo_selector.json (조회: python3 common/combo_selector.py show)
         """
     )
 
@@ -1182,6 +1587,66 @@ def main():
         help="로컬 모드 (VPN 사용 안 함)"
     )
 
+    parser.add_argument(
+        "--profile-template",
+        action="store_true",
+        default=False,
+        help="버전별 골든 프로필을 작업마다 복제해서 사용 (종료 시 정리 비용 O(1))"
+    )
+
+    parser.add_argument(
+        "--optimize-screenshots",
+        nargs="?",
+        const="lossless",
+        choices=["lossless", "palette"],
+        default=None,
+        help="보관 스크린샷 PNG를 백그라운드 프로세스 풀로 주기적 재압축 (기본 모드: lossless)"
+    )
+
+    parser.add_argument(
+        "--zygote",
+        action="store_true",
+        default=False,
+        help="wg 사용자별 사전 포크 zygote에서 uc_agent 실행 (모듈 import 생략으로 작업 시작 시간 단축)"
+    )
+
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="cprofile",
+        choices=["cprofile", "sample"],
+        default=None,
+        help="uc_agent 작업별 프로파일 기록 (cprofile: pstats / sample: collapsed stack, 병합: python3 common/profiling.py merge screenshots/)"
+    )
+
+    parser.add_argument(
+        "--network-phase-policy",
+        action="store_true",
+        default=False,
+        help="uc_agent에 검색 결과 탐색 중 트래커/미디어 차단 정책 적용 (기본: 비활성)"
+    )
+
+    parser.add_argument(
+        "--driver-accounting",
+        action="store_true",
+        default=False,
+        help="uc_agent WebDriver 명령 호출 위치별 집계 + N+1 감지 (조회: python3 uc_lib/core/driver_accounting.py)"
+    )
+
+    parser.add_argument(
+        "--selector",
+        choices=["random", "bandit"],
+        default=Config.COMBO_SELECTOR,
+        help=f"VPN 서버/Chrome 버전 선택 방식 (bandit: 서버×버전×시간대별 성공/차단 학습, random: 무작위, 기본: {Config.COMBO_SELECTOR})"
+    )
+
+    parser.add_argument(
+        "--metrics-port",
+        type=int,
+        default=Config.METRICS_PORT,
+        help=f"메트릭 엔드포인트 포트 (http://127.0.0.1:PORT/metrics, 0이면 비활성, 기본: {Config.METRICS_PORT})"
+    )
+
     args = parser.parse_args()
 
     # 입력 검증
@@ -1211,6 +1676,7 @@ def main():
         adjust_mode = "adjust2"
 
     # VPN 모드 결정 (VPN 키 풀 또는 Local)
+    vpn_servers = []
     if args.local:
         # --local 옵션: 강제 로컬 모드
         print("🏠 로컬 모드 (VPN 사용 안 함)")
@@ -1224,6 +1690,7 @@ def main():
             if servers and len(servers) > 0:
                 # VPN 키 풀 사용 (True로 설정하면 워커가 동적 할당 사용)
                 vpn_list = True
+                vpn_servers = list(servers)
                 print(f"   ✓ VPN 키 풀 사용 가능 (서버 {len(servers)}개)")
                 print(f"   ✓ VPN 키 동적 할당 모드 활성화")
             else:
@@ -1242,6 +1709,15 @@ def main():
     reaper_thread.start()
     print("⚰️  좀비 프로세스 회수 스레드 시작")
 
+    # 스크린샷 재압축 스레드 (캡처 경로와 분리, 5분 간격)
+    if args.optimize_screenshots:
+        from common.utils.png_optimizer import start_background_optimizer
+        start_background_optimizer(SCRIPT_DIR / "screenshots", mode=args.optimize_screenshots)
+        print(f"🗜️  스크린샷 재압축 스레드 시작 (모드: {args.optimize_screenshots})")
+
+    # Chrome 레지스트리 색인 + chromedriver 버전 확인 + 바이너리 페이지 캐시 예열 (백그라운드)
+    get_registry().prewarm_async()
+
     # 시작 정보 출력
     print("\n" + "=" * 60)
     print("🚀 멀티 워커 실행")
@@ -1280,12 +1756,32 @@ def main():
     blocked_manager = BlockedCombinationsManager()
     print(f"📋 차단 목록 관리 활성화 (쿨다운: {blocked_manager.cooldown_minutes}분)")
 
+    # 메트릭 엔드포인트 (처리량/지연 대시보드용)
+    if args.metrics_port:
+        try:
+            start_metrics_server(args.metrics_port, blocked_manager)
+            print(f"📈 메트릭 엔드포인트: http://127.0.0.1:{args.metrics_port}/metrics")
+        except OSError as e:
+            print(f"⚠️  메트릭 엔드포인트 시작 실패 (포트 {args.metrics_port}): {e}")
+
     # 기존 차단 목록 통계
     block_stats = blocked_manager.get_stats()
     if block_stats['active']:
         print(f"   현재 차단 중인 조합: {len(block_stats['active'])}개")
         for key, remaining in block_stats['active'][:5]:  # 최대 5개만 표시
             print(f"      - {key}: {remaining // 60}분 {remaining % 60}초 남음")
+
+    # VPN 서버 × Chrome 버전 선택기 (상태 파일이 없으면 실행 이력 DB로 초기 학습)
+    combo_selector = None
+    if args.selector == "bandit":
+        combo_selector = ComboSelector(SCRIPT_DIR / "combo_selector.json", servers=vpn_servers)
+        if combo_selector.is_empty():
+            store = get_store()
+            if store:
+                seeded = combo_selector.seed_from_history(store, parse_since(Config.SELECTOR_SEED_SINCE))
+                if seeded:
+                    print(f"🎰 조합 선택기: 실행 이력 {seeded}건으로 초기 학습")
+        print(f"🎰 조합 선택기 활성화 (Thompson sampling, 반감기 {Config.SELECTOR_HALF_LIFE_HOURS:g}시간)")
     print()
 
     # 스레드 생성 및 시작
@@ -1302,7 +1798,7 @@ def main():
 
         thread = threading.Thread(
             target=run_worker,
-            args=(worker_id, args.iterations, stats, adjust_mode, vpn_list, window_config, blocked_manager, vpn_allocation_manager, args.enable_fingerprint_spoof, args.fingerprint_preset),
+            args=(worker_id, args.iterations, stats, adjust_mode, vpn_list, window_config, blocked_manager, vpn_allocation_manager, args.enable_fingerprint_spoof, args.fingerprint_preset, args.profile_template, args.zygote, args.profile, combo_selector, args.network_phase_policy, args.driver_accounting),
             name=f"Worker-{worker_id}"
         )
         threads.append(thread)
@@ -1317,6 +1813,11 @@ def main():
     for thread in threads:
         thread.join()
 
+    # 차단 목록 / 선택기 대기 중인 변경 기록
+    blocked_manager.flush()
+    if combo_selector:
+        combo_selector.flush()
+
     # 최종 통계 출력
     elapsed = time.time() - start_time
     final_stats = stats.get_stats()
@@ -0,0 +1,501 @@
+#!/usr/bin/env python3
+"""
+uc_agent 사전 포크(zygote) 서버
+wg 사용자별로 1개 상주하면서 selenium / undetected_chromedriver / uc_lib 모듈을 미리 import해 두고
+작업마다 fork()한 깨끗한 자식 프로세스에서 uc_agent.main()을 실행
+
+- 권한 모델은 그대로: zygote 자체가 sudo -u wgNNN으로 실행되므로 자식도 wgNNN 권한
+- 통신: Unix 소켓 (JSON 한 줄 요청 + stdout/stderr 파이프 fd 전달)
+  요청: {"argv": [...], "env": {...}, "cwd": "..."}  + SCM_RIGHTS [stdout_w, stderr_w]
+  응답: {"pid": N} → {"returncode": N}
+- 접속 제한: SO_PEERCRED로 자기 자신 / root / sudo 호출자(SUDO_UID) uid만 허용
+- 구조: zygote(단일 스레드) → 감시 프로세스(연결당 1개) → 작업 프로세스(setsid)
+  클라이언트가 연결을 끊으면(timeout) 감시 프로세스가 작업 프로세스 그룹 전체를 종료
+- zygote가 없거나 응답이 없으면 호출자는 기존 subprocess 실행으로 fallback
+
+사용법:
+    sudo -u wg101 env HOME=/home/wg101 DISPLAY=:0 python3 uc_zygote.py --socket /tmp/uc_zygote_wg101.sock
+    python3 uc_zygote.py --ping --socket /tmp/uc_zygote_wg101.sock
+"""
+
+import os
+import sys
+import json
+import time
+import errno
+import select
+import signal
+import socket
+import struct
+import argparse
+import threading
+import traceback
+import subprocess
+from pathlib import Path
+from typing import Optional, Dict, List
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+AGENT_PATH = SCRIPT_DIR / "uc_agent.py"
+
+SOCKET_DIR = Path("/tmp")
+MAX_MESSAGE_SIZE = 64 * 1024
+CONNECT_TIMEOUT = 5.0
+START_TIMEOUT = 60.0          # 모듈 import 포함 zygote 기동 대기
+OUTPUT_DRAIN_TIMEOUT = 5.0    # 종료 후 파이프를 쥐고 있는 손자 프로세스 대기 한도
+
+
+class ZygoteUnavailable(ConnectionError):
+    """zygote에 연결할 수 없음 (호출자가 subprocess 실행으로 fallback)"""
+
+
+def zygote_socket_path(user: str) -> Path:
+    """사용자별 zygote 소켓 경로"""
+    return SOCKET_DIR / f"uc_zygote_{user}.sock"
+
+
+# ============================================================
+# 서버 (zygote)
+# ============================================================
+def _preload():
+    """무거운 모듈 사전 import (fork 후 자식은 import 비용 없이 바로 실행)"""
+    sys.path.insert(0, str(SCRIPT_DIR))
+    import uc_agent  # noqa: F401 - selenium, undetected_chromedriver, uc_lib, common 전체 로드
+    from common.chrome_registry import get_registry
+    get_registry().refresh()
+    return uc_agent
+
+
+def _peer_uid(conn: socket.socket) -> int:
+    """접속한 프로세스 uid (SO_PEERCRED)"""
+    creds = conn.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i"))
+    _, uid, _ = struct.unpack("3i", creds)
+    return uid
+
+
+def _recv_request(conn: socket.socket):
+    """요청 JSON + 전달된 fd 수신"""
+    data, fds, _, _ = socket.recv_fds(conn, MAX_MESSAGE_SIZE, 2)
+    while data and not data.endswith(b"\n"):
+        chunk = conn.recv(MAX_MESSAGE_SIZE)
+        if not chunk:
+            break
+        data += chunk
+    return json.loads(data.decode("utf-8")), fds
+
+
+def _send_message(conn: socket.socket, message: dict):
+    """응답 JSON 한 줄 전송 (클라이언트가 이미 끊었으면 무시)"""
+    try:
+        conn.sendall(json.dumps(message).encode("utf-8") + b"\n")
+    except OSError:
+        pass
+
+
+def _run_job(uc_agent, request: dict, fds: List[int]):
+    """
+    작업 프로세스 본체 (fork된 자식에서 실행, 반환하지 않음)
+
+    Args:
+        uc_agent: 미리 import된 uc_agent 모듈
+        request: {"argv", "env", "cwd"}
+        fds: [stdout, stderr] 파이프 fd
+    """
+    code = 1
+    try:
+        os.setsid()
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+
+        devnull = os.open(os.devnull, os.O_RDONLY)
+        os.dup2(devnull, 0)
+        os.close(devnull)
+        os.dup2(fds[0], 1)
+        os.dup2(fds[1], 2)
+        for fd in fds:
+            os.close(fd)
+
+        os.environ.update(request.get("env") or {})
+        os.chdir(request.get("cwd") or str(SCRIPT_DIR))
+        sys.argv = [str(AGENT_PATH)] + list(request.get("argv") or [])
+
+        uc_agent.main()
+        code = 0
+    except SystemExit as e:
+        if e.code is None:
+            code = 0
+        elif isinstance(e.code, int):
+            code = e.code
+        else:
+            print(e.code, file=sys.stderr)
+            code = 1
+    except BaseException:
+        traceback.print_exc()
+        code = 1
+    finally:
+        try:
+            # os._exit는 atexit를 건너뛰므로 버퍼링된 이벤트 로그를 직접 기록
+            from common.unified_event_logger import flush_events
+            flush_events()
+        except Exception:
+            pass
+        try:
+            sys.stdout.flush()
+            sys.stderr.flush()
+        except Exception:
+            pass
+        os._exit(code)
+
+
+def _supervise(uc_agent, conn: socket.socket):
+    """
+    감시 프로세스 본체 (연결 1개 담당, 반환하지 않음)
+
+    작업 프로세스를 fork한 뒤 종료 코드를 돌려주고,
+    그 전에 클라이언트가 연결을 끊으면 작업 프로세스 그룹을 강제 종료합니다.
+    """
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    signal.signal(signal.SIGINT, signal.SIG_DFL)
+
+    try:
+        request, fds = _recv_request(conn)
+    except (OSError, ValueError) as e:
+        _send_message(conn, {"error": f"잘못된 요청: {e}"})
+        os._exit(1)
+
+    if request.get("ping"):
+        _send_message(conn, {"pong": os.getppid()})
+        os._exit(0)
+
+    if len(fds) != 2:
+        _send_message(conn, {"error": "stdout/stderr fd 필요"})
+        os._exit(1)
+
+    pid = os.fork()
+    if pid == 0:
+        conn.close()
+        _run_job(uc_agent, request, fds)
+
+    for fd in fds:
+        os.close(fd)
+    _send_message(conn, {"pid": pid})
+
+    # pidfd가 있으면 작업 종료 즉시 깨어남 (없으면 0.5초 간격 확인)
+    try:
+        exit_fds = [os.pidfd_open(pid)]
+    except (AttributeError, OSError):
+        exit_fds = []
+
+    status = None
+    client_gone = False
+    while status is None:
+        readable, _, _ = select.select(([] if client_gone else [conn]) + exit_fds, [], [], 0.5)
+        if conn in readable:
+            try:
+                client_gone = not conn.recv(1)
+            except OSError:
+                client_gone = True
+            if client_gone:
+                # 클라이언트 timeout/종료 → 작업 프로세스 그룹(Chrome 포함) 정리
+                try:
+                    os.killpg(pid, signal.SIGKILL)
+                except OSError:
+                    pass
+        waited, wait_status = os.waitpid(pid, os.WNOHANG)
+        if waited == pid:
+            status = wait_status
+
+    _send_message(conn, {"returncode": os.waitstatus_to_exitcode(status)})
+    os._exit(0)
+
+
+def _allowed_uids(extra: Optional[List[int]] = None) -> set:
+    """접속 허용 uid (자기 자신, root, sudo 호출자, 추가 지정)"""
+    uids = {os.getuid(), 0}
+    sudo_uid = os.environ.get("SUDO_UID")
+    if sudo_uid and sudo_uid.isdigit():
+        uids.add(int(sudo_uid))
+    uids.update(extra or [])
+    return uids
+
+
+def serve(socket_path: Path, allow_uids: Optional[List[int]] = None, watch_stdin: bool = False):
+    """
+    zygote 서버 실행
+
+    Args:
+        socket_path: Unix 소켓 경로
+        allow_uids: 추가로 접속을 허용할 uid
+        watch_stdin: stdin이 닫히면 종료 (러너 종료 시 함께 정리)
+    """
+    started = time.time()
+    uc_agent = _preload()
+    allowed = _allowed_uids(allow_uids)
+
+    socket_path = Path(socket_path)
+    try:
+        socket_path.unlink()
+    except FileNotFoundError:
+        pass
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(str(socket_path))
+    os.chmod(socket_path, 0o666)  # 접속 제한은 SO_PEERCRED로 처리
+    server.listen(32)
+
+    running = True
+
+    def _stop(signum, frame):
+        nonlocal running
+        running = False
+
+    signal.signal(signal.SIGTERM, _stop)
+    signal.signal(signal.SIGINT, _stop)
+
+    print(f"🧬 zygote 준비 완료: {socket_path} (pid={os.getpid()}, 모듈 로드 {time.time() - started:.1f}초)")
+    sys.stdout.flush()
+
+    watched = [server]
+    if watch_stdin:
+        watched.append(sys.stdin)
+
+    try:
+        while running:
+            try:
+                readable, _, _ = select.select(watched, [], [], 1.0)
+            except InterruptedError:
+                continue
+
+            # 종료된 감시 프로세스 회수
+            try:
+                while os.waitpid(-1, os.WNOHANG)[0] > 0:
+                    pass
+            except ChildProcessError:
+                pass
+
+            if sys.stdin in readable and not sys.stdin.buffer.read1(4096):
+                print("🧬 러너 종료 감지 - zygote 종료")
+                break
+
+            if server not in readable:
+                continue
+
+            try:
+                conn, _ = server.accept()
+            except OSError as e:
+                if e.errno in (errno.EINTR, errno.EAGAIN):
+                    continue
+                raise
+
+            if _peer_uid(conn) not in allowed:
+                conn.close()
+                continue
+
+            sys.stdout.flush()
+            sys.stderr.flush()
+            if os.fork() == 0:
+                server.close()
+                _supervise(uc_agent, conn)
+            conn.close()
+    finally:
+        server.close()
+        try:
+            socket_path.unlink()
+        except OSError:
+            pass
+
+
+# ============================================================
+# 클라이언트 (uc_run_workers)
+# ============================================================
+def _connect(socket_path: Path) -> socket.socket:
+    """zygote 연결 (실패 시 ZygoteUnavailable)"""
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(CONNECT_TIMEOUT)
+    try:
+        sock.connect(str(socket_path))
+    except OSError as e:
+        sock.close()
+        raise ZygoteUnavailable(f"{socket_path}: {e}")
+    return sock
+
+
+def _read_message(sock_file) -> dict:
+    """응답 JSON 한 줄 읽기 (연결이 끊겼으면 ZygoteUnavailable)"""
+    line = sock_file.readline()
+    if not line:
+        raise ZygoteUnavailable("zygote 연결 끊김")
+    return json.loads(line.decode("utf-8"))
+
+
+def ping(socket_path: Path) -> bool:
+    """zygote 응답 여부"""
+    try:
+        sock = _connect(socket_path)
+    except ZygoteUnavailable:
+        return False
+    try:
+        sock.sendall(json.dumps({"ping": True}).encode("utf-8") + b"\n")
+        return "pong" in _read_message(sock.makefile("rb"))
+    except (OSError, ValueError):
+        return False
+    finally:
+        sock.close()
+
+
+def start_zygote(socket_path: Path, launch_prefix: Optional[List[str]] = None,
+                 timeout: float = START_TIMEOUT) -> Optional[subprocess.Popen]:
+    """
+    zygote 프로세스 기동 후 응답할 때까지 대기
+
+    Args:
+        socket_path: Unix 소켓 경로
+        launch_prefix: 실행 접두 명령 (예: ["sudo", "-u", "wg101", "env", "HOME=..."])
+        timeout: 기동 대기 시간(초)
+
+    Returns:
+        Popen 객체 (이미 실행 중이면 None, 기동 실패 시 ZygoteUnavailable)
+    """
+    if ping(socket_path):
+        return None
+
+    cmd = list(launch_prefix or []) + [
+        "python3", str(SCRIPT_DIR / "uc_zygote.py"),
+        "--socket", str(socket_path),
+        "--watch-stdin",
+    ]
+    # stdin 파이프는 러너가 종료될 때 닫히면서 zygote 종료 신호가 됨
+    process = subprocess.Popen(cmd, cwd=SCRIPT_DIR, stdin=subprocess.PIPE)
+
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if process.poll() is not None:
+            raise ZygoteUnavailable(f"zygote 기동 실패 (exit={process.returncode})")
+        if ping(socket_path):
+            return process
+        time.sleep(0.2)
+
+    process.kill()
+    raise ZygoteUnavailable(f"zygote 기동 timeout ({timeout:.0f}초)")
+
+
+def _drain(fd: int, chunks: List[bytes]):
+    """파이프 끝까지 읽기 (읽기 스레드)"""
+    with os.fdopen(fd, "rb", buffering=0) as f:
+        while True:
+            chunk = f.read(65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+
+
+def run_in_zygote(socket_path: Path, argv: List[str], env: Optional[Dict[str, str]] = None,
+                  cwd: Optional[str] = None, timeout: Optional[float] = None) -> subprocess.CompletedProcess:
+    """
+    zygote에서 uc_agent 실행 (subprocess.run(capture_output=True, text=True)과 같은 결과 형식)
+
+    Args:
+        socket_path: Unix 소켓 경로
+        argv: uc_agent.py 인자 (스크립트 경로 제외)
+        env: 작업 프로세스에 추가할 환경 변수
+        cwd: 작업 디렉토리
+        timeout: 실행 제한 시간(초)
+
+    Returns:
+        subprocess.CompletedProcess (stdout/stderr는 str)
+        작업 시작({"pid": N} 수신) 후 zygote 연결이 끊기면 returncode=-1로 반환 (같은 작업 재실행 방지)
+
+    Raises:
+        ZygoteUnavailable: 연결/요청 전송/시작 응답 실패 (작업은 시작되지 않음)
+        subprocess.TimeoutExpired: 제한 시간 초과 (작업 프로세스 그룹은 zygote가 종료)
+    """
+    sock = _connect(socket_path)
+    out_r, out_w = os.pipe()
+    err_r, err_w = os.pipe()
+
+    try:
+        request = {"argv": list(argv), "env": dict(env or {}), "cwd": str(cwd or SCRIPT_DIR)}
+        socket.send_fds(sock, [json.dumps(request).encode("utf-8") + b"\n"], [out_w, err_w])
+    except OSError as e:
+        os.close(out_r)
+        os.close(err_r)
+        sock.close()
+        raise ZygoteUnavailable(f"요청 전송 실패: {e}")
+    finally:
+        # 쓰기 끝은 작업 프로세스만 보유 (종료 시 EOF)
+        os.close(out_w)
+        os.close(err_w)
+
+    stdout_chunks, stderr_chunks = [], []
+    readers = [
+        threading.Thread(target=_drain, args=(out_r, stdout_chunks), daemon=True),
+        threading.Thread(target=_drain, args=(err_r, stderr_chunks), daemon=True),
+    ]
+    for reader in readers:
+        reader.start()
+
+    def _output():
+        return (b"".join(stdout_chunks).decode("utf-8", errors="replace"),
+                b"".join(stderr_chunks).decode("utf-8", errors="replace"))
+
+    sock_file = sock.makefile("rb")
+    try:
+        # 시작 응답 전 실패는 작업이 시작되지 않은 것 → 호출자가 일반 실행으로 fallback
+        sock.settimeout(CONNECT_TIMEOUT)
+        try:
+            started = _read_message(sock_file)  # {"pid": N}
+        except (OSError, ValueError) as e:
+            raise ZygoteUnavailable(f"시작 응답 없음: {e}")
+        if "pid" not in started:
+            raise ZygoteUnavailable(started.get("error", "알 수 없는 응답"))
+
+        sock.settimeout(timeout)
+        try:
+            message = _read_message(sock_file)
+        except socket.timeout:
+            # 연결을 닫으면 감시 프로세스가 작업 프로세스 그룹을 종료
+            sock.close()
+            for reader in readers:
+                reader.join(OUTPUT_DRAIN_TIMEOUT)
+            stdout, stderr = _output()
+            raise subprocess.TimeoutExpired(argv, timeout, output=stdout, stderr=stderr)
+        except (OSError, ValueError) as e:
+            # 작업은 이미 시작됨 → 재실행하지 않도록 실패 결과로 반환
+            message = {"error": f"zygote 연결 끊김 (pid={started['pid']}): {e}"}
+
+        if "returncode" not in message:
+            sock.close()
+            for reader in readers:
+                reader.join(OUTPUT_DRAIN_TIMEOUT)
+            stdout, stderr = _output()
+            error = message.get("error", "알 수 없는 응답")
+            return subprocess.CompletedProcess(argv, -1, stdout, f"{stderr}\n{error}" if stderr else error)
+    finally:
+        sock_file.close()
+        sock.close()
+
+    for reader in readers:
+        reader.join(OUTPUT_DRAIN_TIMEOUT)
+    stdout, stderr = _output()
+    return subprocess.CompletedProcess(argv, message["returncode"], stdout, stderr)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="uc_agent 사전 포크(zygote) 서버")
+    parser.add_argument("--socket", type=str, default=None,
+                        help="Unix 소켓 경로 (기본: /tmp/uc_zygote_<사용자>.sock)")
+    parser.add_argument("--allow-uid", type=int, action="append", default=[],
+                        help="추가로 접속을 허용할 uid (여러 번 지정 가능)")
+    parser.add_argument("--watch-stdin", action="store_true",
+                        help="stdin이 닫히면 종료 (러너가 실행할 때 사용)")
+    parser.add_argument("--ping", action="store_true", help="실행 중인 zygote 응답 확인")
+    args = parser.parse_args()
+
+    import getpass
+    path = Path(args.socket) if args.socket else zygote_socket_path(getpass.getuser())
+
+    if args.ping:
+        alive = ping(path)
+        print(f"{'✅' if alive else '❌'} {path}")
+        sys.exit(0 if alive else 1)
+
+    serve(path, allow_uids=args.allow_uid, watch_stdin=args.watch_stdin)